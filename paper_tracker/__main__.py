@@ -1,15 +1,154 @@
 """CLI entry point for Paper Tracker."""
 
 import argparse
-import shutil
+import os
 import sys
-from datetime import datetime
 from pathlib import Path
+from typing import List, Optional
 
-from .tracker import PaperTracker
 
+def _default_config_path() -> Optional[str]:
+    """Return the packaged config.yaml path, or None if it is missing."""
+    default_config = Path(__file__).parent / "config.yaml"
+    if default_config.exists():
+        return str(default_config)
+    return None
 
-def main():
+
+def _get_tracker(args, config_path: Optional[str], ru_queue_path: Optional[str]):
+    """Import and construct the tracker only for commands that need it."""
+    from .tracker import PaperTracker
+
+    return PaperTracker(token=args.token, config_path=config_path, ru_queue_path=ru_queue_path)
+
+
+# Valid values for --ru-status
+_RU_STATUSES = frozenset({"pending", "processing", "completed", "skipped"})
+
+# Linux FICLONE ioctl: copy-on-write clone of a whole file (btrfs, xfs, ...)
+_FICLONE = 0x40049409
+
+
+def _archive_copy(src: str, dst: str):
+    """Copy src to dst, as a copy-on-write reflink when the filesystem allows.
+
+    Hardlinks are not used: exports reopen their output with "w", which
+    would truncate the shared inode and rewrite the archive too.
+
+    Raises FileNotFoundError if src does not exist.
+    """
+    import shutil
+
+    try:
+        import fcntl
+
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+        shutil.copystat(src, dst)
+        return
+    except (ImportError, OSError):
+        pass  # No reflink support (other OS/filesystem), fall back to a copy
+
+    shutil.copy2(src, dst)
+
+
+def _run_ru_command(args, ru_queue_path: Optional[str]) -> int:
+    """Handle RU queue commands that only read or edit the queue file."""
+    from .ru_queue import RUQueueManager
+
+    ru_queue = RUQueueManager(ru_queue_path or "data/ru_queue.yaml")
+
+    if args.list_ru or args.list_ru_pending:
+        status_filter = "pending" if args.list_ru_pending else None
+        ru_queue.print_queue(status_filter)
+        return 0
+
+    if args.remove_ru:
+        if not args.history:
+            print("Error: --remove-ru requires --history to be set")
+            return 1
+        if ru_queue.remove_candidate(args.remove_ru):
+            print(f"Removed {args.remove_ru} from RU queue")
+        else:
+            print(f"{args.remove_ru} not in RU queue")
+        ru_queue.save()
+        return 0
+
+    repo, status = args.ru_status
+    if status not in _RU_STATUSES:
+        print(f"Error: Invalid status '{status}'. Use: pending|processing|completed|skipped")
+        return 1
+    ru_queue.update_status(repo, status)
+    ru_queue.save()
+    print(f"Updated {repo} status to {status}")
+    return 0
+
+
+# RU queue flags; their arguments are only registered when one is present
+_RU_FLAGS = ("--ru-queue", "--list-ru", "--list-ru-pending", "--add-ru", "--remove-ru", "--ru-status")
+
+# Defaults for RU queue arguments when they are not registered
+_RU_DEFAULTS = {
+    "ru_queue": None,
+    "list_ru": False,
+    "list_ru_pending": False,
+    "add_ru": None,
+    "remove_ru": None,
+    "ru_status": None,
+}
+
+
+def _needs_ru_args(argv: List[str]) -> bool:
+    """Check if argv uses RU queue flags (or asks for help, which lists them)."""
+    for arg in argv:
+        if arg == "--":
+            break
+        if arg in ("-h", "--help"):
+            return True
+        opt = arg.split("=", 1)[0]
+        # argparse accepts unambiguous prefixes, e.g. --list-ru-p
+        if len(opt) > 2 and opt.startswith("--") and any(f.startswith(opt) for f in _RU_FLAGS):
+            return True
+    return False
+
+
+def _add_ru_args(parser: argparse.ArgumentParser):
+    """Register RU queue arguments on the parser."""
+    group = parser.add_argument_group("RU queue")
+    group.add_argument(
+        "--ru-queue",
+        help="Path to ru_queue.yaml file (default: data/ru_queue.yaml)"
+    )
+    group.add_argument(
+        "--list-ru",
+        action="store_true",
+        help="List all RU candidates"
+    )
+    group.add_argument(
+        "--list-ru-pending",
+        action="store_true",
+        help="List pending RU candidates only"
+    )
+    group.add_argument(
+        "--add-ru",
+        metavar="REPO",
+        help="Manually add a repo to RU queue (format: owner/repo)"
+    )
+    group.add_argument(
+        "--remove-ru",
+        metavar="REPO",
+        help="Remove a repo from RU queue (format: owner/repo)"
+    )
+    group.add_argument(
+        "--ru-status",
+        nargs=2,
+        metavar=("REPO", "STATUS"),
+        help="Update RU candidate status (STATUS: pending|processing|completed|skipped)"
+    )
+
+
+def _make_core_parser() -> argparse.ArgumentParser:
+    """Build the parser for search, export, archive and awesome list options."""
     parser = argparse.ArgumentParser(
         description="Stateful tracker for reproducible low-level vision repos",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -89,38 +228,6 @@ Environment variables:
         help="Path to repos_from_issues.yaml file (repos added via GitHub Issues)"
     )
 
-    # RU Queue arguments
-    parser.add_argument(
-        "--ru-queue",
-        help="Path to ru_queue.yaml file (default: data/ru_queue.yaml)"
-    )
-    parser.add_argument(
-        "--list-ru",
-        action="store_true",
-        help="List all RU candidates"
-    )
-    parser.add_argument(
-        "--list-ru-pending",
-        action="store_true",
-        help="List pending RU candidates only"
-    )
-    parser.add_argument(
-        "--add-ru",
-        metavar="REPO",
-        help="Manually add a repo to RU queue (format: owner/repo)"
-    )
-    parser.add_argument(
-        "--remove-ru",
-        metavar="REPO",
-        help="Remove a repo from RU queue (format: owner/repo)"
-    )
-    parser.add_argument(
-        "--ru-status",
-        nargs=2,
-        metavar=("REPO", "STATUS"),
-        help="Update RU candidate status (STATUS: pending|processing|completed|skipped)"
-    )
-
     # Archive argument
     parser.add_argument(
         "--archive",
@@ -140,70 +247,38 @@ Environment variables:
         help="Show statistics for cached awesome list entries"
     )
 
-    args = parser.parse_args()
-
-    # Initialize tracker
-    config_path = args.config
-    if config_path is None:
-        # Default to config.yaml in package directory
-        default_config = Path(__file__).parent / "config.yaml"
-        if default_config.exists():
-            config_path = str(default_config)
+    parser.set_defaults(**_RU_DEFAULTS)
+    return parser
 
-    # Determine RU queue path
-    ru_queue_path = args.ru_queue
-    if not ru_queue_path and args.history:
-        ru_queue_path = str(Path(args.history).parent / "ru_queue.yaml")
 
-    tracker = PaperTracker(token=args.token, config_path=config_path, ru_queue_path=ru_queue_path)
+def main():
+    argv = sys.argv[1:]
+    parser = _make_core_parser()
+    if _needs_ru_args(argv):
+        _add_ru_args(parser)
 
-    # Print header
-    if not args.quiet:
-        print("Paper Implementation Tracker (Stateful)")
-        print(f"Rate limit: {tracker.github.rate_limit.remaining}/{tracker.github.rate_limit.limit}")
-        print()
+    args = parser.parse_args(argv)
 
-    # Load history if specified
-    if args.history:
-        tracker.load_history(args.history)
-        if not args.quiet:
-            print()
+    config_path = args.config or _default_config_path()
 
-    # Handle RU queue commands (these exit early without running search)
-    if args.list_ru or args.list_ru_pending:
-        status_filter = "pending" if args.list_ru_pending else None
-        tracker.print_ru_queue(status_filter)
-        return 0
+    # Sibling data files default to the history file's directory
+    history_dir = os.path.dirname(args.history) if args.history else None
 
-    if args.add_ru:
-        if not args.history:
-            print("Error: --add-ru requires --history to be set")
-            return 1
-        tracker.add_to_ru_queue(args.add_ru)
-        tracker.ru_queue.save()
-        return 0
-
-    if args.remove_ru:
-        if not args.history:
-            print("Error: --remove-ru requires --history to be set")
-            return 1
-        tracker.remove_from_ru_queue(args.remove_ru)
-        tracker.ru_queue.save()
-        return 0
+    # Determine RU queue path
+    ru_queue_path = args.ru_queue
+    if not ru_queue_path and history_dir is not None:
+        ru_queue_path = os.path.join(history_dir, "ru_queue.yaml")
 
-    if args.ru_status:
-        repo, status = args.ru_status
-        if status not in ("pending", "processing", "completed", "skipped"):
-            print(f"Error: Invalid status '{status}'. Use: pending|processing|completed|skipped")
-            return 1
-        tracker.ru_queue.update_status(repo, status)
-        tracker.ru_queue.save()
-        print(f"Updated {repo} status to {status}")
-        return 0
+    # Queue-only RU commands don't need the tracker (exit early)
+    if args.list_ru or args.list_ru_pending or args.remove_ru or args.ru_status:
+        return _run_ru_command(args, ru_queue_path)
 
-    # Handle awesome list commands (exit early without running search)
+    # Awesome list commands only need the config, not the tracker (exit early)
     if args.sync_awesome or args.awesome_stats:
+        from .config_loader import config
         from .awesome_manager import AwesomeListManager
+
+        config.load(config_path)
         manager = AwesomeListManager()
 
         if args.sync_awesome:
@@ -220,7 +295,7 @@ Environment variables:
             stats = manager.get_stats()
             print(f"Total entries: {stats['total_entries']}")
             print(f"Entries with code: {stats['entries_with_code']}")
-            print(f"Sources: {', '.join(stats['sources'])}")
+            print(f"Sources: {', '.join(stats['by_source'])}")
             if stats['by_conference']:
                 print(f"By conference: {stats['by_conference']}")
             if stats['by_year']:
@@ -228,13 +303,37 @@ Environment variables:
 
         return 0
 
+    tracker = _get_tracker(args, config_path, ru_queue_path)
+
+    # Print header (the rate limit line only matters when we will hit GitHub)
+    needs_github = not args.add_ru
+    if not args.quiet and needs_github:
+        print("Paper Implementation Tracker (Stateful)")
+        print(f"Rate limit: {tracker.github.rate_limit.remaining}/{tracker.github.rate_limit.limit}")
+        print()
+
+    # Load history if specified
+    if args.history:
+        tracker.load_history(args.history)
+        if not args.quiet:
+            print()
+
+    # --add-ru needs the loaded history to look up the repo
+    if args.add_ru:
+        if not args.history:
+            print("Error: --add-ru requires --history to be set")
+            return 1
+        tracker.add_to_ru_queue(args.add_ru)
+        tracker.ru_queue.save()
+        return 0
+
     # Process repos added via GitHub Issues
     # Look for issue repos file in the same directory as history, or use explicit path
     issue_repos_path = args.issue_repos
-    if not issue_repos_path and args.history:
-        default_issue_repos = Path(args.history).parent / "repos_from_issues.yaml"
-        if default_issue_repos.exists():
-            issue_repos_path = str(default_issue_repos)
+    if not issue_repos_path and history_dir is not None:
+        default_issue_repos = os.path.join(history_dir, "repos_from_issues.yaml")
+        if os.path.exists(default_issue_repos):
+            issue_repos_path = default_issue_repos
 
     if issue_repos_path:
         tracker.process_issue_repos(issue_repos_path)
@@ -266,17 +365,19 @@ Environment variables:
 
     # Create dated archive copies if requested
     if args.archive:
+        from datetime import datetime
+
         date_suffix = datetime.now().strftime("%Y%m%d")
         archived_files = []
 
-        for output_path in [args.output, args.csv, args.markdown]:
-            if output_path:
-                src = Path(output_path)
-                if src.exists():
-                    archive_name = f"tracker_{date_suffix}{src.suffix}"
-                    archive_path = src.parent / archive_name
-                    shutil.copy2(src, archive_path)
-                    archived_files.append(str(archive_path))
+        for output_path in filter(None, (args.output, args.csv, args.markdown)):
+            parent, base = os.path.split(output_path)
+            archive_path = os.path.join(parent, f"tracker_{date_suffix}{os.path.splitext(base)[1]}")
+            try:
+                _archive_copy(output_path, archive_path)
+            except FileNotFoundError:
+                continue
+            archived_files.append(archive_path)
 
         if archived_files and not args.quiet:
             print(f"\nArchived to: {', '.join(archived_files)}")
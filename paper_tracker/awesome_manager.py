@@ -4,27 +4,40 @@ Uses the parser plugin system for different markdown formats and
 indexed cache for efficient search.
 """
 
+import operator
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 try:
-    from .github_client import GitHubClient
+    from .config_loader import config
+    from .github_client import get_shared_client, UNCHANGED
     from .models import AwesomeEntry
     from .cache_manager import IndexedCache, SearchQuery
     from .source_registry import SourceRegistry, SourceConfig
     from .parsers import ParserRegistry
 except ImportError:
-    from github_client import GitHubClient
+    from config_loader import config
+    from github_client import get_shared_client, UNCHANGED
     from models import AwesomeEntry
     from cache_manager import IndexedCache, SearchQuery
     from source_registry import SourceRegistry, SourceConfig
     from parsers import ParserRegistry
 
 
+# Entry fields read by to_search_results, in unpacking order
+_RESULT_FIELDS = (
+    "github_full_name", "model_name", "github_url", "paper_url", "title", "has_repo",
+    "conference", "year", "arxiv_id", "source_list", "domain", "authors", "id",
+)
+_get_result_fields = operator.attrgetter(*_RESULT_FIELDS)
+_SOURCE_LIST_INDEX = _RESULT_FIELDS.index("source_list")
+
 # Default paths
 DATA_DIR = Path(__file__).parent.parent / "data"
-DEFAULT_CACHE_FILE = DATA_DIR / "awesome_cache.json"
+DEFAULT_CACHE_FILE = DATA_DIR / "awesome_cache.json.gz"
 
 
 class AwesomeListManager:
@@ -41,20 +54,43 @@ class AwesomeListManager:
         Initialize the manager.
 
         Args:
-            cache_path: Path to cache file. Uses default if not specified.
+            cache_path: Path to cache file. Uses awesome_settings.cache_path
+                (relative to the project root), or the default, if not specified.
         """
-        self.cache_path = cache_path or DEFAULT_CACHE_FILE
-        self.github = GitHubClient()
+        if cache_path is None:
+            configured = config.get("awesome_settings.cache_path")
+            cache_path = DATA_DIR.parent / configured if configured else DEFAULT_CACHE_FILE
+        self.cache_path = cache_path
+        self.github = get_shared_client()
         self.cache = IndexedCache(self.cache_path)
         self.registry = SourceRegistry()
 
-    def sync_list(self, repo_full_name: str, force: bool = False) -> int:
+        # Guards cache/registry updates when sync_all runs syncs in parallel
+        self._lock = threading.Lock()
+
+        # Memoized legacy views, rebuilt when cache/registry version changes
+        self._entries_cache: Optional[Dict[str, AwesomeEntry]] = None
+        self._entries_cache_version = -1
+        self._source_metadata_cache: Optional[Dict[str, Dict[str, Any]]] = None
+        self._source_metadata_version = -1
+
+    def sync_list(
+        self,
+        repo_full_name: str,
+        force: bool = False,
+        flush: bool = True,
+        readme: Optional[str] = None
+    ) -> int:
         """
         Sync a single awesome list from GitHub.
 
         Args:
             repo_full_name: e.g., "ChaofWang/Awesome-Super-Resolution"
             force: If True, fetch even if recently synced
+            flush: If False, leave writing the cache and registry state
+                to the caller (used by sync_all to write once per batch)
+            readme: Prefetched README content (used by sync_all's GraphQL
+                batch); skips the REST fetch when given
 
         Returns:
             Number of entries synced
@@ -65,7 +101,7 @@ class AwesomeListManager:
             # Create minimal config for unknown sources
             source = SourceConfig(
                 repo=repo_full_name,
-                name=repo_full_name.split("/")[-1]
+                name=repo_full_name.rsplit("/", 1)[-1]
             )
 
         # Check if we should skip (recently synced)
@@ -79,15 +115,36 @@ class AwesomeListManager:
             return 0
 
         owner, repo = parts
-        print(f"Fetching README from {repo_full_name}...")
-        readme = self.github.get_readme(owner, repo)
+
+        if readme:
+            # Batched content carries no ETag; keep the stored one, which
+            # still matches the README if it hasn't changed
+            etag = new_etag = source.etag
+        else:
+            print(f"Fetching README from {repo_full_name}...")
+
+            # Only send the ETag if the cached entries it vouches for still exist
+            etag = source.etag if self.cache.has_source(repo_full_name) else None
+            readme, new_etag = self.github.get_readme_with_etag(owner, repo, etag)
+
+        if readme is UNCHANGED:
+            print(f"README unchanged for {repo_full_name}, keeping cached entries")
+            with self._lock:
+                self.registry.update_source_state(
+                    repo_full_name, source.entry_count, etag=etag
+                )
+                if flush:
+                    self.registry.save_state()
+            return source.entry_count
 
         if not readme:
             print(f"Could not fetch README from {repo_full_name}")
-            self.registry.update_source_state(
-                repo_full_name, 0, "Failed to fetch README"
-            )
-            self.registry.save_state()
+            with self._lock:
+                self.registry.update_source_state(
+                    repo_full_name, 0, "Failed to fetch README"
+                )
+                if flush:
+                    self.registry.save_state()
             return 0
 
         # Get parser hints from source config
@@ -96,10 +153,8 @@ class AwesomeListManager:
         # Select parser (explicit or auto-detect)
         try:
             if source.parser:
-                parser_class = ParserRegistry.get_parser(source.parser)
-                if parser_class:
-                    parser = parser_class()
-                else:
+                parser = ParserRegistry.get_parser_instance(source.parser)
+                if parser is None:
                     print(f"Unknown parser '{source.parser}', using auto-detect")
                     parser = ParserRegistry.auto_select(readme, hints)
             else:
@@ -108,28 +163,35 @@ class AwesomeListManager:
             print(f"Using parser: {parser.name} v{parser.version}")
         except ValueError as e:
             print(f"No suitable parser found for {repo_full_name}: {e}")
-            self.registry.update_source_state(
-                repo_full_name, 0, str(e)
-            )
-            self.registry.save_state()
+            with self._lock:
+                self.registry.update_source_state(
+                    repo_full_name, 0, str(e)
+                )
+                if flush:
+                    self.registry.save_state()
             return 0
 
         # Parse markdown
         entries = parser.parse(readme, repo_full_name, hints)
         print(f"Parsed {len(entries)} entries from {repo_full_name}")
 
-        # Add to cache with domain metadata
-        self.cache.add_entries(
-            entries,
-            source=repo_full_name,
-            domain=source.domain,
-            subtopics=source.subtopics
-        )
-        self.cache.save()
+        with self._lock:
+            # Add to cache with domain metadata
+            self.cache.add_entries(
+                entries,
+                source=repo_full_name,
+                domain=source.domain,
+                subtopics=source.subtopics
+            )
+            if flush:
+                self.cache.save()
 
-        # Update source state
-        self.registry.update_source_state(repo_full_name, len(entries))
-        self.registry.save_state()
+            # Update source state
+            self.registry.update_source_state(
+                repo_full_name, len(entries), etag=new_etag
+            )
+            if flush:
+                self.registry.save_state()
 
         return len(entries)
 
@@ -137,6 +199,12 @@ class AwesomeListManager:
         """
         Sync all configured awesome lists.
 
+        With a token, READMEs are first fetched in GraphQL batches (one
+        request per GRAPHQL_BATCH_SIZE sources). Remaining fetches are
+        network-bound, so sources are synced in parallel on a small thread
+        pool sized from the remaining rate limit. The cache and registry
+        state are written once after the whole batch.
+
         Args:
             force: If True, fetch all lists regardless of sync time
 
@@ -145,14 +213,42 @@ class AwesomeListManager:
         """
         results = {}
 
+        pending = []
+        now = datetime.now()
         for source in self.registry.list_enabled():
-            try:
-                results[source.repo] = self.sync_list(source.repo, force)
-            except Exception as e:
-                print(f"Error syncing {source.repo}: {e}")
-                results[source.repo] = -1
-                self.registry.update_source_state(source.repo, 0, str(e))
+            # Pre-fill so results keep registry order regardless of completion order
+            results[source.repo] = 0
+            if force or self.registry.needs_sync(source, now):
+                pending.append(source)
+
+        if pending:
+            prefetched = {}
+            if len(pending) > 1:
+                prefetched = self.github.graphql_readmes([s.repo for s in pending])
+
+            max_workers = min(
+                config.get("awesome_settings.sync_workers", 8),
+                max(1, self.github.rate_limit.remaining // 10),
+                len(pending),
+            )
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(
+                        self.sync_list, source.repo, True, False, prefetched.get(source.repo)
+                    ): source
+                    for source in pending
+                }
+                for future in as_completed(futures):
+                    source = futures[future]
+                    try:
+                        results[source.repo] = future.result()
+                    except Exception as e:
+                        print(f"Error syncing {source.repo}: {e}")
+                        results[source.repo] = -1
+                        with self._lock:
+                            self.registry.update_source_state(source.repo, 0, str(e))
 
+        self.cache.save()
         self.registry.save_state()
         return results
 
@@ -181,6 +277,28 @@ class AwesomeListManager:
         Returns:
             List of matching AwesomeEntry objects
         """
+        results = self.search_raw(
+            query, sources, conference, year, has_code_only, domain, limit
+        )
+
+        # Convert to AwesomeEntry objects
+        return AwesomeEntry.from_dicts_bulk(results)
+
+    def search_raw(
+        self,
+        query: str = "",
+        sources: Optional[List[str]] = None,
+        conference: Optional[str] = None,
+        year: Optional[str] = None,
+        has_code_only: bool = False,
+        domain: Optional[str] = None,
+        limit: int = 100,
+    ) -> List[Dict[str, Any]]:
+        """Search like search(), but return the cached entry dicts as-is.
+
+        Use this when the rows are only passed on to to_search_results.
+        The dicts are owned by the cache and must not be modified.
+        """
         search_query = SearchQuery(
             text=query if query else None,
             sources=sources,
@@ -191,10 +309,7 @@ class AwesomeListManager:
             limit=limit,
         )
 
-        results = self.cache.search(search_query)
-
-        # Convert to AwesomeEntry objects
-        return [AwesomeEntry.from_dict(r) for r in results]
+        return self.cache.search(search_query)
 
     def get_stats(self) -> Dict[str, Any]:
         """Get statistics about cached entries."""
@@ -220,43 +335,55 @@ class AwesomeListManager:
 
     def to_search_results(
         self,
-        entries: List[AwesomeEntry],
+        entries: List[Union[AwesomeEntry, Dict[str, Any]]],
         include_no_code: bool = True
     ) -> List[Dict[str, Any]]:
         """
         Convert awesome entries to search result format compatible with web UI.
 
         Args:
-            entries: List of AwesomeEntry objects
+            entries: List of AwesomeEntry objects, or raw dicts from search_raw
             include_no_code: Include entries without GitHub repos
 
         Returns:
             List of dicts in search result format
         """
-        results = []
-        for entry in entries:
-            if not include_no_code and not entry.has_repo:
-                continue
-
-            result = {
-                "full_name": entry.github_full_name or f"paper:{entry.model_name}",
-                "name": entry.model_name,
-                "url": entry.github_url or entry.paper_url or "",
+        if not entries:
+            return []
+
+        # Fetch all fields per entry in one call (attrgetter, or dict.get via map)
+        if isinstance(entries[0], dict):
+            rows = [tuple(map(entry.get, _RESULT_FIELDS)) for entry in entries]
+        else:
+            rows = list(map(_get_result_fields, entries))
+
+        # One split per distinct source list rather than one per entry
+        source_shorts = {
+            source: source.rsplit('/', 1)[-1]
+            for source in {row[_SOURCE_LIST_INDEX] or "" for row in rows}
+        }
+
+        return [
+            {
+                "full_name": full_name or f"paper:{model_name or ''}",
+                "name": model_name or "",
+                "url": github_url or paper_url or "",
                 "stars": 0,
-                "description": entry.title[:200] if entry.title else "",
-                "weight_status": "Curated" if entry.has_repo else "Paper Only",
-                "conference": entry.conference or "",
-                "conference_year": entry.year or "",
-                "arxiv_id": entry.arxiv_id or "",
-                "source": f"awesome:{entry.source_list.split('/')[-1]}",
-                "has_repo": entry.has_repo,
-                "domain": entry.domain,
-                "authors": entry.authors,
-                "_entry_id": entry.id,
+                "description": title[:200] if title else "",
+                "weight_status": "Curated" if has_repo else "Paper Only",
+                "conference": conference or "",
+                "conference_year": year or "",
+                "arxiv_id": arxiv_id or "",
+                "source": f"awesome:{source_shorts[source_list or '']}",
+                "has_repo": bool(has_repo),
+                "domain": domain or "",
+                "authors": authors or [],
+                "_entry_id": entry_id or "",
             }
-            results.append(result)
-
-        return results
+            for (full_name, model_name, github_url, paper_url, title, has_repo, conference,
+                 year, arxiv_id, source_list, domain, authors, entry_id) in rows
+            if include_no_code or has_repo
+        ]
 
     def get_domains(self) -> List[str]:
         """Get list of unique domains from cached entries."""
@@ -266,22 +393,32 @@ class AwesomeListManager:
     # Legacy compatibility
     @property
     def entries(self) -> Dict[str, AwesomeEntry]:
-        """Legacy property for backward compatibility."""
-        return {
-            entry_id: AwesomeEntry.from_dict(entry)
-            for entry_id, entry in self.cache.entries.items()
-        }
+        """Legacy property for backward compatibility.
+
+        Rebuilt only when the cache has changed since the last access.
+        """
+        if self._entries_cache is None or self._entries_cache_version != self.cache.version:
+            cached = self.cache.entries
+            self._entries_cache = dict(
+                zip(cached.keys(), AwesomeEntry.from_dicts_bulk(cached.values()))
+            )
+            self._entries_cache_version = self.cache.version
+        return self._entries_cache
 
     @property
     def source_metadata(self) -> Dict[str, Dict[str, Any]]:
         """Legacy property for backward compatibility."""
-        metadata = {}
-        for source in self.registry.list_all():
-            metadata[source.repo] = {
-                "last_synced": source.last_synced or "",
-                "entry_count": source.entry_count,
-            }
-        return metadata
+        if (self._source_metadata_cache is None
+                or self._source_metadata_version != self.registry.version):
+            metadata = {}
+            for source in self.registry.list_all():
+                metadata[source.repo] = {
+                    "last_synced": source.last_synced or "",
+                    "entry_count": source.entry_count,
+                }
+            self._source_metadata_cache = metadata
+            self._source_metadata_version = self.registry.version
+        return self._source_metadata_cache
 
 
 def get_awesome_manager() -> AwesomeListManager:
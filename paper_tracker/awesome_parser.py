@@ -6,8 +6,10 @@ from typing import List, Optional, Tuple
 
 try:
     from .models import AwesomeEntry
+    from .parsers.base_parser import PatternSet
 except ImportError:
     from models import AwesomeEntry
+    from parsers.base_parser import PatternSet
 
 
 class AwesomeListParser:
@@ -25,6 +27,14 @@ class AwesomeListParser:
         r'\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|\s*([^|]*)\s*\|\s*([^|]*)\s*\|'
     )
 
+    # Simpler 4-column rows (Title, Model, Published, Code)
+    SIMPLE_ROW_PATTERN = re.compile(
+        r'\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|\s*([^|]*)\s*\|'
+    )
+
+    # Table separator line (|---|---|)
+    SEPARATOR_PATTERN = re.compile(r'\|[\s\-:]+\|')
+
     # Pattern to extract markdown links [text](url)
     LINK_PATTERN = re.compile(r'\[([^\]]*)\]\(([^)]+)\)')
 
@@ -58,6 +68,8 @@ class AwesomeListParser:
         'TOG': re.compile(r"TOG['\s]*(\d{2,4})?", re.IGNORECASE),
         'IJCV': re.compile(r"IJCV['\s]*(\d{2,4})?", re.IGNORECASE),
     }
+    # Same patterns scanned in one pass, first match in dict order wins
+    CONFERENCE_SET = PatternSet(CONFERENCE_PATTERNS)
 
     # Section header pattern (e.g., "## 2024", "## Video Super-Resolution")
     SECTION_PATTERN = re.compile(r'^##\s+(.+)$', re.MULTILINE)
@@ -65,6 +77,12 @@ class AwesomeListParser:
     # Year pattern
     YEAR_PATTERN = re.compile(r'20\d{2}')
 
+    # Bold/italic markers
+    EMPHASIS_PATTERN = re.compile(r'[*_]+')
+
+    # Keyword separators, mapped to ',' so keywords split without a regex
+    KEYWORD_SEPARATORS = str.maketrans({';': ',', '/': ','})
+
     def parse_readme(self, content: str, source_list: str) -> List[AwesomeEntry]:
         """
         Parse README content and extract all paper entries.
@@ -83,20 +101,20 @@ class AwesomeListParser:
         timestamp = datetime.now().strftime("%Y-%m-%d")
 
         for i, line in enumerate(lines):
-            # Check for section headers
-            section_match = self.SECTION_PATTERN.match(line)
+            # Check for section headers (cheap prefix test before the regex)
+            section_match = line.startswith('##') and self.SECTION_PATTERN.match(line)
             if section_match:
                 current_section = section_match.group(1).strip()
                 in_table = False
                 continue
 
-            # Check for table header
-            if self.TABLE_HEADER_PATTERN.search(line):
+            # Check for table header (only lines with a '|' can match)
+            if '|' in line and self.TABLE_HEADER_PATTERN.search(line):
                 in_table = True
                 continue
 
             # Skip separator lines (|---|---|)
-            if in_table and re.match(r'\|[\s\-:]+\|', line):
+            if in_table and self.SEPARATOR_PATTERN.match(line):
                 continue
 
             # Parse table rows
@@ -134,10 +152,7 @@ class AwesomeListParser:
         match = self.TABLE_ROW_PATTERN.match(row)
         if not match:
             # Try simpler 4-column format (Title, Model, Published, Code)
-            simple_pattern = re.compile(
-                r'\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|\s*([^|]*)\s*\|'
-            )
-            match = simple_pattern.match(row)
+            match = self.SIMPLE_ROW_PATTERN.match(row)
             if not match:
                 return None
 
@@ -172,18 +187,13 @@ class AwesomeListParser:
             _, paper_url = self._extract_link(published_cell)
 
         # Extract GitHub URL from code cell
-        github_url = self._extract_github_url(code_cell)
-        github_full_name = None
-        if github_url:
-            github_match = self.GITHUB_URL_PATTERN.search(github_url)
-            if github_match:
-                github_full_name = github_match.group(1)
+        github_url, github_full_name = self._extract_github(code_cell)
 
         # Extract keywords
         keywords = self._parse_keywords(keywords_cell)
 
         # Generate unique ID
-        source_short = source_list.split('/')[-1].lower().replace('awesome-', '')
+        source_short = source_list.rsplit('/', 1)[-1].lower().replace('awesome-', '')
         entry_id = f"{source_short}:{model_name.lower().replace(' ', '_')}"
 
         return AwesomeEntry(
@@ -229,18 +239,16 @@ class AwesomeListParser:
             arxiv_id = arxiv_match.group(1)
 
         # Check for conferences
-        for conf_name, pattern in self.CONFERENCE_PATTERNS.items():
-            match = pattern.search(cell)
-            if match:
-                conference = conf_name
-                if match.group(1):
-                    year_str = match.group(1)
-                    # Normalize year (24 -> 2024)
-                    if len(year_str) == 2:
-                        year = f"20{year_str}"
-                    else:
-                        year = year_str
-                break
+        found = self.CONFERENCE_SET.search(cell)
+        if found:
+            conference, match = found
+            if match.group(1):
+                year_str = match.group(1)
+                # Normalize year (24 -> 2024)
+                if len(year_str) == 2:
+                    year = f"20{year_str}"
+                else:
+                    year = year_str
 
         # If no year from conference, try to find standalone year
         if not year:
@@ -250,21 +258,23 @@ class AwesomeListParser:
 
         return conference, year, arxiv_id
 
-    def _extract_github_url(self, cell: str) -> Optional[str]:
-        """Extract GitHub URL from a cell."""
+    def _extract_github(self, cell: str) -> Tuple[Optional[str], Optional[str]]:
+        """Extract GitHub URL and full name (owner/repo) from a cell."""
         # First try to extract from markdown link
         link_match = self.LINK_PATTERN.search(cell)
         if link_match:
             url = link_match.group(2)
             if 'github.com' in url.lower():
-                return url
+                github_match = self.GITHUB_URL_PATTERN.search(url)
+                return url, github_match.group(1) if github_match else None
 
-        # Then try direct URL
+        # Then try direct URL (its match already holds owner/repo)
         url_match = self.GITHUB_URL_PATTERN.search(cell)
         if url_match:
-            return f"https://github.com/{url_match.group(1)}"
+            full_name = url_match.group(1)
+            return f"https://github.com/{full_name}", full_name
 
-        return None
+        return None, None
 
     def _parse_keywords(self, cell: str) -> List[str]:
         """Parse keywords from comma or space-separated text."""
@@ -277,7 +287,7 @@ class AwesomeListParser:
             return []
 
         # Split by comma or common separators
-        keywords = re.split(r'[,;/]', cell)
+        keywords = cell.translate(self.KEYWORD_SEPARATORS).split(',')
         keywords = [k.strip() for k in keywords if k.strip()]
 
         return keywords
@@ -287,8 +297,7 @@ class AwesomeListParser:
         # Remove markdown links, keeping just the text
         text = self.LINK_PATTERN.sub(r'\1', text)
         # Remove bold/italic markers
-        text = re.sub(r'\*+', '', text)
-        text = re.sub(r'_+', '', text)
+        text = self.EMPHASIS_PATTERN.sub('', text)
         # Remove extra whitespace
         text = ' '.join(text.split())
         return text.strip()
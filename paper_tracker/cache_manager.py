@@ -4,14 +4,58 @@ Provides fast search using in-memory indexes built on load.
 Storage remains as JSON for simplicity and portability.
 """
 
+import gzip
+import heapq
+import mmap
+import os
 import re
 import json
+import sys
+import zlib
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Set
 from collections import defaultdict
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # orjson not installed, fall back to stdlib json
+
+
+def _json_dumps(data: Any) -> bytes:
+    """Serialize to UTF-8 JSON bytes (orjson if available)."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS)
+    return (json.dumps(data, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def _json_loads(raw: bytes) -> Any:
+    """Deserialize UTF-8 JSON bytes (orjson if available)."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# Low-cardinality entry fields repeated across thousands of entries
+_INTERNED_FIELDS = ("source_list", "conference", "year", "section", "domain")
+
+
+def _intern_entry(entry: Dict[str, Any]):
+    """Intern repeated strings in an entry dict so equal values share one object."""
+    for key in _INTERNED_FIELDS:
+        value = entry.get(key)
+        if isinstance(value, str):
+            entry[key] = sys.intern(value)
+    for key in ("keywords", "subtopics"):
+        values = entry.get(key)
+        if values:
+            # In place: subtopics lists are shared by all entries of a source
+            for i, value in enumerate(values):
+                if isinstance(value, str):
+                    values[i] = sys.intern(value)
+
 
 @dataclass
 class SearchQuery:
@@ -45,11 +89,27 @@ class IndexedCache:
 
     CACHE_VERSION = "2.0"
 
+    # Parse larger cache files straight from an mmap (orjson only)
+    MMAP_MIN_SIZE = 1_000_000
+
+    # Fast gzip level for *.json.gz cache paths; JSON text compresses well even at 1
+    GZIP_LEVEL = 1
+
+    # Max distinct query tokens memoized between cache mutations
+    TEXT_MATCH_CACHE_SIZE = 256
+
+    # Index tokens: words with 2+ characters. The ASCII variant is the same
+    # match on ASCII-only text, and skips Unicode class lookups.
+    TOKEN_PATTERN = re.compile(r'\w{2,}')
+    ASCII_TOKEN_PATTERN = re.compile(r'\w{2,}', re.ASCII)
+
     def __init__(self, cache_path: Optional[Path] = None):
         """Initialize cache with optional path.
 
         Args:
-            cache_path: Path to JSON cache file. Defaults to data/awesome_cache.json
+            cache_path: Path to JSON cache file. Defaults to data/awesome_cache.json.
+                A path ending in .gz is stored gzip-compressed; if it does not
+                exist yet, the uncompressed file next to it is loaded instead.
         """
         self.cache_path = cache_path or Path("data/awesome_cache.json")
 
@@ -66,21 +126,65 @@ class IndexedCache:
         # Full-text index (token -> entry_ids)
         self._idx_tokens: Dict[str, Set[str]] = defaultdict(set)
 
+        # Substring lookup over _idx_tokens (3-gram -> index tokens containing it)
+        self._idx_trigrams: Dict[str, Set[str]] = defaultdict(set)
+
+        # Tokens each entry was indexed under, so unindexing skips retokenizing.
+        # Kept off the entry dicts so they never reach the saved file or callers.
+        self._entry_tokens: Dict[str, Set[str]] = {}
+
+        # Precomputed result ordering key per entry (see _sort_key)
+        self._sort_keys: Dict[str, tuple] = {}
+
+        # Query token -> ids of entries with an index token containing it.
+        # Valid for _text_match_version only; rebuilt lazily after mutations.
+        self._text_match_cache: Dict[str, Set[str]] = {}
+        self._text_match_version = -1
+
         # Metadata
         self.last_updated: Optional[str] = None
 
+        # Bumped on every mutation so callers can memoize derived views
+        self.version = 0
+
+        # True when in-memory entries differ from the file on disk
+        self._dirty = False
+
+        # Uncompressed cache migrated on load, removed after the next save
+        self._legacy_path: Optional[Path] = None
+
+        # get_stats() result and the version it was computed at
+        self._stats_cache: Optional[Dict[str, Any]] = None
+        self._stats_version = -1
+
         self._load()
 
     def _load(self):
         """Load cache from JSON file and build indexes."""
-        if not self.cache_path.exists():
-            return
+        path = self.cache_path
+        compressed = path.suffix == ".gz"
+        if not path.exists():
+            if not compressed or not path.with_suffix("").exists():
+                return
+            # Migrate: read the uncompressed cache, write .gz on next save
+            path = self._legacy_path = path.with_suffix("")
+            compressed = False
+            self._dirty = True
 
         try:
-            with open(self.cache_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
+            if compressed:
+                data = _json_loads(gzip.decompress(path.read_bytes()))
+            elif orjson is not None and path.stat().st_size > self.MMAP_MIN_SIZE:
+                # Avoids a file-sized bytes copy next to the decoded entries
+                with open(path, "rb") as f, \
+                        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    data = orjson.loads(memoryview(mm))
+            else:
+                data = _json_loads(path.read_bytes())
+        except (json.JSONDecodeError, IOError, EOFError, zlib.error) as e:
             print(f"Warning: Failed to load cache: {e}")
+            # Leave an unreadable legacy file in place
+            self._legacy_path = None
             return
 
         self.last_updated = data.get("last_updated")
@@ -90,13 +194,25 @@ class IndexedCache:
 
         # v1 format has nested structure, v2 is flat
         if isinstance(entries_data, dict):
+            postings: Dict[str, List[str]] = defaultdict(list)
             for entry_id, entry in entries_data.items():
                 if isinstance(entry, dict):
+                    _intern_entry(entry)
                     self.entries[entry_id] = entry
-                    self._index_entry(entry_id, entry)
+                    self._index_entry(entry_id, entry, postings)
+            self._add_postings(postings)
+
+    def _index_entry(
+        self,
+        entry_id: str,
+        entry: Dict[str, Any],
+        postings: Optional[Dict[str, List[str]]] = None
+    ):
+        """Add entry to all indexes.
 
-    def _index_entry(self, entry_id: str, entry: Dict[str, Any]):
-        """Add entry to all indexes."""
+        If postings (token -> entry ids) is given, full-text tokens are
+        collected there and the caller merges them with _add_postings.
+        """
         # Year index
         year = entry.get("year")
         if year:
@@ -123,8 +239,26 @@ class IndexedCache:
 
         # Full-text index
         tokens = self._tokenize(entry)
-        for token in tokens:
-            self._idx_tokens[token].add(entry_id)
+        self._entry_tokens[entry_id] = tokens
+        if postings is None:
+            self._add_postings({token: (entry_id,) for token in tokens})
+        else:
+            for token in tokens:
+                postings[token].append(entry_id)
+
+        self._sort_keys[entry_id] = self._sort_key(entry)
+
+    def _add_postings(self, postings: Dict[str, Any]):
+        """Merge token -> entry ids into the full-text index, one update per token."""
+        idx_tokens = self._idx_tokens
+        for token, ids in postings.items():
+            token_ids = idx_tokens.get(token)
+            if token_ids is None:
+                for gram in self._trigrams(token):
+                    self._idx_trigrams[gram].add(token)
+                idx_tokens[token] = set(ids)
+            else:
+                token_ids.update(ids)
 
     def _unindex_entry(self, entry_id: str, entry: Dict[str, Any]):
         """Remove entry from all indexes."""
@@ -146,9 +280,40 @@ class IndexedCache:
 
         self._idx_has_code.discard(entry_id)
 
-        tokens = self._tokenize(entry)
+        tokens = self._entry_tokens.pop(entry_id, None)
+        if tokens is None:
+            tokens = self._tokenize(entry)
         for token in tokens:
-            self._idx_tokens[token].discard(entry_id)
+            ids = self._idx_tokens.get(token)
+            if ids is not None:
+                ids.discard(entry_id)
+                if not ids:
+                    # Drop empty postings so text search doesn't scan them
+                    del self._idx_tokens[token]
+                    for gram in self._trigrams(token):
+                        grams = self._idx_trigrams.get(gram)
+                        if grams is not None:
+                            grams.discard(token)
+                            if not grams:
+                                del self._idx_trigrams[gram]
+
+        self._sort_keys.pop(entry_id, None)
+
+    @staticmethod
+    def _sort_key(entry: Dict[str, Any]) -> tuple:
+        """Result ordering: entries with code first, then year desc, then model name."""
+        has_code = not entry.get("has_repo", False)  # False sorts before True
+        try:
+            year = -int(entry.get("year") or 0)
+        except (TypeError, ValueError):
+            year = 0
+        name = (entry.get("model_name") or "").lower()
+        return (has_code, year, name)
+
+    @staticmethod
+    def _trigrams(token: str) -> Set[str]:
+        """All 3-character substrings of token."""
+        return {token[i:i + 3] for i in range(len(token) - 2)}
 
     def _tokenize(self, entry: Dict[str, Any]) -> Set[str]:
         """Extract searchable tokens from entry."""
@@ -161,8 +326,10 @@ class IndexedCache:
         ]
         text = " ".join(str(p) for p in text_parts if p).lower()
 
-        # Tokenize: extract words with 2+ characters
-        tokens = set(re.findall(r'\w{2,}', text))
+        # Tokenize: extract words with 2+ characters (interned, as every
+        # entry sharing a token holds it in _entry_tokens)
+        pattern = self.ASCII_TOKEN_PATTERN if text.isascii() else self.TOKEN_PATTERN
+        tokens = set(map(sys.intern, pattern.findall(text)))
         return tokens
 
     def search(self, query: SearchQuery) -> List[Dict[str, Any]]:
@@ -175,71 +342,87 @@ class IndexedCache:
         3. Apply text filter last (most expensive)
         4. Sort and paginate
         """
-        candidate_ids: Optional[Set[str]] = None
-
-        # Filter by source (usually smallest set)
+        # Matching id set per active filter; index sets are only read, never mutated
+        filters: List[Set[str]] = []
         if query.sources:
-            source_ids: Set[str] = set()
-            for source in query.sources:
-                source_ids.update(self._idx_by_source.get(source, set()))
-            candidate_ids = source_ids
-
-        # Filter by year
+            filters.append(self._lookup(self._idx_by_source, query.sources))
         if query.years:
-            year_ids: Set[str] = set()
-            for year in query.years:
-                year_ids.update(self._idx_by_year.get(str(year), set()))
-            candidate_ids = year_ids if candidate_ids is None else candidate_ids & year_ids
-
-        # Filter by conference
+            filters.append(self._lookup(self._idx_by_year, [str(year) for year in query.years]))
         if query.conferences:
-            conf_ids: Set[str] = set()
-            for conf in query.conferences:
-                conf_ids.update(self._idx_by_conference.get(conf.upper(), set()))
-            candidate_ids = conf_ids if candidate_ids is None else candidate_ids & conf_ids
-
-        # Filter by domain
+            filters.append(self._lookup(self._idx_by_conference, [conf.upper() for conf in query.conferences]))
         if query.domains:
-            domain_ids: Set[str] = set()
-            for domain in query.domains:
-                domain_ids.update(self._idx_by_domain.get(domain, set()))
-            candidate_ids = domain_ids if candidate_ids is None else candidate_ids & domain_ids
-
-        # Filter by has_code
+            filters.append(self._lookup(self._idx_by_domain, query.domains))
         if query.has_code_only:
-            candidate_ids = self._idx_has_code.copy() if candidate_ids is None else candidate_ids & self._idx_has_code
+            filters.append(self._idx_has_code)
 
-        # If no filters, use all entries
-        if candidate_ids is None:
-            candidate_ids = set(self.entries.keys())
+        # Intersect all filters in one call, starting from the smallest set
+        candidate_ids: Optional[Set[str]] = None
+        if filters:
+            filters.sort(key=len)
+            candidate_ids = filters[0].intersection(*filters[1:]) if len(filters) > 1 else filters[0]
 
-        # Text search (most expensive, do last)
-        if query.text:
+        # Text search (most expensive, do last; skipped if filters left nothing)
+        if query.text and (candidate_ids is None or candidate_ids):
             text_tokens = set(query.text.lower().split())
-            text_ids: Set[str] = set()
-
-            for token in text_tokens:
-                # Prefix matching for partial search
-                for idx_token, ids in self._idx_tokens.items():
-                    if idx_token.startswith(token) or token in idx_token:
-                        text_ids.update(ids)
+            matches = [self._text_match(token) for token in text_tokens]
 
-            candidate_ids = candidate_ids & text_ids
+            if candidate_ids is not None:
+                # Narrow each token's matches first, so the union never holds
+                # ids the filters already ruled out
+                matches = [candidate_ids & ids for ids in matches]
+            if len(matches) == 1:
+                candidate_ids = matches[0]  # only read below, safe to share
+            else:
+                candidate_ids = set().union(*matches)
 
-        # Get full entries for candidates
-        results = [self.entries[eid] for eid in candidate_ids if eid in self.entries]
-
-        # Sort by relevance (has_code first, then by year desc, then by model name)
-        def sort_key(e: Dict[str, Any]) -> tuple:
-            has_code = not e.get("has_repo", False)  # False sorts before True
-            year = -(int(e.get("year") or 0))
-            name = (e.get("model_name") or "").lower()
-            return (has_code, year, name)
-
-        results.sort(key=sort_key)
-
-        # Paginate
-        return results[query.offset:query.offset + query.limit]
+        # If no filters, use all entries
+        if candidate_ids is None:
+            candidate_ids = self.entries.keys()
+
+        # Sort by relevance using the keys computed at index time; a page
+        # near the top only needs the first offset + limit ids ordered
+        ids = [eid for eid in candidate_ids if eid in self.entries]
+        end = query.offset + query.limit
+        if 0 <= end < len(ids):
+            ordered = heapq.nsmallest(end, ids, key=self._sort_keys.__getitem__)
+        else:
+            ordered = sorted(ids, key=self._sort_keys.__getitem__)
+
+        # Paginate, then fetch only the entries on the page
+        page = ordered[query.offset:end]
+        return [self.entries[eid] for eid in page]
+
+    @staticmethod
+    def _lookup(index: Dict[str, Set[str]], keys: List[str]) -> Set[str]:
+        """Union of index postings for keys (the posting itself for a single key)."""
+        if len(keys) == 1:
+            return index.get(keys[0], set())
+        return set().union(*(index.get(key, ()) for key in keys))
+
+    def _text_match(self, token: str) -> Set[str]:
+        """Get ids of entries with an index token containing token (substring match)."""
+        if self._text_match_version != self.version:
+            self._text_match_cache.clear()
+            self._text_match_version = self.version
+
+        ids = self._text_match_cache.get(token)
+        if ids is None:
+            idx_tokens = self._idx_tokens
+            if len(token) >= 3:
+                # Only index tokens holding every 3-gram of token can contain it
+                grams = [self._idx_trigrams.get(gram) for gram in self._trigrams(token)]
+                if all(grams):
+                    grams.sort(key=len)
+                    matches = grams[0].intersection(*grams[1:])
+                else:
+                    matches = ()
+            else:
+                matches = idx_tokens
+            ids = set().union(*(idx_tokens[t] for t in matches if token in t))
+            if len(self._text_match_cache) >= self.TEXT_MATCH_CACHE_SIZE:
+                self._text_match_cache.clear()
+            self._text_match_cache[token] = ids
+        return ids
 
     def add_entries(
         self,
@@ -256,11 +439,13 @@ class IndexedCache:
             domain: Optional domain tag (e.g., "image_restoration")
             subtopics: Optional subtopic tags
         """
+        # Last entry per id wins, as if the entries were added one by one
+        batch: Dict[str, Dict[str, Any]] = {}
+        source_short = source.rsplit('/', 1)[-1].lower().replace('awesome-', '').replace('-', '_')
         for entry in entries:
             entry_id = entry.get("id")
             if not entry_id:
                 # Generate ID if not provided
-                source_short = source.split('/')[-1].lower().replace('awesome-', '').replace('-', '_')
                 model_name = entry.get("model_name", "unknown").lower().replace(' ', '_')
                 entry_id = f"{source_short}:{model_name}"
                 entry["id"] = entry_id
@@ -272,16 +457,23 @@ class IndexedCache:
                 entry["domain"] = domain
             if subtopics:
                 entry["subtopics"] = subtopics
+            _intern_entry(entry)
+            batch[entry_id] = entry
 
+        postings: Dict[str, List[str]] = defaultdict(list)
+        for entry_id, entry in batch.items():
             # Remove from old indexes if updating
             if entry_id in self.entries:
                 self._unindex_entry(entry_id, self.entries[entry_id])
 
             # Add to storage and indexes
             self.entries[entry_id] = entry
-            self._index_entry(entry_id, entry)
+            self._index_entry(entry_id, entry, postings)
+        self._add_postings(postings)
 
         self.last_updated = datetime.now().isoformat()
+        self.version += 1
+        self._dirty = True
 
     def remove_source(self, source: str):
         """Remove all entries from a specific source."""
@@ -290,9 +482,14 @@ class IndexedCache:
             if entry_id in self.entries:
                 self._unindex_entry(entry_id, self.entries[entry_id])
                 del self.entries[entry_id]
+        self.version += 1
+        self._dirty = True
 
     def save(self):
-        """Save cache to JSON file."""
+        """Save cache to JSON file (no-op if nothing changed since the last save)."""
+        if not self._dirty and self.cache_path.exists():
+            return
+
         data = {
             "version": self.CACHE_VERSION,
             "last_updated": self.last_updated,
@@ -303,12 +500,29 @@ class IndexedCache:
         # Ensure directory exists
         self.cache_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(self.cache_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # Write to a temp file and swap it in so readers never see a partial cache
+        payload = _json_dumps(data)
+        if self.cache_path.suffix == ".gz":
+            payload = gzip.compress(payload, compresslevel=self.GZIP_LEVEL, mtime=0)
+
+        tmp_path = self.cache_path.with_name(self.cache_path.name + ".tmp")
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, self.cache_path)
+        self._dirty = False
+
+        if self._legacy_path is not None:
+            self._legacy_path.unlink(missing_ok=True)
+            self._legacy_path = None
 
     def get_stats(self) -> Dict[str, Any]:
-        """Get statistics about cached data."""
-        return {
+        """Get statistics about cached data (recomputed only after changes).
+
+        The returned dict is shared between calls and must not be modified.
+        """
+        if self._stats_cache is not None and self._stats_version == self.version:
+            return self._stats_cache
+
+        self._stats_cache = {
             "total_entries": len(self.entries),
             "entries_with_code": len(self._idx_has_code),
             "by_year": {k: len(v) for k, v in sorted(self._idx_by_year.items(), reverse=True)},
@@ -317,11 +531,17 @@ class IndexedCache:
             "by_domain": {k: len(v) for k, v in self._idx_by_domain.items()},
             "last_updated": self.last_updated,
         }
+        self._stats_version = self.version
+        return self._stats_cache
 
     def get_entry(self, entry_id: str) -> Optional[Dict[str, Any]]:
         """Get a single entry by ID."""
         return self.entries.get(entry_id)
 
+    def has_source(self, source: str) -> bool:
+        """Check if any entries from a source are cached."""
+        return bool(self._idx_by_source.get(source))
+
     def get_entries_by_source(self, source: str) -> List[Dict[str, Any]]:
         """Get all entries from a specific source."""
         entry_ids = self._idx_by_source.get(source, set())
@@ -336,4 +556,9 @@ class IndexedCache:
         self._idx_by_domain.clear()
         self._idx_has_code.clear()
         self._idx_tokens.clear()
+        self._idx_trigrams.clear()
+        self._entry_tokens.clear()
+        self._sort_keys.clear()
         self.last_updated = None
+        self.version += 1
+        self._dirty = True
@@ -22,6 +22,8 @@ class Config:
 
     _instance: Optional["Config"] = None
     _config: Dict[str, Any] = {}
+    # Dot-path key -> resolved value (None if missing); reset on load()
+    _get_cache: Dict[str, Any] = {}
 
     def __new__(cls):
         if cls._instance is None:
@@ -39,6 +41,7 @@ class Config:
 
         with open(config_path, "r") as f:
             self._config = yaml.safe_load(f)
+        self._get_cache = {}
 
         # Override with environment variables
         self._apply_env_overrides()
@@ -51,6 +54,12 @@ class Config:
         if os.environ.get("GITHUB_TOKEN"):
             self._config.setdefault("github", {})["token"] = os.environ["GITHUB_TOKEN"]
 
+        # Extra tokens to rotate over (comma-separated)
+        if os.environ.get("GITHUB_TOKENS"):
+            self._config.setdefault("github", {})["tokens"] = [
+                t.strip() for t in os.environ["GITHUB_TOKENS"].split(",") if t.strip()
+            ]
+
         # Min stars override
         if os.environ.get("TRACKER_MIN_STARS"):
             self._config["search"]["min_stars"] = int(os.environ["TRACKER_MIN_STARS"])
@@ -61,15 +70,21 @@ class Config:
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get config value by dot-separated key."""
-        keys = key.split(".")
+        try:
+            value = self._get_cache[key]
+        except KeyError:
+            value = self._get_cache[key] = self._resolve(key)
+        return default if value is None else value
+
+    def _resolve(self, key: str) -> Any:
+        """Walk the config for a dot-separated key, None if any part is missing."""
         value = self._config
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k)
-            else:
-                return default
+        for k in key.split("."):
+            if not isinstance(value, dict):
+                return None
+            value = value.get(k)
             if value is None:
-                return default
+                return None
         return value
 
     @property
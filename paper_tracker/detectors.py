@@ -1,13 +1,13 @@
 """Detection logic for weights, conferences, coming soon, and relevance."""
 
 import re
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, List, Optional, Tuple
 
 from .config_loader import config
 
 
-@dataclass
+@dataclass(slots=True)
 class WeightDetectionResult:
     """Result of weight detection."""
     status: str  # HF, Release, Cloud, Extension, None
@@ -15,7 +15,7 @@ class WeightDetectionResult:
     details: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ConferenceDetectionResult:
     """Result of conference detection."""
     conference: Optional[str]
@@ -24,18 +24,44 @@ class ConferenceDetectionResult:
     details: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ComingSoonResult:
     """Result of coming soon detection."""
     detected: bool
     details: List[str] = field(default_factory=list)
 
 
+class _DetectionMemo:
+    """Detector results by input text, so repeated READMEs skip the regex work.
+
+    Results are copied in and out: callers store the details lists on their
+    repo objects.
+    """
+
+    # Entries kept before the memo is cleared and refilled
+    MAX_SIZE = 256
+
+    def __init__(self):
+        self._results: Dict[Any, Any] = {}
+
+    def get(self, key: Any) -> Any:
+        result = self._results.get(key)
+        if result is None:
+            return None
+        return replace(result, details=list(result.details))
+
+    def put(self, key: Any, result: Any):
+        if len(self._results) >= self.MAX_SIZE:
+            self._results.clear()
+        self._results[key] = replace(result, details=list(result.details))
+
+
 class WeightDetector:
     """Detect pretrained weights in README content."""
 
     def __init__(self):
         self._load_patterns()
+        self._memo = _DetectionMemo()
 
     def _load_patterns(self):
         """Load patterns from config."""
@@ -51,6 +77,29 @@ class WeightDetector:
         self.model_extensions = wd.get("model_extensions", [])
         self.weight_keywords = wd.get("weight_keywords", [])
 
+        # One alternation per tier, so a tier with no hit costs a single scan
+        self.hf_any = self._combine(self.hf_patterns)
+        self.release_any = self._combine(self.release_patterns)
+        self.cloud_any = self._combine(
+            [p for patterns in self.cloud_patterns.values() for p in patterns]
+        )
+
+        # Per extension: occurrence pattern and file name pattern
+        self.extension_patterns = [
+            (ext, re.compile(re.escape(ext)), re.compile(r'[\w\-\.]+' + re.escape(ext), re.IGNORECASE))
+            for ext in self.model_extensions
+        ]
+
+    @staticmethod
+    def _combine(patterns: List[re.Pattern]) -> Optional[re.Pattern]:
+        """Compile patterns into one alternation (None if empty or not combinable)."""
+        if not patterns:
+            return None
+        try:
+            return re.compile("|".join(f"(?:{p.pattern})" for p in patterns), re.IGNORECASE)
+        except re.error:
+            return None  # e.g. inline global flags; callers then check each pattern
+
     def detect(self, readme_content: str) -> WeightDetectionResult:
         """
         Detect pretrained weights in README.
@@ -60,11 +109,20 @@ class WeightDetector:
         if not readme_content:
             return WeightDetectionResult(status="None", confidence="none")
 
-        readme_lower = readme_content.lower()
+        result = self._memo.get(readme_content)
+        if result is None:
+            result = self._detect(readme_content)
+            self._memo.put(readme_content, result)
+        return result
+
+    def _detect(self, readme_content: str) -> WeightDetectionResult:
+        """Run weight detection on a non-empty README (uncached)."""
+
         details = []
 
         # 1. HuggingFace (highest confidence)
-        for pattern in self.hf_patterns:
+        hf_patterns = self.hf_patterns if self._may_match(self.hf_any, readme_content) else ()
+        for pattern in hf_patterns:
             matches = pattern.findall(readme_content)
             if matches:
                 for m in matches[:3]:
@@ -75,7 +133,8 @@ class WeightDetector:
             return WeightDetectionResult(status="HF", confidence="high", details=details)
 
         # 2. GitHub releases (high confidence)
-        for pattern in self.release_patterns:
+        release_patterns = self.release_patterns if self._may_match(self.release_any, readme_content) else ()
+        for pattern in release_patterns:
             matches = pattern.findall(readme_content)
             if matches:
                 for m in matches[:3]:
@@ -86,7 +145,8 @@ class WeightDetector:
             return WeightDetectionResult(status="Release", confidence="high", details=details)
 
         # 3. Cloud drives (medium confidence)
-        for drive_name, patterns in self.cloud_patterns.items():
+        cloud_patterns = self.cloud_patterns if self._may_match(self.cloud_any, readme_content) else {}
+        for drive_name, patterns in cloud_patterns.items():
             for pattern in patterns:
                 matches = pattern.findall(readme_content)
                 if matches:
@@ -98,21 +158,22 @@ class WeightDetector:
             return WeightDetectionResult(status="Cloud", confidence="medium", details=details)
 
         # 4. Model extensions near keywords (lower confidence)
-        for ext in self.model_extensions:
+        readme_lower = readme_content.lower()
+        weight_keywords = self.weight_keywords
+        for ext, ext_pattern, file_pattern in self.extension_patterns:
             if ext not in readme_lower:
                 continue
 
-            ext_positions = [m.start() for m in re.finditer(re.escape(ext), readme_lower)]
-            for pos in ext_positions:
+            for m in ext_pattern.finditer(readme_lower):
+                pos = m.start()
                 context = readme_lower[max(0, pos - 100):pos + 100]
 
-                for keyword in self.weight_keywords:
-                    if keyword in context:
-                        snippet = readme_content[max(0, pos - 50):pos + 20]
-                        match = re.search(r'[\w\-\.]+' + re.escape(ext), snippet, re.IGNORECASE)
-                        if match:
-                            details.append(f"File: {match.group()}")
-                            break
+                # The snippet does not depend on which keyword hit, so one try is enough
+                if any(keyword in context for keyword in weight_keywords):
+                    snippet = readme_content[max(0, pos - 50):pos + 20]
+                    match = file_pattern.search(snippet)
+                    if match:
+                        details.append(f"File: {match.group()}")
 
                 if len(details) >= 3:
                     break
@@ -125,6 +186,11 @@ class WeightDetector:
 
         return WeightDetectionResult(status="None", confidence="none")
 
+    @staticmethod
+    def _may_match(combined: Optional[re.Pattern], text: str) -> bool:
+        """False only if the tier's combined pattern rules out every match."""
+        return combined is None or combined.search(text) is not None
+
 
 class ComingSoonDetector:
     """Detect 'coming soon' promises for weights in README content."""
@@ -160,10 +226,16 @@ class ComingSoonDetector:
     ]
 
     def __init__(self):
+        self._memo = _DetectionMemo()
         self.patterns = [
             (re.compile(pattern, re.IGNORECASE | re.MULTILINE), desc)
             for pattern, desc in self.PROMISE_PATTERNS
         ]
+        # All patterns in one alternation: a single scan rules out READMEs with no promise
+        self.any_pattern = re.compile(
+            "|".join(f"(?:{pattern})" for pattern, _ in self.PROMISE_PATTERNS),
+            re.IGNORECASE | re.MULTILINE
+        )
 
     def detect(self, readme_content: str) -> ComingSoonResult:
         """
@@ -178,16 +250,26 @@ class ComingSoonDetector:
 
         # Only check the first 3000 chars (intro section)
         text = readme_content[:3000]
+
+        result = self._memo.get(text)
+        if result is None:
+            result = self._detect(text)
+            self._memo.put(text, result)
+        return result
+
+    def _detect(self, text: str) -> ComingSoonResult:
+        """Run promise detection on the README intro (uncached)."""
+        if not self.any_pattern.search(text):
+            return ComingSoonResult(detected=False)
+
         details = []
 
         for pattern, description in self.patterns:
-            matches = pattern.findall(text)
-            if matches:
-                # Get the actual matched text
-                match = pattern.search(text)
-                if match:
-                    matched_text = match.group()[:50]
-                    details.append(f"{description}: '{matched_text}'")
+            # Get the actual matched text
+            match = pattern.search(text)
+            if match:
+                matched_text = match.group()[:50]
+                details.append(f"{description}: '{matched_text}'")
 
                 if len(details) >= 3:
                     break
@@ -198,17 +280,28 @@ class ComingSoonDetector:
 class ConferenceDetector:
     """Detect conference publications in README content."""
 
+    # Year near a venue mention without an inline year
+    CONTEXT_YEAR_PATTERN = re.compile(r'20[2-3]\d')
+
     def __init__(self):
         self._load_patterns()
+        self._memo = _DetectionMemo()
 
     def _load_patterns(self):
         """Load patterns from config."""
         conf = config.conferences
 
         self.conference_patterns = {}
+        all_keywords = []
         for venue, keywords in conf.get("patterns", {}).items():
             patterns = []
+            kept = []
             for kw in keywords:
+                # A keyword extending an earlier one of the same venue (e.g.
+                # "cvpr2024" after "cvpr") can never match first; skip it
+                if any(kw.lower().startswith(prev.lower()) for prev in kept):
+                    continue
+                kept.append(kw)
                 # Create pattern that matches keyword with optional year
                 pattern = re.compile(
                     rf'\b{re.escape(kw)}(?:\s*[\'"]?\s*(\d{{4}}))?',
@@ -216,6 +309,13 @@ class ConferenceDetector:
                 )
                 patterns.append(pattern)
             self.conference_patterns[venue] = patterns
+            all_keywords.extend(kept)
+
+        # Any venue keyword at all; one scan rules out READMEs with no venue
+        self.any_venue_pattern = re.compile(
+            r'\b(?:' + "|".join(re.escape(kw) for kw in all_keywords) + ')',
+            re.IGNORECASE
+        ) if all_keywords else None
 
         arxiv_pattern = conf.get("arxiv_pattern", r'arxiv\.org/abs/(\d{4}\.\d{4,5})')
         self.arxiv_pattern = re.compile(arxiv_pattern, re.IGNORECASE)
@@ -230,13 +330,26 @@ class ConferenceDetector:
             return ConferenceDetectionResult(conference=None, year=None, arxiv_id=None)
 
         text = f"{repo_description}\n{readme_content}"
+
+        result = self._memo.get(text)
+        if result is None:
+            result = self._detect(text)
+            self._memo.put(text, result)
+        return result
+
+    def _detect(self, text: str) -> ConferenceDetectionResult:
+        """Run venue and arXiv detection on description + README (uncached)."""
         details = []
 
         # Detect conference
         detected_conference = None
         detected_year = None
 
-        for venue, patterns in self.conference_patterns.items():
+        conference_patterns = self.conference_patterns
+        if self.any_venue_pattern is None or not self.any_venue_pattern.search(text):
+            conference_patterns = {}
+
+        for venue, patterns in conference_patterns.items():
             for pattern in patterns:
                 match = pattern.search(text)
                 if match:
@@ -246,7 +359,7 @@ class ConferenceDetector:
                         detected_year = match.group(1)
                     else:
                         # Look for year in surrounding context
-                        year_match = re.search(r'20[2-3]\d', text[max(0, match.start()-20):match.end()+20])
+                        year_match = self.CONTEXT_YEAR_PATTERN.search(text[max(0, match.start()-20):match.end()+20])
                         if year_match:
                             detected_year = year_match.group()
 
@@ -273,6 +386,9 @@ class ConferenceDetector:
 class RelevanceFilter:
     """Filter repos by relevance to low-level vision tasks."""
 
+    # Terms that make weak keywords count
+    IMAGE_CONTEXT_TERMS = ("image", "photo", "picture", "visual")
+
     def __init__(self):
         self._load_keywords()
 
@@ -285,6 +401,21 @@ class RelevanceFilter:
         self.exclude_keywords = [kw.lower() for kw in rel.get("exclude_keywords", [])]
         self.exclude_name_terms = [t.lower() for t in rel.get("exclude_name_terms", [])]
 
+        # Lists actually scanned: a keyword containing another keyword of the
+        # same list can never change the outcome, so it is dropped
+        self._exclude_scan = self._minimal_keywords(self.exclude_keywords)
+        self._strong_scan = self._minimal_keywords(self.strong_keywords)
+        self._weak_scan = self._minimal_keywords(self.weak_keywords)
+
+    @staticmethod
+    def _minimal_keywords(keywords: List[str]) -> List[str]:
+        """Drop duplicates and keywords that contain a shorter keyword."""
+        kept: List[str] = []
+        for keyword in sorted(set(keywords), key=len):
+            if not any(other in keyword for other in kept):
+                kept.append(keyword)
+        return kept
+
     def is_relevant(self, repo: Dict) -> bool:
         """Check if repo is relevant to low-level vision tasks."""
         name = repo.get("name", "").lower()
@@ -294,19 +425,19 @@ class RelevanceFilter:
         text = f"{name} {description} {' '.join(topics)}"
 
         # Check excludes first
-        for keyword in self.exclude_keywords:
+        for keyword in self._exclude_scan:
             if keyword in text:
                 return False
 
         # Check strong keywords
-        for keyword in self.strong_keywords:
+        for keyword in self._strong_scan:
             if keyword in text:
                 return True
 
         # Check weak keywords with image context
-        has_image_context = any(ctx in text for ctx in ["image", "photo", "picture", "visual"])
+        has_image_context = any(ctx in text for ctx in self.IMAGE_CONTEXT_TERMS)
         if has_image_context:
-            for keyword in self.weak_keywords:
+            for keyword in self._weak_scan:
                 if keyword in text:
                     return True
 
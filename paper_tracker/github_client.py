@@ -1,17 +1,47 @@
 """GitHub API client with rate limiting."""
 
-import base64
+import binascii
 import json
+import sqlite3
+import threading
 import time
+import http.client
+import math
 import urllib.error
 import urllib.parse
 import urllib.request
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from http.client import IncompleteRead
-from typing import Dict, List, Optional
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
 from .config_loader import config
+from .http_cache import HTTPCache
+from .rate_limit import TokenBucket
+
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # orjson not installed, fall back to stdlib json
+
+
+def _json_loads(raw: bytes) -> Any:
+    """Deserialize UTF-8 JSON bytes (orjson if available)."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# Sentinel returned for conditional requests answered with 304 Not Modified
+UNCHANGED = object()
+
+# Shared clients keyed by token, see get_shared_client()
+_shared_clients: Dict[Optional[str], "GitHubClient"] = {}
+_shared_clients_lock = threading.Lock()
 
 
 @dataclass
@@ -23,69 +53,396 @@ class RateLimitInfo:
     used: int
 
 
+@dataclass
+class _TokenState:
+    """Rate limit view and request pacing of one token."""
+    token: Optional[str]
+    rate_limit: RateLimitInfo
+    core_bucket: TokenBucket
+    search_bucket: TokenBucket
+
+
+def _configured_tokens() -> List[Optional[str]]:
+    """Tokens from config, primary (github.token) first, then github.tokens; [None] if unset."""
+    tokens = [config.get("github.token"), *(config.get("github.tokens") or [])]
+    return list(dict.fromkeys(t for t in tokens if t)) or [None]
+
+
 class GitHubClient:
     """GitHub API client with proper rate limiting."""
 
     BASE_URL = "https://api.github.com"
+    GRAPHQL_URL = "https://api.github.com/graphql"
+    SEARCH_URL = f"{BASE_URL}/search/repositories?"
 
-    def __init__(self, token: Optional[str] = None):
-        self.token = token or config.get("github.token")
-        self.rate_limit = RateLimitInfo(
-            limit=60,
-            remaining=60,
-            reset_time=datetime.now(),
-            used=0
-        )
-        self._request_delay = config.get("search.request_delay", 1.5)
+    # Appended to every repository search query
+    SEARCH_QUALIFIERS = " in:name,description,readme stars:>={min_stars}"
+
+    # Repositories aliased into a single GraphQL query
+    GRAPHQL_BATCH_SIZE = 50
+    # README file names tried by graphql_readmes, in order (GraphQL paths are
+    # case-sensitive, unlike the REST /readme lookup)
+    GRAPHQL_README_NAMES = ("README.md", "readme.md", "Readme.md", "README.rst", "README")
+
+    # In-memory reuse of README / repo details responses (seconds, entries)
+    MEMO_TTL = 600
+    MEMO_SIZE = 2048
+
+    # Response bodies are read (and gunzipped) in chunks of this many bytes
+    READ_CHUNK_SIZE = 65536
+
+    # Redirects followed by _open (renamed or transferred repos answer 301)
+    REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+    MAX_REDIRECTS = 5
+
+    # Search pages fetched at once (search API allows 30 requests/min)
+    SEARCH_PAGE_WORKERS = 3
+    # Search API never returns more than this many results per query
+    SEARCH_MAX_RESULTS = 1000
+
+    def __init__(self, token: Optional[str] = None, tokens: Optional[List[str]] = None):
+        """Create a client for one token, or rotating over several.
+
+        Args:
+            token: GitHub token (defaults to the configured tokens)
+            tokens: Several tokens; each request uses the one with the most
+                remaining rate limit. The first is the primary token.
+        """
+        if not tokens:
+            tokens = [token] if token else _configured_tokens()
+        self._token_states = [self._new_token_state(t) for t in tokens]
+        self.token = tokens[0]
         self._rate_limit_buffer = config.get("search.rate_limit_buffer", 10)
+        # Bounds concurrent requests when the client is shared across threads
+        self._request_slots = threading.BoundedSemaphore(
+            config.get("search.max_concurrent_requests", 8)
+        )
+        # Keeps each token's RateLimitInfo consistent when responses from
+        # several threads update it at once
+        self._rate_limit_lock = threading.Lock()
+        # Per-thread keep-alive connections (host -> connection), see _open
+        self._local = threading.local()
+        # Proxies (HTTPS_PROXY etc.) are only honoured by urllib
+        self._proxied = bool(urllib.request.getproxies())
+
+        # ETag cache for README / repo details lookups (unset path disables it);
+        # relative paths are resolved against the project root, next to data/
+        self.http_cache: Optional[HTTPCache] = None
+        http_cache_path = config.get("search.http_cache_path")
+        if http_cache_path:
+            try:
+                self.http_cache = HTTPCache(Path(__file__).parent.parent / http_cache_path)
+            except (sqlite3.Error, OSError) as e:
+                print(f"Warning: HTTP cache disabled: {e}")
+
+        # URL -> (fetched at, response) for _fetch_memoized
+        self._memo: Dict[str, Tuple[float, Any]] = {}
+
+    @staticmethod
+    def _new_token_state(token: Optional[str]) -> _TokenState:
+        """Fresh rate limit state for a token.
+
+        The buckets pace REST and search requests; their rates follow the
+        live rate-limit headers once responses arrive (see _update_rate_limit).
+        """
+        core_limit, search_limit = (5000, 30) if token else (60, 10)
+        return _TokenState(
+            token=token,
+            rate_limit=RateLimitInfo(
+                limit=60,
+                remaining=60,
+                reset_time=datetime.now(),
+                used=0
+            ),
+            core_bucket=TokenBucket(core_limit, core_limit / 3600),
+            search_bucket=TokenBucket(search_limit, search_limit / 60),
+        )
 
-    def _get_headers(self) -> Dict[str, str]:
-        """Get request headers."""
+    @property
+    def rate_limit(self) -> RateLimitInfo:
+        """Rate limit of the token with the most requests left."""
+        return self._pick_token().rate_limit
+
+    def _pick_token(self) -> _TokenState:
+        """Token with the most requests left."""
+        if len(self._token_states) == 1:
+            return self._token_states[0]
+        return max(self._token_states, key=self._requests_left)
+
+    @staticmethod
+    def _requests_left(state: _TokenState) -> int:
+        """Requests a token has left (a token past its reset counts as full)."""
+        if state.rate_limit.reset_time <= datetime.now():
+            return state.rate_limit.limit
+        return state.rate_limit.remaining
+
+    def _get_headers(self, state: Optional[_TokenState] = None) -> Dict[str, str]:
+        """Get request headers (authenticated with state's token, default the first)."""
+        token = (state or self._token_states[0]).token
         headers = {
             "Accept": "application/vnd.github.v3+json",
-            "User-Agent": "PaperTracker/1.0"
+            "User-Agent": "PaperTracker/1.0",
+            "Accept-Encoding": "gzip",
         }
-        if self.token:
-            headers["Authorization"] = f"token {self.token}"
+        if token:
+            headers["Authorization"] = f"token {token}"
         return headers
 
-    def _update_rate_limit(self, response):
-        """Update rate limit info from response headers."""
-        self.rate_limit.limit = int(response.headers.get("X-RateLimit-Limit", 60))
-        self.rate_limit.remaining = int(response.headers.get("X-RateLimit-Remaining", 60))
+    def _update_rate_limit(self, response, state: _TokenState):
+        """Update a token's rate limit info and request pacing from response headers."""
+        resource = response.headers.get("X-RateLimit-Resource")
+        # GraphQL has its own point budget, don't mix it into the REST limit
+        if resource == "graphql":
+            return
+        limit = int(response.headers.get("X-RateLimit-Limit", 60))
+        remaining = int(response.headers.get("X-RateLimit-Remaining", 60))
         reset_timestamp = int(response.headers.get("X-RateLimit-Reset", 0))
-        if reset_timestamp:
-            self.rate_limit.reset_time = datetime.fromtimestamp(reset_timestamp)
-        self.rate_limit.used = self.rate_limit.limit - self.rate_limit.remaining
 
-    def _wait_for_rate_limit(self):
-        """Wait if rate limit is low."""
-        if self.rate_limit.remaining < self._rate_limit_buffer:
-            wait_seconds = (self.rate_limit.reset_time - datetime.now()).total_seconds()
+        rate_limit = state.rate_limit
+        with self._rate_limit_lock:
+            rate_limit.limit = limit
+            rate_limit.remaining = remaining
+            if reset_timestamp:
+                rate_limit.reset_time = datetime.fromtimestamp(reset_timestamp)
+            rate_limit.used = limit - remaining
+        if reset_timestamp:
+            bucket = state.search_bucket if resource == "search" else state.core_bucket
+            bucket.set_budget(remaining, reset_timestamp - time.time())
+
+    def _bucket_for(self, url: str, state: _TokenState) -> Optional[TokenBucket]:
+        """Token bucket pacing requests to url (None for GraphQL, which has its own budget)."""
+        if url == self.GRAPHQL_URL:
+            return None
+        if url.startswith(self.SEARCH_URL):
+            return state.search_bucket
+        return state.core_bucket
+
+    def _wait_for_rate_limit(self, state: _TokenState):
+        """Wait if the token's rate limit is low."""
+        rate_limit = state.rate_limit
+        if rate_limit.remaining < self._rate_limit_buffer:
+            wait_seconds = (rate_limit.reset_time - datetime.now()).total_seconds()
             if wait_seconds > 0:
-                print(f"Rate limit low ({self.rate_limit.remaining} remaining). "
+                print(f"Rate limit low ({rate_limit.remaining} remaining). "
                       f"Waiting {wait_seconds:.0f}s until reset...")
                 time.sleep(wait_seconds + 1)
 
+    def _open(self, url: str, data: Optional[bytes], headers: Dict[str, str]):
+        """Send a request over this thread's persistent connection to the host.
+
+        Behaves like urllib.request.urlopen: follows up to MAX_REDIRECTS
+        redirects, returns the response for 2xx and raises
+        urllib.error.HTTPError otherwise. Unlike urlopen, the TLS connection
+        is reused across calls instead of reopened every time.
+        """
+        if self._proxied:
+            req = urllib.request.Request(url, data=data, headers=headers)
+            return urllib.request.urlopen(req, timeout=60)
+
+        for _ in range(self.MAX_REDIRECTS + 1):
+            response = self._send(url, data, headers)
+            if response.status not in self.REDIRECT_STATUSES:
+                break
+            response.read()  # Drain so the connection can be reused
+            location = response.headers.get("Location")
+            if not location:
+                break
+            next_url = urllib.parse.urljoin(url, location)
+            # Like urlopen, a POST redirected with 301/302/303 becomes a GET
+            if data is not None and response.status in (301, 302, 303):
+                data = None
+                headers = {k: v for k, v in headers.items() if k != "Content-Type"}
+            # Don't hand the token to another host
+            if urllib.parse.urlsplit(next_url).netloc != urllib.parse.urlsplit(url).netloc:
+                headers = {k: v for k, v in headers.items() if k != "Authorization"}
+            url = next_url
+
+        if not 200 <= response.status < 300:
+            response.read()  # Drain so the connection can be reused
+            raise urllib.error.HTTPError(url, response.status, response.reason, response.headers, None)
+        return response
+
+    def _send(self, url: str, data: Optional[bytes], headers: Dict[str, str]):
+        """Send one request over this thread's persistent connection to the host.
+
+        Returns the response whatever its status; the caller must read it
+        before the connection is used again.
+        """
+        parts = urllib.parse.urlsplit(url)
+        path = f"{parts.path}?{parts.query}" if parts.query else parts.path
+        method = "GET" if data is None else "POST"
+
+        connections = getattr(self._local, "connections", None)
+        if connections is None:
+            connections = self._local.connections = {}
+        conn = connections.get(parts.netloc)
+
+        while True:
+            reused = conn is not None
+            if not reused:
+                conn_class = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+                conn = connections[parts.netloc] = conn_class(parts.netloc, timeout=60)
+            try:
+                conn.request(method, path, body=data, headers=headers)
+                response = conn.getresponse()
+                break
+            except (http.client.RemoteDisconnected, http.client.ImproperConnectionState,
+                    ConnectionResetError, BrokenPipeError):
+                self._drop_connection(url)
+                if not reused:
+                    raise
+                conn = None  # Idle connection was dropped or left unusable, retry on a new one
+            except Exception:
+                self._drop_connection(url)
+                raise
+        return response
+
+    def _drop_connection(self, url: str):
+        """Close and forget this thread's connection to the url's host."""
+        connections = getattr(self._local, "connections", {})
+        conn = connections.pop(urllib.parse.urlsplit(url).netloc, None)
+        if conn is not None:
+            conn.close()
+
+    def _read_body(self, response) -> bytearray:
+        """Read a response body in chunks, gunzipping each chunk as it arrives.
+
+        Compressed chunks are dropped once inflated, so the whole compressed
+        body is never held next to the decompressed one. On IncompleteRead,
+        e.partial is replaced with everything decoded so far.
+        """
+        inflater = None
+        if response.headers.get("Content-Encoding") == "gzip":
+            inflater = zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+        body = bytearray()
+        try:
+            while chunk := response.read(self.READ_CHUNK_SIZE):
+                body += inflater.decompress(chunk) if inflater else chunk
+        except IncompleteRead as e:
+            if e.partial:
+                try:
+                    body += inflater.decompress(e.partial) if inflater else e.partial
+                except zlib.error:
+                    pass
+            e.partial = bytes(body)
+            raise
+
+        if inflater:
+            body += inflater.flush()
+        return body
+
     def _request(self, url: str, max_retries: int = 3) -> Optional[Dict]:
         """Make request with rate limiting and retries."""
-        self._wait_for_rate_limit()
+        result, _ = self._request_with_etag(url, max_retries=max_retries)
+        return result
+
+    def _request_cached(self, url: str) -> Optional[Dict]:
+        """GET url, revalidating the copy in the HTTP cache with its ETag.
+
+        On 304 the cached body is returned without counting against the
+        rate limit; on 200 the new body and ETag replace the cached ones.
+        """
+        if self.http_cache is None:
+            return self._request(url)
+
+        cached = self.http_cache.get(url)
+        result, etag = self._request_with_etag(url, etag=cached[0] if cached else None)
+        if result is UNCHANGED:
+            return cached[1]
+        if result is not None and etag:
+            self.http_cache.put(url, etag, result)
+        return result
+
+    def _fetch_memoized(self, url: str) -> Optional[Dict]:
+        """GET url through the HTTP cache, reusing responses fetched in the last MEMO_TTL seconds.
+
+        Repos found under several keywords or re-checked in the same run then
+        cost no request. The returned dict may be
+        shared between calls and must not be modified.
+        """
+        now = time.monotonic()
+        hit = self._memo.get(url)
+        if hit is not None and now - hit[0] < self.MEMO_TTL:
+            return hit[1]
+
+        result = self._request_cached(url)
+        if result is not None:
+            if len(self._memo) >= self.MEMO_SIZE:
+                self._memo.clear()
+            self._memo[url] = (now, result)
+        return result
+
+    def _request_with_etag(
+        self,
+        url: str,
+        etag: Optional[str] = None,
+        max_retries: int = 3
+    ) -> Tuple[Any, Optional[str]]:
+        """Make a conditional request and return (result, etag).
+
+        If etag is given it is sent as If-None-Match. A 304 response
+        returns (UNCHANGED, etag) and does not count against the rate limit.
+        """
+        with self._request_slots:
+            return self._request_unbounded(url, max_retries, etag)
 
-        headers = self._get_headers()
-        req = urllib.request.Request(url, headers=headers)
+    def _request_unbounded(
+        self,
+        url: str,
+        max_retries: int,
+        etag: Optional[str] = None,
+        data: Optional[bytes] = None,
+        state: Optional[_TokenState] = None
+    ) -> Tuple[Any, Optional[str]]:
+        """Make request with rate limiting and retries (no concurrency cap).
+
+        If data is given the request is a JSON POST. The request uses the
+        token with the most requests left and moves on to another token
+        when that one is rate limited, unless state pins a token.
+        """
+        pinned = state is not None
+        state = state or self._pick_token()
+        # Pinned requests are rate limit checks, which don't count against
+        # the limit and must not wait out a parked token's reset
+        if not pinned:
+            self._wait_for_rate_limit(state)
+
+        extra_headers = {}
+        if etag:
+            extra_headers["If-None-Match"] = etag
+        if data is not None:
+            extra_headers["Content-Type"] = "application/json"
+        headers = {**self._get_headers(state), **extra_headers}
 
         for attempt in range(max_retries):
+            bucket = self._bucket_for(url, state)
+            if bucket is not None:
+                bucket.acquire()
             try:
-                with urllib.request.urlopen(req, timeout=60) as response:
-                    self._update_rate_limit(response)
-                    return json.loads(response.read().decode())
+                with self._open(url, data, headers) as response:
+                    self._update_rate_limit(response, state)
+                    body = self._read_body(response)
+                    return _json_loads(body), response.headers.get("ETag")
 
             except urllib.error.HTTPError as e:
-                if e.code == 403:
+                if e.code == 304:
+                    return UNCHANGED, etag
+
+                elif e.code == 403:
                     # Rate limited - wait and retry
                     reset_header = e.headers.get("X-RateLimit-Reset")
                     if reset_header:
                         reset_time = datetime.fromtimestamp(int(reset_header))
+                        # Park this token until reset and retry with another
+                        with self._rate_limit_lock:
+                            state.rate_limit.remaining = 0
+                            state.rate_limit.reset_time = reset_time
+                        other = self._pick_token()
+                        if not pinned and other is not state and self._requests_left(other) > 0:
+                            state = other
+                            headers = {**self._get_headers(state), **extra_headers}
+                            continue
                         wait_seconds = (reset_time - datetime.now()).total_seconds()
                         if wait_seconds > 0 and wait_seconds < 3600:
                             print(f"Rate limited. Waiting {wait_seconds:.0f}s...")
@@ -101,10 +458,10 @@ class GitHubClient:
                         continue
 
                     print(f"Rate limit error: {e}")
-                    return None
+                    return None, None
 
                 elif e.code == 404:
-                    return None
+                    return None, None
 
                 elif e.code >= 500:
                     # Server error - retry
@@ -115,7 +472,7 @@ class GitHubClient:
 
                 else:
                     print(f"HTTP error {e.code}: {e.reason}")
-                    return None
+                    return None, None
 
             except urllib.error.URLError as e:
                 wait_time = 2 ** attempt
@@ -124,16 +481,18 @@ class GitHubClient:
                 continue
 
             except (TimeoutError, OSError) as e:
+                self._drop_connection(url)
                 wait_time = 2 ** attempt
                 print(f"Timeout/connection error: {e}. Retrying in {wait_time}s...")
                 time.sleep(wait_time)
                 continue
 
             except IncompleteRead as e:
+                self._drop_connection(url)
                 # Handle truncated response - try to use partial data
                 if e.partial:
                     try:
-                        return json.loads(e.partial.decode())
+                        return _json_loads(e.partial), None
                     except (json.JSONDecodeError, UnicodeDecodeError):
                         pass
                 # Retry on next attempt
@@ -142,7 +501,15 @@ class GitHubClient:
                 time.sleep(wait_time)
                 continue
 
-        return None
+            except http.client.HTTPException as e:
+                # Malformed response; drop the connection and retry
+                self._drop_connection(url)
+                wait_time = 2 ** attempt
+                print(f"Protocol error: {e}. Retrying in {wait_time}s...")
+                time.sleep(wait_time)
+                continue
+
+        return None, None
 
     def search_repos(
         self,
@@ -150,7 +517,8 @@ class GitHubClient:
         min_stars: int = 10,
         per_page: int = 30,
         page: int = 1,
-        sort: str = ""
+        sort: str = "",
+        exclude: Optional[List[str]] = None
     ) -> tuple[List[Dict], int]:
         """Search GitHub repositories with pagination.
 
@@ -160,71 +528,223 @@ class GitHubClient:
             per_page: Results per page (max 100)
             page: Page number (1-indexed)
             sort: Sort order - "" (relevance/best match), "stars", or "updated"
+            exclude: owner/repo names to leave out (sent as -repo: qualifiers)
 
         Returns:
             Tuple of (items list, total_count)
         """
         # Don't auto-wrap in quotes - let GitHub match all words naturally
         # User can manually add quotes if they want exact phrase matching
-        full_query = f"{query} in:name,description,readme stars:>={min_stars}"
-        encoded_query = urllib.parse.quote(full_query)
+        full_query = query + self.SEARCH_QUALIFIERS.format(min_stars=min_stars)
+        if exclude:
+            full_query += "".join(f" -repo:{full_name}" for full_name in exclude)
 
         # Build URL with pagination
-        url = f"{self.BASE_URL}/search/repositories?q={encoded_query}&per_page={min(per_page, 100)}&page={page}"
+        params = {"q": full_query, "per_page": min(per_page, 100), "page": page}
         if sort:
-            url += f"&sort={sort}&order=desc"
+            params["sort"] = sort
+            params["order"] = "desc"
+        url = self.SEARCH_URL + urllib.parse.urlencode(params, quote_via=urllib.parse.quote)
 
         result = self._request(url)
-        time.sleep(self._request_delay)
 
         if result:
             return result.get("items", []), result.get("total_count", 0)
         return [], 0
 
+    def search_repos_pages(
+        self,
+        query: str,
+        min_stars: int = 10,
+        per_page: int = 100,
+        pages: int = 1,
+        sort: str = "",
+        exclude: Optional[List[str]] = None
+    ) -> tuple[List[Dict], int]:
+        """Search GitHub repositories, fetching several pages concurrently.
+
+        Page 1 is fetched first so no requests are spent on pages past
+        total_count; the remaining pages are fetched in parallel.
+
+        Args:
+            query: Search query
+            min_stars: Minimum stars filter
+            per_page: Results per page (max 100)
+            pages: Maximum number of pages to fetch
+            sort: Sort order - "" (relevance/best match), "stars", or "updated"
+            exclude: owner/repo names to leave out (sent as -repo: qualifiers)
+
+        Returns:
+            Tuple of (items from all pages deduplicated by full_name, total_count)
+        """
+        per_page = min(per_page, 100)
+        items, total_count = self.search_repos(query, min_stars, per_page, 1, sort, exclude)
+        available = math.ceil(min(total_count, self.SEARCH_MAX_RESULTS) / per_page)
+        pages = min(pages, available)
+        if pages <= 1:
+            return items, total_count
+
+        with ThreadPoolExecutor(max_workers=min(pages - 1, self.SEARCH_PAGE_WORKERS)) as executor:
+            rest = executor.map(
+                lambda page: self.search_repos(query, min_stars, per_page, page, sort, exclude)[0],
+                range(2, pages + 1),
+            )
+            # Results can shift between pages while paginating
+            seen = {item.get("full_name") for item in items}
+            for page_items in rest:
+                for item in page_items:
+                    full_name = item.get("full_name")
+                    if full_name not in seen:
+                        seen.add(full_name)
+                        items.append(item)
+        return items, total_count
+
     def get_readme(self, owner: str, repo: str) -> str:
         """Fetch README content from a repository."""
-        url = f"{self.BASE_URL}/repos/{owner}/{repo}/readme"
-        result = self._request(url)
-        time.sleep(self._request_delay)
-
-        if not result:
-            return ""
+        return self._decode_readme(self._fetch_memoized(f"{self.BASE_URL}/repos/{owner}/{repo}/readme"))
 
-        content = result.get("content", "")
+    @staticmethod
+    def _decode_readme(result: Optional[Dict]) -> str:
+        """Decode the base64 content of a README API response ("" on failure)."""
+        content = (result or {}).get("content", "")
         if content:
             try:
-                return base64.b64decode(content).decode("utf-8", errors="ignore")
+                # a2b_base64 takes the str as-is (skipping b64decode's ASCII
+                # copy) and ignores the embedded newlines
+                return binascii.a2b_base64(content).decode("utf-8", errors="ignore")
             except Exception:
                 return ""
         return ""
 
-    def get_repo_details(self, owner: str, repo: str) -> Optional[Dict]:
-        """Get detailed repository information."""
-        url = f"{self.BASE_URL}/repos/{owner}/{repo}"
-        result = self._request(url)
-        time.sleep(self._request_delay)
+    def get_readme_with_etag(
+        self,
+        owner: str,
+        repo: str,
+        etag: Optional[str] = None
+    ) -> Tuple[Any, Optional[str]]:
+        """Fetch README content, skipping the download if it is unchanged.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            etag: ETag from a previous fetch, sent as If-None-Match
+
+        Returns:
+            Tuple of (content, etag). Content is UNCHANGED if the README
+            has not changed since etag, or "" if it could not be fetched.
+        """
+        url = f"{self.BASE_URL}/repos/{owner}/{repo}/readme"
+        result, new_etag = self._request_with_etag(url, etag=etag)
+
+        if result is UNCHANGED:
+            return UNCHANGED, new_etag
+
+        readme = self._decode_readme(result)
+        return readme, new_etag if readme else None
+
+    def graphql(self, query: str, variables: Optional[Dict] = None) -> Optional[Dict]:
+        """Run a GraphQL query and return the response ({"data": ..., "errors": ...}).
+
+        The GraphQL API requires a token. Returns None if the request failed.
+        """
+        payload = {"query": query}
+        if variables:
+            payload["variables"] = variables
+        with self._request_slots:
+            result, _ = self._request_unbounded(
+                self.GRAPHQL_URL, 3, data=json.dumps(payload).encode()
+            )
         return result
 
+    def graphql_readmes(self, repos: List[str]) -> Dict[str, str]:
+        """Fetch READMEs for many repositories with batched GraphQL queries.
+
+        Each batch of GRAPHQL_BATCH_SIZE repos costs one request instead of
+        one REST call per repo. The GraphQL API requires a token.
+
+        Args:
+            repos: Repository identifiers (e.g., "owner/repo")
+
+        Returns:
+            Dict mapping repo to README text. Repos that are missing, have
+            none of GRAPHQL_README_NAMES at HEAD, or failed are left out so
+            callers can fall back to get_readme().
+        """
+        readmes: Dict[str, str] = {}
+        if not self.token:
+            return readmes
+
+        valid = [r for r in repos if r.count("/") == 1]
+        blobs = " ".join(
+            f'f{j}: object(expression: {json.dumps("HEAD:" + name)}) {{ ... on Blob {{ text }} }}'
+            for j, name in enumerate(self.GRAPHQL_README_NAMES)
+        )
+        for start in range(0, len(valid), self.GRAPHQL_BATCH_SIZE):
+            batch = valid[start:start + self.GRAPHQL_BATCH_SIZE]
+            fields = []
+            for i, full_name in enumerate(batch):
+                owner, name = full_name.split("/")
+                fields.append(
+                    f"r{i}: repository(owner: {json.dumps(owner)}, name: {json.dumps(name)}) {{ {blobs} }}"
+                )
+            result = self.graphql("query { " + " ".join(fields) + " }")
+
+            # Missing repos come back as null alongside an "errors" list
+            data = (result or {}).get("data") or {}
+            for i, full_name in enumerate(batch):
+                repo = data.get(f"r{i}") or {}
+                for j in range(len(self.GRAPHQL_README_NAMES)):
+                    text = (repo.get(f"f{j}") or {}).get("text")
+                    if text:
+                        readmes[full_name] = text
+                        break
+
+        return readmes
+
+    def get_repo_details(self, owner: str, repo: str) -> Optional[Dict]:
+        """Get detailed repository information (shared dict, do not modify)."""
+        return self._fetch_memoized(f"{self.BASE_URL}/repos/{owner}/{repo}")
+
     def get_rate_limit_status(self) -> RateLimitInfo:
-        """Get current rate limit status."""
+        """Get current rate limit status (of the token with the most requests left)."""
+        for state in self._token_states:
+            self._refresh_rate_limit(state)
+        return self.rate_limit
+
+    def _refresh_rate_limit(self, state: _TokenState):
+        """Update a token's core rate limit from the /rate_limit endpoint."""
         url = f"{self.BASE_URL}/rate_limit"
-        result = self._request(url)
+        with self._request_slots:
+            result, _ = self._request_unbounded(url, 3, state=state)
         if result:
             core = result.get("resources", {}).get("core", {})
-            self.rate_limit.limit = core.get("limit", 60)
-            self.rate_limit.remaining = core.get("remaining", 60)
             reset_timestamp = core.get("reset", 0)
-            if reset_timestamp:
-                self.rate_limit.reset_time = datetime.fromtimestamp(reset_timestamp)
-        return self.rate_limit
+            with self._rate_limit_lock:
+                state.rate_limit.limit = core.get("limit", 60)
+                state.rate_limit.remaining = core.get("remaining", 60)
+                if reset_timestamp:
+                    state.rate_limit.reset_time = datetime.fromtimestamp(reset_timestamp)
 
     def verify_token(self) -> dict:
-        """Verify token and return status info.
+        """Verify the primary token and return status info.
 
         Returns:
             Dict with: valid, authenticated, limit, remaining, reset_time
         """
-        info = self.get_rate_limit_status()
+        return self._token_status(self._token_states[0])
+
+    def verify_tokens(self) -> List[dict]:
+        """Verify every token the client rotates over.
+
+        Returns:
+            List with one verify_token()-style dict per token, primary first
+        """
+        return [self._token_status(state) for state in self._token_states]
+
+    def _token_status(self, state: _TokenState) -> dict:
+        """Refresh a token's rate limit and describe it (see verify_token)."""
+        self._refresh_rate_limit(state)
+        info = state.rate_limit
         is_authenticated = info.limit > 60  # 60 is unauthenticated limit
 
         return {
@@ -234,3 +754,20 @@ class GitHubClient:
             "remaining": info.remaining,
             "reset_time": info.reset_time.isoformat() if info.reset_time else None,
         }
+
+
+def get_shared_client(token: Optional[str] = None) -> GitHubClient:
+    """Get the process-wide client for a token, creating it on first use.
+
+    Sharing one client keeps a single rate limit view and request
+    semaphore for all components that talk to GitHub. Without a token, or
+    with one of the configured tokens, this is the client rotating over all
+    configured tokens.
+    """
+    if token in _configured_tokens():
+        token = None
+    with _shared_clients_lock:
+        client = _shared_clients.get(token)
+        if client is None:
+            client = _shared_clients[token] = GitHubClient(token)
+        return client
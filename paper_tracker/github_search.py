@@ -5,14 +5,39 @@ Provides stateless search functionality that can be used independently
 from the main PaperTracker for web UI searches.
 """
 
+import heapq
 import json
+import math
+import operator
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
-from .github_client import GitHubClient
+from .config_loader import config
+from .github_client import GitHubClient, get_shared_client
 from .detectors import WeightDetector, ConferenceDetector
+from .models import RepoRow
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # orjson not installed, fall back to stdlib json
+
+
+def _json_line(data: Any) -> bytes:
+    """Serialize to one compact line of UTF-8 JSON (orjson if available)."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(data, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def _json_loads(raw: bytes) -> Any:
+    """Deserialize UTF-8 JSON bytes (orjson if available)."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
 # Search templates for quick preset searches
@@ -50,7 +75,7 @@ SEARCH_TEMPLATES = {
 }
 
 # Default path for search results
-SEARCH_RESULTS_PATH = Path(__file__).parent.parent / "data" / "search_results.json"
+SEARCH_RESULTS_PATH = Path(__file__).parent.parent / "data" / "search_results.jsonl"
 
 
 def build_search_query(keyword: str, conferences: list, year: str) -> str:
@@ -66,6 +91,58 @@ def build_search_query(keyword: str, conferences: list, year: str) -> str:
     return " ".join(parts)
 
 
+# GitHub rejects search queries longer than 256 characters or with more
+# than five AND/OR/NOT operators. Qualifiers (in:, stars:, -repo:) don't
+# count toward the length, so only the query text is budgeted; OR
+# separators are counted anyway to stay on the safe side.
+SEARCH_QUERY_MAX_LENGTH = 256
+SEARCH_QUERY_MAX_OPERATORS = 5
+# Already-found repos excluded from later queries with -repo: qualifiers
+SEARCH_EXCLUDE_LIMIT = 20
+
+
+def build_batched_queries(keywords: list[str], conferences: list, year: str) -> list[tuple[str, list[str]]]:
+    """Group keywords into OR-joined queries sharing the conference/year filters.
+
+    Example: '"image denoising" OR deblurring OR inpainting ECCV 2024'
+
+    Multi-word keywords are quoted so OR applies to whole phrases; a batch
+    holding a single keyword is built by build_search_query() unchanged.
+    Results of a batched query can't be attributed to the keyword that
+    matched them - re-match name/description client-side if that matters.
+
+    Returns:
+        List of (query, keywords in that query) tuples
+    """
+    filters = build_search_query("", conferences, year)
+    budget = SEARCH_QUERY_MAX_LENGTH - len(filters)
+
+    batches = []
+    batch, length = [], 0
+    for keyword in keywords:
+        keyword = keyword.strip()
+        if not keyword:
+            continue
+        term = f'"{keyword}"' if " " in keyword and not keyword.startswith('"') else keyword
+        if batch and (len(batch) > SEARCH_QUERY_MAX_OPERATORS
+                      or length + len(" OR ") + len(term) > budget):
+            batches.append(batch)
+            batch, length = [], 0
+        length += len(term) + (len(" OR ") if batch else 0)
+        batch.append((keyword, term))
+    if batch:
+        batches.append(batch)
+
+    queries = []
+    for batch in batches:
+        if len(batch) == 1:
+            query = build_search_query(batch[0][0], conferences, year)
+        else:
+            query = " OR ".join(term for _, term in batch) + filters
+        queries.append((query, [keyword for keyword, _ in batch]))
+    return queries
+
+
 class GitHubSearcher:
     """Stateless GitHub search for web UI.
 
@@ -81,10 +158,75 @@ class GitHubSearcher:
                    If not provided, uses GITHUB_TOKEN env var.
         """
         self.token = token or os.environ.get("GITHUB_TOKEN")
-        self.github = GitHubClient(self.token)
+        self.github = get_shared_client(self.token)
         self.weight_detector = WeightDetector()
         self.conference_detector = ConferenceDetector()
 
+    def _iter_readmes(self, full_names: list[str]):
+        """Yield the README of each owner/repo in order.
+
+        With a token, READMEs come from one GraphQL request per
+        GRAPHQL_BATCH_SIZE repos; repos with none of GRAPHQL_README_NAMES at
+        HEAD (e.g. a README.txt) fall back to REST. REST fetches run
+        concurrently - the shared client caps in-flight requests, so the
+        pool only hides round-trip latency. All fetching happens on the
+        pool, so the next batch downloads while the caller runs detection
+        on this one.
+        """
+        executor = ThreadPoolExecutor(
+            max_workers=config.get("search.max_concurrent_requests", 8)
+        )
+
+        def fetch(full_name):
+            return self.github.get_readme(*full_name.split("/"))
+
+        try:
+            if not self.github.token:
+                yield from executor.map(fetch, full_names)
+                return
+
+            batch_size = self.github.GRAPHQL_BATCH_SIZE
+            batches = [full_names[i:i + batch_size] for i in range(0, len(full_names), batch_size)]
+            if not batches:
+                return
+            pending = executor.submit(self.github.graphql_readmes, batches[0])
+            for index, batch in enumerate(batches):
+                prefetched = pending.result()
+                if index + 1 < len(batches):
+                    pending = executor.submit(self.github.graphql_readmes, batches[index + 1])
+                # Fallbacks are started together and consumed in batch order
+                fallback = executor.map(fetch, [n for n in batch if n not in prefetched])
+                for full_name in batch:
+                    yield prefetched[full_name] if full_name in prefetched else next(fallback)
+        finally:
+            # Consumer may stop early (e.g. a cancelled UI search)
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _search_batch(
+        self,
+        query: str,
+        batch: list[str],
+        min_stars: int,
+        max_results_per_keyword: int,
+        sort: str = "",
+        exclude: Optional[list[str]] = None,
+    ) -> list[dict]:
+        """Fetch up to max_results_per_keyword results per keyword of a batched query.
+
+        A batch can ask for more than the 100 results of a single page, so
+        as many pages as needed are fetched.
+        """
+        max_results = max_results_per_keyword * len(batch)
+        repos, _ = self.github.search_repos_pages(
+            query=query,
+            min_stars=min_stars,
+            per_page=min(max_results, 100),
+            pages=math.ceil(max_results / 100),
+            sort=sort,
+            exclude=exclude,
+        )
+        return repos[:max_results]
+
     def search_fast(
         self,
         keywords: list[str],
@@ -97,6 +239,10 @@ class GitHubSearcher:
 
         Fetches all results for all keywords, combines and deduplicates them,
         then sorts by stars (descending) for relevance. UI handles pagination.
+        Keywords are sent as OR-batched queries (see build_batched_queries),
+        so results are not attributed to individual keywords. The most-starred
+        repos already found are excluded from later queries, so overlapping
+        hits don't use up their result slots.
 
         Args:
             keywords: List of search terms
@@ -104,50 +250,52 @@ class GitHubSearcher:
             year: Year to include in query (e.g., "2024")
             min_stars: Minimum stars filter
             max_results_per_keyword: Max results to fetch per keyword from GitHub API
+                (scaled by the keywords in each batched query)
 
         Returns:
             List of repo dicts (combined, deduplicated, sorted by stars)
         """
         conferences = conferences or []
-        results = []
+        rows = []
         seen = set()
-
-        for keyword in keywords:
-            keyword = keyword.strip()
-            if not keyword:
-                continue
-
-            # Build optimized query with conference and year
-            query = build_search_query(keyword, conferences, year)
-
-            repos, _ = self.github.search_repos(
-                query=query,
-                min_stars=min_stars,
-                per_page=max_results_per_keyword,
-                page=1,
-                sort=""
+        exclude = []
+        by_stars = operator.attrgetter("stars")
+        # Bound once for the per-repo loop
+        seen_add = seen.add
+        rows_append = rows.append
+
+        queries = build_batched_queries(keywords, conferences, year)
+        # A single query can be sorted by GitHub, which also makes its first
+        # pages the most-starred hits instead of the best matches
+        sort = "stars" if len(queries) == 1 else ""
+
+        # One search call per OR-batch of keywords, with conference and year
+        for query, batch in queries:
+            repos = self._search_batch(
+                query, batch, min_stars, max_results_per_keyword, sort=sort, exclude=exclude
             )
 
             for repo in repos:
-                full_name = repo.get("full_name", "")
+                try:
+                    full_name = repo["full_name"]
+                except KeyError:
+                    continue
                 if not full_name or full_name in seen:
                     continue
-                seen.add(full_name)
-
-                results.append({
-                    "full_name": full_name,
-                    "name": repo.get("name", ""),
-                    "url": repo.get("html_url", f"https://github.com/{full_name}"),
-                    "stars": repo.get("stargazers_count", 0),
-                    "description": (repo.get("description") or "")[:200],
-                    "weight_status": "Unknown",  # Not checked yet
-                    "created_at": (repo.get("created_at") or "")[:10],
-                    "updated_at": (repo.get("updated_at") or "")[:10],
-                })
-
-        # Sort by stars descending for relevance
-        results.sort(key=lambda x: x.get("stars", 0), reverse=True)
-        return results
+                seen_add(full_name)
+                rows_append(RepoRow.from_github_repo(repo, full_name))
+
+            # Top-starred hits are the ones every similar query returns again
+            exclude = [
+                row.full_name
+                for row in heapq.nlargest(SEARCH_EXCLUDE_LIMIT, rows, key=by_stars)
+            ]
+
+        # Sort by stars descending for relevance (already sorted by GitHub
+        # for a single query)
+        if not sort:
+            rows.sort(key=by_stars, reverse=True)
+        return [row.to_dict() for row in rows]
 
     def detect_weights_for_repo(self, full_name: str) -> dict:
         """Detect weights for a single repo by fetching its README.
@@ -167,6 +315,63 @@ class GitHubSearcher:
             "weight_details": weight_result.details[:3] if weight_result.details else [],
         }
 
+    def _detect_repo(
+        self,
+        repo_data: dict,
+        readme: str,
+        weight_filter: str,
+        conferences: list[str],
+        conference_year: Optional[str],
+    ) -> Optional[dict]:
+        """Run detection on one repo and build its result dict.
+
+        Returns:
+            Result dict, or None if the repo fails the weight, conference
+            or year filter
+        """
+        full_name = repo_data["full_name"]
+        owner, name = full_name.split("/")
+
+        # Detect weights
+        weight_result = self.weight_detector.detect(readme)
+        has_weights = weight_result.status != "None"
+
+        # Apply weight filter
+        if weight_filter == "has_weights" and not has_weights:
+            return None
+        if weight_filter == "no_weights" and has_weights:
+            return None
+
+        # Detect conference
+        description = repo_data.get("description", "") or ""
+        conf_result = self.conference_detector.detect(readme, description)
+
+        # Apply conference filter
+        if conferences:
+            if not conf_result.conference or conf_result.conference not in conferences:
+                return None
+
+        # Apply year filter
+        if conference_year:
+            if not conf_result.year or conf_result.year != conference_year:
+                return None
+
+        # Build result dict
+        return {
+            "full_name": full_name,
+            "name": repo_data.get("name", name),
+            "url": repo_data.get("html_url", f"https://github.com/{full_name}"),
+            "stars": repo_data.get("stargazers_count", 0),
+            "description": description[:200] if description else "",
+            "weight_status": weight_result.status if has_weights else "None",
+            "weight_details": weight_result.details[:3] if weight_result.details else [],
+            "conference": conf_result.conference or "",
+            "conference_year": conf_result.year or "",
+            "arxiv_id": conf_result.arxiv_id or "",
+            "created_at": repo_data.get("created_at", "")[:10],
+            "updated_at": repo_data.get("updated_at", "")[:10],
+        }
+
     def search(
         self,
         keywords: list[str],
@@ -178,6 +383,9 @@ class GitHubSearcher:
     ) -> list[dict]:
         """Search GitHub for repos matching criteria.
 
+        Keywords are sent as OR-batched queries (see build_batched_queries),
+        so results are not attributed to individual keywords.
+
         Args:
             keywords: List of search terms (e.g., ["image restoration", "super resolution"])
             conferences: Filter by conference (e.g., ["CVPR", "ECCV"]). Empty/None = all.
@@ -194,71 +402,33 @@ class GitHubSearcher:
             conference_year = None
 
         seen_repos = set()
+        seen_repos_add = seen_repos.add
         results = []
 
-        for keyword in keywords:
-            keyword = keyword.strip()
-            if not keyword:
-                continue
-
-            # Search GitHub
-            repos = self.github.search_repos(
-                query=keyword,
-                min_stars=min_stars,
-                max_results=max_results_per_keyword,
-                sort=""
-            )
+        for query, batch in build_batched_queries(keywords, [], None):
+            # Search GitHub (conference/year are filtered after detection)
+            repos = self._search_batch(query, batch, min_stars, max_results_per_keyword)
 
+            new_repos = []
+            new_repos_append = new_repos.append
             for repo_data in repos:
-                full_name = repo_data.get("full_name", "")
-                if not full_name or full_name in seen_repos:
-                    continue
-                seen_repos.add(full_name)
-
-                # Get README and run detection
-                owner, name = full_name.split("/")
-                readme = self.github.get_readme(owner, name)
-
-                # Detect weights
-                weight_result = self.weight_detector.detect(readme)
-                has_weights = weight_result.status != "None"
-
-                # Apply weight filter
-                if weight_filter == "has_weights" and not has_weights:
+                try:
+                    full_name = repo_data["full_name"]
+                except KeyError:
                     continue
-                if weight_filter == "no_weights" and has_weights:
+                if not full_name or full_name in seen_repos:
                     continue
-
-                # Detect conference
-                description = repo_data.get("description", "") or ""
-                conf_result = self.conference_detector.detect(readme, description)
-
-                # Apply conference filter
-                if conferences:
-                    if not conf_result.conference or conf_result.conference not in conferences:
-                        continue
-
-                # Apply year filter
-                if conference_year:
-                    if not conf_result.year or conf_result.year != conference_year:
-                        continue
-
-                # Build result dict
-                result = {
-                    "full_name": full_name,
-                    "name": repo_data.get("name", name),
-                    "url": repo_data.get("html_url", f"https://github.com/{full_name}"),
-                    "stars": repo_data.get("stargazers_count", 0),
-                    "description": description[:200] if description else "",
-                    "weight_status": weight_result.status if has_weights else "None",
-                    "weight_details": weight_result.details[:3] if weight_result.details else [],
-                    "conference": conf_result.conference or "",
-                    "conference_year": conf_result.year or "",
-                    "arxiv_id": conf_result.arxiv_id or "",
-                    "created_at": repo_data.get("created_at", "")[:10],
-                    "updated_at": repo_data.get("updated_at", "")[:10],
-                }
-                results.append(result)
+                seen_repos_add(full_name)
+                new_repos_append(repo_data)
+
+            # Get READMEs (concurrently) and run detection
+            readmes = self._iter_readmes([r["full_name"] for r in new_repos])
+            for repo_data, readme in zip(new_repos, readmes):
+                result = self._detect_repo(
+                    repo_data, readme, weight_filter, conferences, conference_year
+                )
+                if result is not None:
+                    results.append(result)
 
         # Keep GitHub's relevance order
         return results
@@ -288,80 +458,42 @@ class GitHubSearcher:
         # Phase 1: Gather all repo data from API (fast)
         all_repos = []
         seen_repos = set()
-        keywords_clean = [k.strip() for k in keywords if k.strip()]
+        # Bound once for the per-repo loop
+        seen_repos_add = seen_repos.add
+        all_repos_append = all_repos.append
+        queries = build_batched_queries(keywords, [], None)
 
-        for kw_idx, keyword in enumerate(keywords_clean):
-            yield None, kw_idx, len(keywords_clean), f"Fetching repos for '{keyword}'..."
+        for query_idx, (query, batch) in enumerate(queries):
+            names = ", ".join(f"'{keyword}'" for keyword in batch)
+            yield None, query_idx, len(queries), f"Fetching repos for {names}..."
 
-            repos = self.github.search_repos(
-                query=keyword,
-                min_stars=min_stars,
-                max_results=max_results_per_keyword,
-                sort=""
-            )
+            repos = self._search_batch(query, batch, min_stars, max_results_per_keyword)
 
             for repo_data in repos:
-                full_name = repo_data.get("full_name", "")
+                try:
+                    full_name = repo_data["full_name"]
+                except KeyError:
+                    continue
                 if full_name and full_name not in seen_repos:
-                    seen_repos.add(full_name)
-                    all_repos.append(repo_data)
+                    seen_repos_add(full_name)
+                    all_repos_append(repo_data)
 
         total = len(all_repos)
         if total == 0:
             return
 
-        # Phase 2: Process each repo (slow - fetches README)
-        for idx, repo_data in enumerate(all_repos):
-            full_name = repo_data.get("full_name", "")
-            owner, name = full_name.split("/")
-
-            # Get README and run detection
-            readme = self.github.get_readme(owner, name)
-
-            # Detect weights
-            weight_result = self.weight_detector.detect(readme)
-            has_weights = weight_result.status != "None"
-
-            # Apply weight filter
-            if weight_filter == "has_weights" and not has_weights:
-                yield None, idx + 1, total, f"Processing {idx + 1}/{total}..."
-                continue
-            if weight_filter == "no_weights" and has_weights:
+        # Phase 2: Process each repo (slow - fetches READMEs, concurrently)
+        readmes = self._iter_readmes([r["full_name"] for r in all_repos])
+        # Filtered-out repos only report progress every ~2% of the total
+        progress_stride = max(1, total // 50)
+        for idx, (repo_data, readme) in enumerate(zip(all_repos, readmes)):
+            result = self._detect_repo(
+                repo_data, readme, weight_filter, conferences, conference_year
+            )
+            if result is not None:
+                yield result, idx + 1, total, f"Processing {idx + 1}/{total}..."
+            elif (idx + 1) % progress_stride == 0 or idx + 1 == total:
                 yield None, idx + 1, total, f"Processing {idx + 1}/{total}..."
-                continue
-
-            # Detect conference
-            description = repo_data.get("description", "") or ""
-            conf_result = self.conference_detector.detect(readme, description)
-
-            # Apply conference filter
-            if conferences:
-                if not conf_result.conference or conf_result.conference not in conferences:
-                    yield None, idx + 1, total, f"Processing {idx + 1}/{total}..."
-                    continue
-
-            # Apply year filter
-            if conference_year:
-                if not conf_result.year or conf_result.year != conference_year:
-                    yield None, idx + 1, total, f"Processing {idx + 1}/{total}..."
-                    continue
-
-            # Build result dict
-            result = {
-                "full_name": full_name,
-                "name": repo_data.get("name", name),
-                "url": repo_data.get("html_url", f"https://github.com/{full_name}"),
-                "stars": repo_data.get("stargazers_count", 0),
-                "description": description[:200] if description else "",
-                "weight_status": weight_result.status if has_weights else "None",
-                "weight_details": weight_result.details[:3] if weight_result.details else [],
-                "conference": conf_result.conference or "",
-                "conference_year": conf_result.year or "",
-                "arxiv_id": conf_result.arxiv_id or "",
-                "created_at": repo_data.get("created_at", "")[:10],
-                "updated_at": repo_data.get("updated_at", "")[:10],
-            }
-            yield result, idx + 1, total, f"Processing {idx + 1}/{total}..."
 
     def search_single_query(
         self,
@@ -389,17 +521,113 @@ class GitHubSearcher:
         )
 
 
+def _meta_path(path: Path) -> Path:
+    """Sidecar metadata file for a results file (search_results.meta.json)."""
+    return path.with_suffix(".meta.json")
+
+
+def _write_meta(path: Path, query_info: dict, count: int):
+    """Rewrite the (small) metadata sidecar of a results file."""
+    meta = {
+        "last_search": datetime.now().isoformat(),
+        "query": query_info or {},
+        "count": count,
+    }
+    with open(_meta_path(path), "w") as f:
+        json.dump(meta, f, indent=2)
+
+
+def _replace_file(path: Path, lines):
+    """Write lines (bytes) to a temp file and swap it in, so a crash never leaves it partial."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.writelines(lines)
+    os.replace(tmp_path, path)
+
+
+def _migrate_legacy_results(path: Path):
+    """One-time conversion of search_results.json to the JSON-lines layout."""
+    legacy_path = path.with_suffix(".json")
+    if path.exists() or legacy_path == path or not legacy_path.exists():
+        return
+
+    with open(legacy_path, "r") as f:
+        data = json.load(f)
+    save_search_results(data.get("repos", []), data.get("query"), str(path))
+    legacy_path.unlink()
+
+
+class SearchResultsStore:
+    """Append-only JSON-lines results file with a persisted full_name index.
+
+    The .names sidecar holds one full_name per line, so appends dedup
+    against it instead of parsing every stored repo.
+    """
+
+    def __init__(self, path: str = None):
+        self.path = Path(path or SEARCH_RESULTS_PATH)
+        self.names_path = self.path.with_suffix(".names")
+        self._names: Optional[set] = None
+
+    @property
+    def names(self) -> set:
+        """full_names already stored (loaded on first use)."""
+        if self._names is None:
+            if not self.path.exists():
+                # An index left behind by deleted results would hide new repos
+                self.names_path.unlink(missing_ok=True)
+                self._names = set()
+            elif self.names_path.exists():
+                with open(self.names_path, "r") as f:
+                    self._names = set(f.read().split())
+            else:
+                # Results written before the index existed
+                with open(self.path, "rb") as f:
+                    self._names = {_json_loads(line)["full_name"] for line in f if line.strip()}
+                _replace_file(
+                    self.names_path, (f"{name}\n".encode("utf-8") for name in self._names)
+                )
+        return self._names
+
+    def add(self, repos: list[dict]) -> int:
+        """Append repos not stored yet; returns the number added."""
+        names = self.names
+        lines, new_names = [], []
+        for repo in repos:
+            full_name = repo["full_name"]
+            if full_name not in names:
+                names.add(full_name)
+                new_names.append(f"{full_name}\n")
+                lines.append(_json_line(repo))
+
+        if lines:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._append(self.path, lines)
+            self._append(self.names_path, [name.encode("utf-8") for name in new_names])
+        return len(lines)
+
+    @staticmethod
+    def _append(path: Path, lines: list[bytes]):
+        """Append lines and fsync once for the whole batch."""
+        with open(path, "ab") as f:
+            f.writelines(lines)
+            f.flush()
+            os.fsync(f.fileno())
+
+
 def save_search_results(
     repos: list[dict],
     query_info: dict = None,
     output_path: str = None
 ) -> str:
-    """Save search results to JSON file.
+    """Save search results as JSON lines (one repo per line).
+
+    Metadata (last_search, query, count) goes to a .meta.json sidecar.
 
     Args:
         repos: List of repo dicts from search
         query_info: Optional dict with query parameters used
-        output_path: Output file path (default: data/search_results.json)
+        output_path: Output file path (default: data/search_results.jsonl)
 
     Returns:
         Path to saved file
@@ -407,37 +635,41 @@ def save_search_results(
     output_path = Path(output_path or SEARCH_RESULTS_PATH)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    data = {
-        "last_search": datetime.now().isoformat(),
-        "query": query_info or {},
-        "count": len(repos),
-        "repos": repos
-    }
-
-    with open(output_path, "w") as f:
-        json.dump(data, f, indent=2)
+    # The index goes first: if the results are replaced but the new index
+    # is not, the missing index is rebuilt from the results on next use
+    names_path = SearchResultsStore(output_path).names_path
+    names_path.unlink(missing_ok=True)
+    _replace_file(output_path, (_json_line(repo) for repo in repos))
+    _replace_file(names_path, (f"{repo['full_name']}\n".encode("utf-8") for repo in repos))
+    _write_meta(output_path, query_info, len(repos))
 
     return str(output_path)
 
 
 def load_search_results(input_path: str = None) -> tuple[list[dict], dict]:
-    """Load search results from JSON file.
+    """Load search results from a JSON-lines file and its metadata sidecar.
 
     Args:
-        input_path: Input file path (default: data/search_results.json)
+        input_path: Input file path (default: data/search_results.jsonl)
 
     Returns:
         Tuple of (repos list, metadata dict)
     """
     input_path = Path(input_path or SEARCH_RESULTS_PATH)
+    _migrate_legacy_results(input_path)
 
     if not input_path.exists():
         return [], {"last_search": None, "query": {}, "count": 0}
 
-    with open(input_path, "r") as f:
-        data = json.load(f)
+    with open(input_path, "rb") as f:
+        repos = [_json_loads(line) for line in f if line.strip()]
+
+    meta_path = _meta_path(input_path)
+    data = {}
+    if meta_path.exists():
+        with open(meta_path, "r") as f:
+            data = json.load(f)
 
-    repos = data.get("repos", [])
     metadata = {
         "last_search": data.get("last_search"),
         "query": data.get("query", {}),
@@ -453,25 +685,28 @@ def append_to_search_results(
 ) -> int:
     """Append new repos to existing search results (avoiding duplicates).
 
+    Only the new lines are written; duplicates are checked against the
+    .names index (see SearchResultsStore).
+
     Args:
         new_repos: New repos to add
-        input_path: File path (default: data/search_results.json)
+        input_path: File path (default: data/search_results.jsonl)
 
     Returns:
         Number of repos added
     """
-    repos, metadata = load_search_results(input_path)
-
-    existing_names = {r["full_name"] for r in repos}
-    added = 0
+    input_path = Path(input_path or SEARCH_RESULTS_PATH)
+    _migrate_legacy_results(input_path)
 
-    for repo in new_repos:
-        if repo["full_name"] not in existing_names:
-            repos.append(repo)
-            existing_names.add(repo["full_name"])
-            added += 1
+    store = SearchResultsStore(input_path)
+    added = store.add(new_repos)
 
     if added > 0:
-        save_search_results(repos, metadata.get("query"), input_path)
+        query_info = {}
+        meta_path = _meta_path(input_path)
+        if meta_path.exists():
+            with open(meta_path, "r") as f:
+                query_info = json.load(f).get("query", {})
+        _write_meta(input_path, query_info, len(store.names))
 
     return added
@@ -0,0 +1,106 @@
+"""On-disk ETag cache for GitHub API responses.
+
+Stores the last response body and its ETag per URL so repeat requests can
+be sent as conditional GETs. A 304 Not Modified reply does not count
+against the REST rate limit and the cached body is reused.
+
+Rows older than max_age_days, and the oldest rows beyond max_rows, are
+pruned on open and every PRUNE_INTERVAL writes, so the file stays bounded.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+
+class HTTPCache:
+    """ETag-validated response bodies keyed by full URL, stored in SQLite."""
+
+    MAX_ROWS = 20000
+    MAX_AGE_DAYS = 30
+    # Writes between prunes
+    PRUNE_INTERVAL = 500
+
+    def __init__(self, path: str, max_rows: int = MAX_ROWS, max_age_days: float = MAX_AGE_DAYS):
+        """Open (or create) the cache database.
+
+        Args:
+            path: SQLite file path (e.g., "data/http_cache.sqlite")
+            max_rows: Number of most recently stored responses kept
+            max_age_days: Responses stored longer ago than this are dropped
+
+        Raises:
+            sqlite3.Error or OSError if the database cannot be opened.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_rows = max_rows
+        self.max_age_days = max_age_days
+        self._puts = 0
+
+        # One connection shared by the client's worker threads
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "url TEXT PRIMARY KEY, etag TEXT NOT NULL, body TEXT NOT NULL, "
+                "stored_at REAL NOT NULL DEFAULT 0)"
+            )
+            # Caches created before pruning lack the timestamp column
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(responses)")}
+            if "stored_at" not in columns:
+                self._conn.execute(
+                    "ALTER TABLE responses ADD COLUMN stored_at REAL NOT NULL DEFAULT 0"
+                )
+                self._conn.execute("UPDATE responses SET stored_at = ?", (time.time(),))
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_stored_at ON responses (stored_at)"
+            )
+            self._prune()
+
+    def get(self, url: str) -> Optional[Tuple[str, Any]]:
+        """Return (etag, body) stored for url, or None."""
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT etag, body FROM responses WHERE url = ?", (url,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            print(f"Warning: HTTP cache read failed: {e}")
+            return None
+        if row is None:
+            return None
+        return row[0], json.loads(row[1])
+
+    def put(self, url: str, etag: str, body: Any):
+        """Store the response body and its ETag for url."""
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses (url, etag, body, stored_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (url, etag, json.dumps(body), time.time()),
+                )
+                self._puts += 1
+                if self._puts % self.PRUNE_INTERVAL == 0:
+                    self._prune()
+        except sqlite3.Error as e:
+            print(f"Warning: HTTP cache write failed: {e}")
+
+    def _prune(self):
+        """Drop expired rows and the oldest beyond max_rows (lock and transaction held)."""
+        self._conn.execute(
+            "DELETE FROM responses WHERE stored_at < ?",
+            (time.time() - self.max_age_days * 86400,),
+        )
+        self._conn.execute(
+            "DELETE FROM responses WHERE url IN ("
+            "SELECT url FROM responses ORDER BY stored_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_rows,),
+        )
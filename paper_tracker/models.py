@@ -1,9 +1,22 @@
 """Data models for Paper Tracker."""
 
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import date, datetime
 from enum import Enum
-from typing import List, Optional
+from typing import Iterable, List, Optional, Tuple
+
+
+# (date ordinal, ISO string) of the last _today_iso() call
+_today: Tuple[int, str] = (0, "")
+
+
+def _today_iso() -> str:
+    """Today's date as YYYY-MM-DD, formatted once per day."""
+    global _today
+    today = date.today()
+    if _today[0] != today.toordinal():
+        _today = (today.toordinal(), today.isoformat())
+    return _today[1]
 
 
 class RepoState(Enum):
@@ -13,7 +26,7 @@ class RepoState(Enum):
     NO_WEIGHTS = "no_weights"        # No weights detected or promised
 
 
-@dataclass
+@dataclass(slots=True)
 class RepoInfo:
     """Repository information with detection results."""
     name: str
@@ -54,17 +67,18 @@ class RepoInfo:
     def __post_init__(self):
         """Initialize dates if not set."""
         if not self.last_checked:
-            self.last_checked = datetime.now().strftime("%Y-%m-%d")
+            self.last_checked = _today_iso()
         if not self.status_changed_date:
             self.status_changed_date = self.last_checked
 
     def update_status(self, new_status: RepoState):
         """Update status and track the change."""
+        today = _today_iso()
         if self.status != new_status:
             self.previous_status = self.status
             self.status = new_status
-            self.status_changed_date = datetime.now().strftime("%Y-%m-%d")
-        self.last_checked = datetime.now().strftime("%Y-%m-%d")
+            self.status_changed_date = today
+        self.last_checked = today
 
     def is_fresh_release(self, days: int = 7) -> bool:
         """Check if this is a fresh release (status changed to HAS_WEIGHTS recently)."""
@@ -74,7 +88,7 @@ class RepoInfo:
             return False
 
         try:
-            changed_date = datetime.strptime(self.status_changed_date, "%Y-%m-%d")
+            changed_date = datetime.fromisoformat(self.status_changed_date)
             days_since = (datetime.now() - changed_date).days
             return days_since <= days
         except (ValueError, TypeError):
@@ -110,37 +124,40 @@ class RepoInfo:
     @classmethod
     def from_dict(cls, data: dict) -> "RepoInfo":
         """Create from dictionary (JSON deserialization)."""
+        get = data.get
+
         # Handle status enum
-        status_str = data.get("status", "no_weights")
+        status_str = get("status", "no_weights")
         status = RepoState(status_str) if status_str else RepoState.NO_WEIGHTS
 
         # Handle previous_status enum
-        prev_status_str = data.get("previous_status")
+        prev_status_str = get("previous_status")
         previous_status = RepoState(prev_status_str) if prev_status_str else None
 
+        # Positional in field order, which skips keyword matching in __init__
         return cls(
-            name=data.get("name", ""),
-            full_name=data.get("full_name", ""),
-            stars=data.get("stars", 0),
-            url=data.get("url", ""),
-            description=data.get("description", ""),
-            created_at=data.get("created_at", ""),
-            updated_at=data.get("updated_at", ""),
-            status=status,
-            last_checked=data.get("last_checked", ""),
-            status_changed_date=data.get("status_changed_date", ""),
-            previous_status=previous_status,
-            weight_status=data.get("weight_status", "None"),
-            weight_confidence=data.get("weight_confidence", "none"),
-            weight_details=data.get("weight_details", []),
-            conference=data.get("conference"),
-            conference_year=data.get("conference_year"),
-            arxiv_id=data.get("arxiv_id"),
-            conference_details=data.get("conference_details", []),
-            topics=data.get("topics", []),
-            coming_soon_detected=data.get("coming_soon_detected", False),
-            coming_soon_details=data.get("coming_soon_details", []),
-            ru_candidate=data.get("ru_candidate", False),
+            get("name", ""),
+            get("full_name", ""),
+            get("stars", 0),
+            get("url", ""),
+            get("description", ""),
+            get("created_at", ""),
+            get("updated_at", ""),
+            status,
+            get("last_checked", ""),
+            get("status_changed_date", ""),
+            previous_status,
+            get("weight_status", "None"),
+            get("weight_confidence", "none"),
+            get("weight_details", []),
+            get("conference"),
+            get("conference_year"),
+            get("arxiv_id"),
+            get("conference_details", []),
+            get("topics", []),
+            get("coming_soon_detected", False),
+            get("coming_soon_details", []),
+            get("ru_candidate", False),
         )
 
     @classmethod
@@ -158,7 +175,7 @@ class RepoInfo:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class AwesomeEntry:
     """Entry parsed from an awesome list markdown table."""
     # Core identity
@@ -215,26 +232,33 @@ class AwesomeEntry:
     @classmethod
     def from_dict(cls, data: dict) -> "AwesomeEntry":
         """Create from dictionary (JSON deserialization)."""
+        get = data.get
+        # Positional in field order, which skips keyword matching in __init__
         return cls(
-            id=data.get("id", ""),
-            source_list=data.get("source_list", ""),
-            title=data.get("title", ""),
-            model_name=data.get("model_name", ""),
-            authors=data.get("authors", []),
-            conference=data.get("conference"),
-            year=data.get("year"),
-            arxiv_id=data.get("arxiv_id"),
-            paper_url=data.get("paper_url"),
-            github_url=data.get("github_url"),
-            github_full_name=data.get("github_full_name"),
-            keywords=data.get("keywords", []),
-            section=data.get("section", ""),
-            domain=data.get("domain", ""),
-            subtopics=data.get("subtopics", []),
-            last_synced=data.get("last_synced", ""),
-            has_repo=data.get("has_repo", False),
+            get("id", ""),
+            get("source_list", ""),
+            get("title", ""),
+            get("model_name", ""),
+            get("authors", []),
+            get("conference"),
+            get("year"),
+            get("arxiv_id"),
+            get("paper_url"),
+            get("github_url"),
+            get("github_full_name"),
+            get("keywords", []),
+            get("section", ""),
+            get("domain", ""),
+            get("subtopics", []),
+            get("last_synced", ""),
+            get("has_repo", False),
         )
 
+    @classmethod
+    def from_dicts_bulk(cls, rows: Iterable[dict]) -> List["AwesomeEntry"]:
+        """Create entries for many dicts (e.g., cache search results)."""
+        return list(map(cls.from_dict, rows))
+
     def to_repo_format(self) -> Optional[dict]:
         """Convert to repo dict format for search results integration."""
         if not self.github_url:
@@ -250,5 +274,50 @@ class AwesomeEntry:
             "conference": self.conference or "",
             "conference_year": self.year or "",
             "arxiv_id": self.arxiv_id or "",
-            "source": f"awesome:{self.source_list.split('/')[-1]}",
+            "source": f"awesome:{self.source_list.rsplit('/', 1)[-1]}",
+        }
+
+
+@dataclass(slots=True)
+class RepoRow:
+    """GitHub search hit for the fast (metadata-only) web UI search.
+
+    Holds the raw API strings; description and dates are truncated only
+    when the row is emitted with to_dict().
+    """
+    full_name: str
+    name: str
+    url: str
+    stars: int
+    description: str
+    weight_status: str
+    created_at: str
+    updated_at: str
+
+    @classmethod
+    def from_github_repo(cls, repo: dict, full_name: str) -> "RepoRow":
+        """Create from a GitHub search API item."""
+        get = repo.get
+        return cls(
+            full_name,
+            get("name", ""),
+            get("html_url") or f"https://github.com/{full_name}",
+            get("stargazers_count", 0),
+            get("description") or "",
+            "Unknown",  # Not checked yet
+            get("created_at") or "",
+            get("updated_at") or "",
+        )
+
+    def to_dict(self) -> dict:
+        """Convert to the repo dict format used by the web UI."""
+        return {
+            "full_name": self.full_name,
+            "name": self.name,
+            "url": self.url,
+            "stars": self.stars,
+            "description": self.description[:200],
+            "weight_status": self.weight_status,
+            "created_at": self.created_at[:10],
+            "updated_at": self.updated_at[:10],
         }
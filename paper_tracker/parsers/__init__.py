@@ -26,6 +26,16 @@ class ParserRegistry:
 
     _parsers: Dict[str, Type[BaseAwesomeParser]] = {}
 
+    # Parsers keep no per-parse state, so one instance per parser is shared
+    _instances: Dict[str, BaseAwesomeParser] = {}
+
+    # (content hash, content length, hints) -> parser name chosen by auto_select
+    _selections: Dict[tuple, str] = {}
+    SELECTION_CACHE_SIZE = 128
+
+    # auto_select stops scanning once a parser is at least this confident
+    HIGH_CONFIDENCE_CUTOFF = 0.95
+
     @classmethod
     def register(cls, parser_class: Type[BaseAwesomeParser]) -> Type[BaseAwesomeParser]:
         """Decorator to register a parser.
@@ -37,6 +47,8 @@ class ParserRegistry:
                 ...
         """
         cls._parsers[parser_class.name] = parser_class
+        cls._instances.pop(parser_class.name, None)
+        cls._selections.clear()
         return parser_class
 
     @classmethod
@@ -51,6 +63,24 @@ class ParserRegistry:
         """
         return cls._parsers.get(name)
 
+    @classmethod
+    def get_parser_instance(cls, name: str) -> Optional[BaseAwesomeParser]:
+        """Get a shared parser instance by name.
+
+        Args:
+            name: Parser name (e.g., "table_sr", "table_aio")
+
+        Returns:
+            Parser instance or None if not found
+        """
+        parser = cls._instances.get(name)
+        if parser is None:
+            parser_class = cls._parsers.get(name)
+            if parser_class is None:
+                return None
+            parser = cls._instances.setdefault(name, parser_class())
+        return parser
+
     @classmethod
     def auto_select(
         cls,
@@ -65,16 +95,26 @@ class ParserRegistry:
             hints: Optional hints (may include explicit parser name)
 
         Returns:
-            Instance of parser with highest confidence score
+            Shared instance of parser with highest confidence score
 
         Raises:
             ValueError: If no suitable parser found
         """
         # Check if hints specify a parser explicitly
         if hints and hints.get("parser"):
-            parser_class = cls.get_parser(hints["parser"])
-            if parser_class:
-                return parser_class()
+            parser = cls.get_parser_instance(hints["parser"])
+            if parser:
+                return parser
+
+        # Same content (e.g. an unchanged list on the next sync) picks the
+        # same parser; unhashable hints just skip the cache
+        try:
+            key = (hash(content), len(content), tuple(sorted((hints or {}).items())))
+            name = cls._selections.get(key)
+        except TypeError:
+            key = name = None
+        if name is not None:
+            return cls.get_parser_instance(name)
 
         # Auto-detect by confidence score
         best_parser = None
@@ -85,6 +125,8 @@ class ParserRegistry:
             if score > best_score:
                 best_score = score
                 best_parser = parser_class
+                if best_score >= cls.HIGH_CONFIDENCE_CUTOFF:
+                    break
 
         if best_parser is None or best_score < 0.1:
             raise ValueError(
@@ -92,7 +134,11 @@ class ParserRegistry:
                 f"Available parsers: {list(cls._parsers.keys())}"
             )
 
-        return best_parser()
+        if key is not None:
+            if len(cls._selections) >= cls.SELECTION_CACHE_SIZE:
+                cls._selections.clear()
+            cls._selections[key] = best_parser.name
+        return cls.get_parser_instance(best_parser.name)
 
     @classmethod
     def list_parsers(cls) -> List[str]:
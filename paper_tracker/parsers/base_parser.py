@@ -1,8 +1,26 @@
 """Abstract base class for awesome list parsers."""
 
+import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Pattern, Match, Tuple
+
+# Deletes every ASCII character that is not alphanumeric or '_'
+_ID_DELETE_TABLE = {i: None for i in range(128) if not (chr(i).isalnum() or chr(i) == '_')}
+
+
+@lru_cache(maxsize=64)
+def _source_short(source_id: str) -> str:
+    """Short source prefix for entry IDs (e.g., "awesome-sr" -> "sr")."""
+    return source_id.rsplit('/', 1)[-1].lower().replace('awesome-', '').replace('-', '_')
+
+
+def _sanitize_identifier(identifier: str) -> str:
+    """Keep only alphanumerics and '_' (str.isalnum semantics)."""
+    if identifier.isascii():
+        return identifier.translate(_ID_DELETE_TABLE)
+    return ''.join(c for c in identifier if c.isalnum() or c == '_')
 
 
 @dataclass
@@ -18,6 +36,43 @@ class ParserCapabilities:
     extracts_keywords: bool = False
 
 
+class PatternSet:
+    """Ordered named patterns scanned in a single pass.
+
+    search() returns the same result as trying each pattern in order and
+    keeping the first that matches, but scans the text once instead of once
+    per pattern.
+    """
+
+    def __init__(self, patterns: Dict[str, Pattern[str]]):
+        self.patterns = patterns
+        self._names = tuple(patterns)
+
+        # Lookahead alternation: finditer reports every position where any
+        # pattern matches, as group p<i> of the first pattern matching there
+        flags = 0
+        for pattern in patterns.values():
+            flags |= pattern.flags
+        alternation = "|".join(
+            f"(?P<p{i}>{pattern.pattern})" for i, pattern in enumerate(patterns.values())
+        )
+        self._combined = re.compile(f"(?=(?:{alternation}))", flags)
+
+    def search(self, text: str) -> Optional[Tuple[str, Match[str]]]:
+        """Return (name, match) for the first pattern in order that matches text."""
+        best = None
+        for match in self._combined.finditer(text):
+            index = int(match.lastgroup[1:])
+            if best is None or index < best:
+                best = index
+                if best == 0:
+                    break
+        if best is None:
+            return None
+        name = self._names[best]
+        return name, self.patterns[name].search(text)
+
+
 class BaseAwesomeParser(ABC):
     """Abstract base class for awesome list parsers.
 
@@ -78,7 +133,7 @@ class BaseAwesomeParser(ABC):
 
         Format: {source_short}:{identifier}
         """
-        source_short = source_id.split('/')[-1].lower().replace('awesome-', '').replace('-', '_')
+        source_short = _source_short(source_id)
 
         # Use model_name if available, otherwise derive from title
         identifier = entry.get('model_name', '')
@@ -89,6 +144,6 @@ class BaseAwesomeParser(ABC):
 
         identifier = identifier.lower().replace(' ', '_').replace('-', '_')
         # Remove special characters
-        identifier = ''.join(c for c in identifier if c.isalnum() or c == '_')
+        identifier = _sanitize_identifier(identifier)
 
         return f"{source_short}:{identifier}"
@@ -9,7 +9,7 @@ import re
 from datetime import datetime
 from typing import List, Dict, Any, Optional, Tuple
 
-from .base_parser import BaseAwesomeParser, ParserCapabilities
+from .base_parser import BaseAwesomeParser, ParserCapabilities, PatternSet
 from . import ParserRegistry
 
 
@@ -46,6 +46,17 @@ class TableAIOParser(BaseAwesomeParser):
     # Year section header
     YEAR_SECTION_PATTERN = re.compile(r'^##\s*(20\d{2})\s*$', re.MULTILINE)
 
+    # Detection markers used by can_parse
+    SUB_AUTHORS_CELL_PATTERN = re.compile(r'\|[^|]+<sub>[^<]+</sub>')
+    KEYWORDS_COLUMN_PATTERN = re.compile(r'\|\s*Keywords\s*\|', re.IGNORECASE)
+    MODEL_COLUMN_PATTERN = re.compile(r'\|\s*Model\s*\|', re.IGNORECASE)
+
+    # Table separator line (|---|---|)
+    SEPARATOR_PATTERN = re.compile(r'\|[\s\-:]+\|')
+
+    # HTML tags left in title cells
+    HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+
     # Markdown link pattern
     LINK_PATTERN = re.compile(r'\[([^\]]*)\]\(([^)]+)\)')
 
@@ -82,10 +93,18 @@ class TableAIOParser(BaseAwesomeParser):
         'TCSVT': re.compile(r"T-?CSVT\s*(\d{4})?", re.IGNORECASE),
         'arXiv': re.compile(r"arXiv", re.IGNORECASE),
     }
+    # Same patterns scanned in one pass, first match in dict order wins
+    VENUE_SET = PatternSet(VENUE_PATTERNS)
 
     # Year pattern
     YEAR_PATTERN = re.compile(r'20\d{2}')
 
+    # Model names inside titles, tried in order
+    MODEL_NAME_PATTERNS = [
+        re.compile(r'\b([A-Z][a-zA-Z]*(?:Net|Former|GAN|SR|IR|Diff))\b'),  # SwinIR, RestoreFormer
+        re.compile(r'\b([A-Z]{2,}[a-zA-Z]*)\b'),  # ESRGAN, NAFNet (acronym-style)
+    ]
+
     @classmethod
     def can_parse(cls, content: str, hints: Optional[Dict[str, Any]] = None) -> float:
         """Check if content matches All-in-One format."""
@@ -95,12 +114,12 @@ class TableAIOParser(BaseAwesomeParser):
         score = 0.0
 
         # Check for <sub> tags in tables (author format)
-        if re.search(r'\|[^|]+<sub>[^<]+</sub>', content):
+        if cls.SUB_AUTHORS_CELL_PATTERN.search(content):
             score += 0.4
 
-        # Check for year section headers (## 2024, ## 2023, etc.)
-        year_sections = cls.YEAR_SECTION_PATTERN.findall(content)
-        if len(year_sections) >= 2:
+        # Check for year section headers (## 2024, ## 2023, etc.), stop at the second
+        year_sections = cls.YEAR_SECTION_PATTERN.finditer(content)
+        if next(year_sections, None) and next(year_sections, None):
             score += 0.3
 
         # Check for "Avenue" or "Paper" column header
@@ -108,9 +127,9 @@ class TableAIOParser(BaseAwesomeParser):
             score += 0.2
 
         # Negative: if has "Keywords" or "Model" column, probably SR format
-        if re.search(r'\|\s*Keywords\s*\|', content, re.IGNORECASE):
+        if cls.KEYWORDS_COLUMN_PATTERN.search(content):
             score -= 0.3
-        if re.search(r'\|\s*Model\s*\|', content, re.IGNORECASE):
+        if cls.MODEL_COLUMN_PATTERN.search(content):
             score -= 0.2
 
         return min(max(score, 0.0), 1.0)
@@ -142,17 +161,18 @@ class TableAIOParser(BaseAwesomeParser):
         timestamp = datetime.now().strftime("%Y-%m-%d")
 
         skip_sections = hints.get("skip_sections", []) if hints else []
+        skip_sections_lc = [skip.lower() for skip in skip_sections]
 
         for line in lines:
-            # Track year sections
-            year_match = self.YEAR_SECTION_PATTERN.match(line)
+            # Track year sections (cheap prefix test before the regex)
+            year_match = line.startswith('##') and self.YEAR_SECTION_PATTERN.match(line)
             if year_match:
                 current_year = year_match.group(1)
                 in_paper_table = False
                 continue
 
-            # Detect paper table headers
-            if self.TABLE_HEADER_PATTERN.search(line):
+            # Detect paper table headers (only lines with a '|' can match)
+            if '|' in line and self.TABLE_HEADER_PATTERN.search(line):
                 in_paper_table = True
                 continue
 
@@ -163,12 +183,14 @@ class TableAIOParser(BaseAwesomeParser):
                     continue
 
             # Check if we should skip based on skip_sections
-            if any(skip.lower() in line.lower() for skip in skip_sections):
-                in_paper_table = False
-                continue
+            if skip_sections_lc:
+                line_lc = line.lower()
+                if any(skip in line_lc for skip in skip_sections_lc):
+                    in_paper_table = False
+                    continue
 
             # Skip separator lines
-            if re.match(r'\|[\s\-:]+\|', line):
+            if self.SEPARATOR_PATTERN.match(line):
                 continue
 
             # Parse table rows
@@ -254,7 +276,7 @@ class TableAIOParser(BaseAwesomeParser):
             authors_str = match.group(2).strip()
 
             # Clean title (remove any remaining HTML)
-            title = re.sub(r'<[^>]+>', '', title).strip()
+            title = self.HTML_TAG_PATTERN.sub('', title).strip()
 
             # Parse authors (comma-separated)
             authors = [a.strip() for a in authors_str.split(',') if a.strip()]
@@ -262,7 +284,7 @@ class TableAIOParser(BaseAwesomeParser):
             return title, authors
 
         # No <sub> tags - just title
-        title = re.sub(r'<[^>]+>', '', cell).strip()
+        title = self.HTML_TAG_PATTERN.sub('', cell).strip()
         return title if title else None, []
 
     def _derive_model_name(self, title: str) -> str:
@@ -281,13 +303,8 @@ class TableAIOParser(BaseAwesomeParser):
                 return prefix
 
         # Look for common model name patterns
-        patterns = [
-            r'\b([A-Z][a-zA-Z]*(?:Net|Former|GAN|SR|IR|Diff))\b',  # SwinIR, RestoreFormer
-            r'\b([A-Z]{2,}[a-zA-Z]*)\b',  # ESRGAN, NAFNet (acronym-style)
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, title)
+        for pattern in self.MODEL_NAME_PATTERNS:
+            match = pattern.search(title)
             if match:
                 return match.group(1)
 
@@ -304,12 +321,12 @@ class TableAIOParser(BaseAwesomeParser):
         """Extract venue/conference and year from venue cell."""
         cell = cell.strip()
 
-        # Try each venue pattern
-        for venue_name, pattern in self.VENUE_PATTERNS.items():
-            match = pattern.search(cell)
-            if match:
-                year = match.group(1) if match.lastindex and match.group(1) else None
-                return venue_name, year
+        # First venue pattern (in dict order) that matches
+        found = self.VENUE_SET.search(cell)
+        if found:
+            venue_name, match = found
+            year = match.group(1) if match.lastindex and match.group(1) else None
+            return venue_name, year
 
         # Try to extract standalone year
         year_match = self.YEAR_PATTERN.search(cell)
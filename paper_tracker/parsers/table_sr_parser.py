@@ -8,7 +8,7 @@ import re
 from datetime import datetime
 from typing import List, Dict, Any, Optional, Tuple
 
-from .base_parser import BaseAwesomeParser, ParserCapabilities
+from .base_parser import BaseAwesomeParser, ParserCapabilities, PatternSet
 from . import ParserRegistry
 
 
@@ -31,6 +31,10 @@ class TableSRParser(BaseAwesomeParser):
         re.IGNORECASE
     )
 
+    # Detection markers used by can_parse
+    KEYWORDS_COLUMN_PATTERN = re.compile(r'\|\s*Keywords\s*\|', re.IGNORECASE)
+    SUB_AUTHORS_PATTERN = re.compile(r'<sub>[^<]+</sub>')
+
     # Pattern for 5-column rows
     TABLE_ROW_5COL = re.compile(
         r'\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|\s*([^|]*)\s*\|\s*([^|]*)\s*\|'
@@ -41,6 +45,9 @@ class TableSRParser(BaseAwesomeParser):
         r'\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|\s*([^|]*)\s*\|'
     )
 
+    # Table separator line (|---|---|)
+    SEPARATOR_PATTERN = re.compile(r'\|[\s\-:]+\|')
+
     # Markdown link pattern
     LINK_PATTERN = re.compile(r'\[([^\]]*)\]\(([^)]+)\)')
 
@@ -74,6 +81,8 @@ class TableSRParser(BaseAwesomeParser):
         'TOG': re.compile(r"TOG['\s]*(\d{2,4})?", re.IGNORECASE),
         'IJCV': re.compile(r"IJCV['\s]*(\d{2,4})?", re.IGNORECASE),
     }
+    # Same patterns scanned in one pass, first match in dict order wins
+    CONFERENCE_SET = PatternSet(CONFERENCE_PATTERNS)
 
     # Section header pattern
     SECTION_PATTERN = re.compile(r'^##\s+(.+)$', re.MULTILINE)
@@ -81,6 +90,12 @@ class TableSRParser(BaseAwesomeParser):
     # Year pattern
     YEAR_PATTERN = re.compile(r'20\d{2}')
 
+    # Bold/italic markers
+    EMPHASIS_PATTERN = re.compile(r'[*_]+')
+
+    # Keyword separators, mapped to ',' so keywords split without a regex
+    KEYWORD_SEPARATORS = str.maketrans({';': ',', '/': ','})
+
     @classmethod
     def can_parse(cls, content: str, hints: Optional[Dict[str, Any]] = None) -> float:
         """Check if content matches SR table format."""
@@ -94,11 +109,11 @@ class TableSRParser(BaseAwesomeParser):
             score += 0.5
 
         # Check for Keywords column
-        if re.search(r'\|\s*Keywords\s*\|', content, re.IGNORECASE):
+        if cls.KEYWORDS_COLUMN_PATTERN.search(content):
             score += 0.3
 
         # Negative: if has <sub> author tags, probably AIO format
-        if re.search(r'<sub>[^<]+</sub>', content):
+        if cls.SUB_AUTHORS_PATTERN.search(content):
             score -= 0.2
 
         return min(max(score, 0.0), 1.0)
@@ -130,25 +145,28 @@ class TableSRParser(BaseAwesomeParser):
         timestamp = datetime.now().strftime("%Y-%m-%d")
 
         skip_sections = hints.get("skip_sections", []) if hints else []
+        skip_sections_lc = [skip.lower() for skip in skip_sections]
 
         for line in lines:
-            # Check for section headers
-            section_match = self.SECTION_PATTERN.match(line)
+            # Check for section headers (cheap prefix test before the regex)
+            section_match = line.startswith('##') and self.SECTION_PATTERN.match(line)
             if section_match:
                 current_section = section_match.group(1).strip()
                 in_table = False
 
                 # Skip if section is in skip list
-                if any(skip.lower() in current_section.lower() for skip in skip_sections):
-                    continue
+                if skip_sections_lc:
+                    section_lc = current_section.lower()
+                    if any(skip in section_lc for skip in skip_sections_lc):
+                        continue
 
-            # Check for table header
-            if self.TABLE_HEADER_PATTERN.search(line):
+            # Check for table header (only lines with a '|' can match)
+            if '|' in line and self.TABLE_HEADER_PATTERN.search(line):
                 in_table = True
                 continue
 
             # Skip separator lines
-            if in_table and re.match(r'\|[\s\-:]+\|', line):
+            if in_table and self.SEPARATOR_PATTERN.match(line):
                 continue
 
             # Parse table rows
@@ -209,12 +227,7 @@ class TableSRParser(BaseAwesomeParser):
             _, paper_url = self._extract_link(published_cell)
 
         # Extract GitHub URL
-        github_url = self._extract_github_url(code_cell)
-        github_full_name = None
-        if github_url:
-            github_match = self.GITHUB_URL_PATTERN.search(github_url)
-            if github_match:
-                github_full_name = github_match.group(1)
+        github_url, github_full_name = self._extract_github(code_cell)
 
         # Extract keywords
         keywords = self._parse_keywords(keywords_cell)
@@ -262,17 +275,15 @@ class TableSRParser(BaseAwesomeParser):
             arxiv_id = arxiv_match.group(1)
 
         # Check for conferences
-        for conf_name, pattern in self.CONFERENCE_PATTERNS.items():
-            match = pattern.search(cell)
-            if match:
-                conference = conf_name
-                if match.group(1):
-                    year_str = match.group(1)
-                    if len(year_str) == 2:
-                        year = f"20{year_str}"
-                    else:
-                        year = year_str
-                break
+        found = self.CONFERENCE_SET.search(cell)
+        if found:
+            conference, match = found
+            if match.group(1):
+                year_str = match.group(1)
+                if len(year_str) == 2:
+                    year = f"20{year_str}"
+                else:
+                    year = year_str
 
         # Find standalone year if not from conference
         if not year:
@@ -282,21 +293,23 @@ class TableSRParser(BaseAwesomeParser):
 
         return conference, year, arxiv_id
 
-    def _extract_github_url(self, cell: str) -> Optional[str]:
-        """Extract GitHub URL from cell."""
+    def _extract_github(self, cell: str) -> Tuple[Optional[str], Optional[str]]:
+        """Extract GitHub URL and full name (owner/repo) from a cell."""
         # Try markdown link first
         link_match = self.LINK_PATTERN.search(cell)
         if link_match:
             url = link_match.group(2)
             if 'github.com' in url.lower():
-                return url
+                github_match = self.GITHUB_URL_PATTERN.search(url)
+                return url, github_match.group(1) if github_match else None
 
-        # Try direct URL
+        # Then try direct URL (its match already holds owner/repo)
         url_match = self.GITHUB_URL_PATTERN.search(cell)
         if url_match:
-            return f"https://github.com/{url_match.group(1)}"
+            full_name = url_match.group(1)
+            return f"https://github.com/{full_name}", full_name
 
-        return None
+        return None, None
 
     def _parse_keywords(self, cell: str) -> List[str]:
         """Parse keywords from comma-separated text."""
@@ -307,13 +320,12 @@ class TableSRParser(BaseAwesomeParser):
         if not cell:
             return []
 
-        keywords = re.split(r'[,;/]', cell)
+        keywords = cell.translate(self.KEYWORD_SEPARATORS).split(',')
         return [k.strip() for k in keywords if k.strip()]
 
     def _clean_text(self, text: str) -> str:
         """Remove markdown formatting."""
         text = self.LINK_PATTERN.sub(r'\1', text)
-        text = re.sub(r'\*+', '', text)
-        text = re.sub(r'_+', '', text)
+        text = self.EMPHASIS_PATTERN.sub('', text)
         text = ' '.join(text.split())
         return text.strip()
@@ -0,0 +1,52 @@
+"""Token-bucket pacing for GitHub API requests.
+
+Requests go out back to back while the bucket has tokens and are only
+delayed once it is empty, instead of sleeping a fixed time after every call.
+"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """Thread-safe token bucket allowing bursts of up to capacity requests."""
+
+    def __init__(self, capacity: float, refill_per_sec: float):
+        """Create a full bucket.
+
+        Args:
+            capacity: Maximum number of tokens (burst size)
+            refill_per_sec: Tokens added per second
+        """
+        self.capacity = capacity
+        self.refill_per_sec = refill_per_sec
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        """Add the tokens accrued since the last update (lock held)."""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.refill_per_sec)
+        self._updated = now
+
+    def acquire(self, tokens: float = 1.0):
+        """Take tokens, sleeping until the bucket has refilled enough.
+
+        Tokens are reserved before sleeping (the level may go negative), so
+        concurrent callers queue up behind each other rather than all waking
+        at once.
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= tokens
+            wait_seconds = -self._tokens / self.refill_per_sec if self._tokens < 0 else 0
+        if wait_seconds > 0:
+            time.sleep(wait_seconds)
+
+    def set_budget(self, remaining: int, seconds_to_reset: float):
+        """Spread the remaining budget evenly over the time left until reset."""
+        with self._lock:
+            self._refill()
+            self.refill_per_sec = max(remaining, 1) / max(seconds_to_reset, 1)
+            self._tokens = min(self._tokens, remaining)
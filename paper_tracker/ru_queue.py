@@ -0,0 +1,177 @@
+"""RU (Reproducible Unit) candidate queue.
+
+Kept separate from the tracker so queue-only CLI commands can load
+the YAML queue without importing the GitHub client and detectors.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import yaml
+
+from .models import RepoInfo, RepoState
+
+
+@dataclass
+class RUCandidate:
+    """A candidate repository for RU (Reproducible Unit) generation."""
+    url: str
+    full_name: str
+    arxiv_id: str
+    added_at: str
+    source: str  # "auto" or "manual"
+    status: str  # "pending", "processing", "completed", "skipped"
+    notes: str = ""
+
+    def to_dict(self) -> dict:
+        return {
+            "url": self.url,
+            "full_name": self.full_name,
+            "arxiv_id": self.arxiv_id,
+            "added_at": self.added_at,
+            "source": self.source,
+            "status": self.status,
+            "notes": self.notes,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "RUCandidate":
+        return cls(
+            url=data.get("url", ""),
+            full_name=data.get("full_name", ""),
+            arxiv_id=data.get("arxiv_id", ""),
+            added_at=data.get("added_at", ""),
+            source=data.get("source", "auto"),
+            status=data.get("status", "pending"),
+            notes=data.get("notes", ""),
+        )
+
+
+class RUQueueManager:
+    """Manager for RU (Reproducible Unit) candidate queue."""
+
+    def __init__(self, queue_path: str = "data/ru_queue.yaml"):
+        self.queue_path = Path(queue_path)
+        self.candidates: Dict[str, RUCandidate] = {}  # keyed by full_name
+        self._load()
+
+    def _load(self):
+        """Load queue from YAML file."""
+        if not self.queue_path.exists():
+            return
+
+        try:
+            with open(self.queue_path, "r") as f:
+                data = yaml.safe_load(f)
+
+            if data and data.get("candidates"):
+                for item in data["candidates"]:
+                    candidate = RUCandidate.from_dict(item)
+                    self.candidates[candidate.full_name] = candidate
+        except Exception as e:
+            print(f"Error loading RU queue: {e}")
+
+    def save(self):
+        """Save queue to YAML file."""
+        self.queue_path.parent.mkdir(parents=True, exist_ok=True)
+
+        data = {
+            "candidates": [c.to_dict() for c in self.candidates.values()]
+        }
+
+        with open(self.queue_path, "w") as f:
+            yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+
+    def should_queue(self, repo_info: RepoInfo) -> bool:
+        """Check if a repo meets RU candidate criteria."""
+        # Must have HAS_WEIGHTS status
+        if repo_info.status != RepoState.HAS_WEIGHTS:
+            return False
+        # Must have an arXiv ID
+        if not repo_info.arxiv_id:
+            return False
+        # Not already in queue with completed/processing status
+        existing = self.candidates.get(repo_info.full_name)
+        if existing and existing.status in ("completed", "processing"):
+            return False
+        return True
+
+    def add_candidate(self, repo_info: RepoInfo, source: str = "auto") -> bool:
+        """
+        Add a repo to the RU queue if it meets criteria.
+
+        Returns True if added, False if already exists or doesn't meet criteria.
+        """
+        if source == "auto" and not self.should_queue(repo_info):
+            return False
+
+        # For manual additions, only require HAS_WEIGHTS (allow missing arXiv)
+        if source == "manual" and repo_info.status != RepoState.HAS_WEIGHTS:
+            return False
+
+        # Check if already in queue
+        existing = self.candidates.get(repo_info.full_name)
+        if existing:
+            # Don't re-add if completed or processing
+            if existing.status in ("completed", "processing"):
+                return False
+            # Already pending, no need to re-add
+            return False
+
+        candidate = RUCandidate(
+            url=repo_info.url,
+            full_name=repo_info.full_name,
+            arxiv_id=repo_info.arxiv_id or "",
+            added_at=datetime.now().isoformat(),
+            source=source,
+            status="pending",
+        )
+        self.candidates[repo_info.full_name] = candidate
+        repo_info.ru_candidate = True
+        return True
+
+    def update_status(self, full_name: str, status: str, notes: str = ""):
+        """Update the status of a candidate."""
+        if full_name in self.candidates:
+            self.candidates[full_name].status = status
+            if notes:
+                self.candidates[full_name].notes = notes
+
+    def remove_candidate(self, full_name: str) -> bool:
+        """Remove a candidate from the queue."""
+        if full_name in self.candidates:
+            del self.candidates[full_name]
+            return True
+        return False
+
+    def get_pending(self) -> List[RUCandidate]:
+        """Get all pending candidates."""
+        return [c for c in self.candidates.values() if c.status == "pending"]
+
+    def list_all(self) -> List[RUCandidate]:
+        """Get all candidates."""
+        return list(self.candidates.values())
+
+    def list_by_status(self, status: Optional[str] = None) -> List[RUCandidate]:
+        """List candidates, optionally filtered by status."""
+        if status:
+            return [c for c in self.candidates.values() if c.status == status]
+        return self.list_all()
+
+    def print_queue(self, status_filter: Optional[str] = None):
+        """Print RU queue status."""
+        candidates = self.list_by_status(status_filter)
+
+        if not candidates:
+            print("RU queue is empty")
+            return
+
+        print(f"\nRU Queue ({len(candidates)} candidates)")
+        print("-" * 90)
+        print(f"{'Repo':<40} {'arXiv':<15} {'Status':<12} {'Source':<8} URL")
+        print("-" * 90)
+
+        for c in sorted(candidates, key=lambda x: x.added_at, reverse=True):
+            print(f"{c.full_name[:39]:<40} {c.arxiv_id[:14]:<15} {c.status:<12} {c.source:<8} {c.url}")
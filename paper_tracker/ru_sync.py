@@ -18,7 +18,7 @@ RU_UNITS_PATH = "/Users/long/Downloads/claudegit/RU/zoo/units"
 CANDIDATES_FILE = Path(__file__).parent.parent / "data" / "ru_candidates.json"
 
 # Path to search results file (from Search tab)
-SEARCH_RESULTS_FILE = Path(__file__).parent.parent / "data" / "search_results.json"
+SEARCH_RESULTS_FILE = Path(__file__).parent.parent / "data" / "search_results.jsonl"
 
 
 def normalize_name(name: str) -> str:
@@ -207,7 +207,7 @@ def sync_candidates(repos: list[dict], ru_units: dict[str, str]) -> dict:
     # Remove candidates that are now in RU
     to_remove = []
     for full_name in existing:
-        name = existing[full_name].get("name", full_name.split("/")[-1])
+        name = existing[full_name].get("name", full_name.rsplit("/", 1)[-1])
         if is_in_ru(name, ru_units):
             to_remove.append(full_name)
 
@@ -252,8 +252,8 @@ def fetch_repo_metadata(url: str) -> Optional[dict]:
     repo = match.group(2).rstrip('/')
 
     try:
-        from .github_client import GitHubClient
-        client = GitHubClient()
+        from .github_client import get_shared_client
+        client = get_shared_client()
         repo_data = client.get_repo_details(owner, repo)
 
         if not repo_data:
@@ -303,7 +303,7 @@ def add_manual_repo(url: str, status_data: dict, fetch_metadata: bool = True) ->
         return False, "Invalid GitHub URL format"
 
     full_name = match.group(1).rstrip('/')
-    name = full_name.split('/')[-1]
+    name = full_name.rsplit('/', 1)[-1]
 
     candidates = status_data.get("candidates", {})
 
@@ -349,18 +349,15 @@ def add_manual_repo(url: str, status_data: dict, fetch_metadata: bool = True) ->
 
 
 def load_search_results_for_shop() -> list[dict]:
-    """Load repos from search_results.json for Shop tab.
+    """Load repos from search_results.jsonl for Shop tab.
 
     Returns:
         List of repo dicts from search results
     """
-    if not SEARCH_RESULTS_FILE.exists():
-        return []
-
     try:
-        with open(SEARCH_RESULTS_FILE, 'r') as f:
-            data = json.load(f)
-        return data.get("repos", [])
+        from .github_search import load_search_results
+        repos, _ = load_search_results(str(SEARCH_RESULTS_FILE))
+        return repos
     except Exception as e:
         print(f"Error loading search results: {e}")
         return []
@@ -4,6 +4,7 @@ Loads source configurations from config.yaml and maintains runtime state.
 """
 
 import json
+import os
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -42,6 +43,7 @@ class SourceConfig:
     last_synced: Optional[str] = None
     last_error: Optional[str] = None
     entry_count: int = 0
+    etag: Optional[str] = None  # README ETag for conditional fetches
 
 
 class SourceRegistry:
@@ -84,6 +86,10 @@ class SourceRegistry:
         self.state_path = state_path or base_dir.parent / "data" / "source_registry.json"
 
         self.sources: Dict[str, SourceConfig] = {}
+
+        # Bumped on every state change so callers can memoize derived views
+        self.version = 0
+
         self._load()
 
     def _load(self):
@@ -110,7 +116,7 @@ class SourceRegistry:
 
             self.sources[repo] = SourceConfig(
                 repo=repo,
-                name=item.get("name", repo.split("/")[-1]),
+                name=item.get("name", repo.rsplit("/", 1)[-1]),
                 enabled=item.get("enabled", True),
                 parser=item.get("parser"),
                 parser_hints=item.get("parser_hints", {}),
@@ -142,6 +148,7 @@ class SourceRegistry:
                 self.sources[repo].last_synced = data.get("last_synced")
                 self.sources[repo].last_error = data.get("last_error")
                 self.sources[repo].entry_count = data.get("entry_count", 0)
+                self.sources[repo].etag = data.get("etag")
 
     def save_state(self):
         """Save runtime state to JSON file."""
@@ -152,6 +159,7 @@ class SourceRegistry:
                     "last_synced": src.last_synced,
                     "last_error": src.last_error,
                     "entry_count": src.entry_count,
+                    "etag": src.etag,
                 }
                 for repo, src in self.sources.items()
             }
@@ -160,8 +168,10 @@ class SourceRegistry:
         # Ensure directory exists
         self.state_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(self.state_path, 'w', encoding='utf-8') as f:
-            json.dump(state, f, indent=2)
+        # Serialize in one go and swap the file in, so a crash never leaves it truncated
+        tmp_path = self.state_path.with_name(self.state_path.name + ".tmp")
+        tmp_path.write_text(json.dumps(state, indent=2), encoding='utf-8')
+        os.replace(tmp_path, self.state_path)
 
     def get_source(self, repo: str) -> Optional[SourceConfig]:
         """Get source configuration by repo name.
@@ -182,11 +192,13 @@ class SourceRegistry:
         """List enabled sources only."""
         return [s for s in self.sources.values() if s.enabled]
 
-    def needs_sync(self, source: SourceConfig) -> bool:
+    def needs_sync(self, source: SourceConfig, now: Optional[datetime] = None) -> bool:
         """Check if a source needs syncing based on last sync time.
 
         Args:
             source: Source configuration to check
+            now: Reference time (defaults to datetime.now()); pass one value
+                when checking many sources
 
         Returns:
             True if sync is needed (no last_synced or interval exceeded)
@@ -196,7 +208,7 @@ class SourceRegistry:
 
         try:
             last = datetime.fromisoformat(source.last_synced)
-            days_since = (datetime.now() - last).days
+            days_since = ((now or datetime.now()) - last).days
             return days_since >= source.sync_interval_days
         except (ValueError, TypeError):
             return True
@@ -205,7 +217,8 @@ class SourceRegistry:
         self,
         repo: str,
         entry_count: int,
-        error: Optional[str] = None
+        error: Optional[str] = None,
+        etag: Optional[str] = None
     ):
         """Update source state after sync.
 
@@ -213,6 +226,7 @@ class SourceRegistry:
             repo: Repository identifier
             entry_count: Number of entries synced
             error: Error message if sync failed
+            etag: README ETag to send with the next fetch
         """
         source = self.get_source(repo)
         if not source:
@@ -221,6 +235,8 @@ class SourceRegistry:
         source.last_synced = datetime.now().isoformat()
         source.entry_count = entry_count
         source.last_error = error
+        source.etag = etag
+        self.version += 1
 
     def add_source(self, config: SourceConfig):
         """Add a new source configuration.
@@ -231,6 +247,7 @@ class SourceRegistry:
             config: Source configuration to add
         """
         self.sources[config.repo] = config
+        self.version += 1
 
     def get_parser_hints(self, repo: str) -> Dict[str, Any]:
         """Get parser hints for a source.
@@ -2,157 +2,34 @@
 
 import json
 import csv
-import yaml
-from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Set
 
 from .config_loader import config
-from .github_client import GitHubClient
+from .github_client import get_shared_client
 from .detectors import WeightDetector, ConferenceDetector, ComingSoonDetector, RelevanceFilter
-from .models import RepoInfo, RepoState
+from .models import RepoInfo, RepoState, _today_iso
+from .ru_queue import RUCandidate, RUQueueManager
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # orjson not installed, fall back to stdlib json
 
-@dataclass
-class RUCandidate:
-    """A candidate repository for RU (Reproducible Unit) generation."""
-    url: str
-    full_name: str
-    arxiv_id: str
-    added_at: str
-    source: str  # "auto" or "manual"
-    status: str  # "pending", "processing", "completed", "skipped"
-    notes: str = ""
 
-    def to_dict(self) -> dict:
-        return {
-            "url": self.url,
-            "full_name": self.full_name,
-            "arxiv_id": self.arxiv_id,
-            "added_at": self.added_at,
-            "source": self.source,
-            "status": self.status,
-            "notes": self.notes,
-        }
-
-    @classmethod
-    def from_dict(cls, data: dict) -> "RUCandidate":
-        return cls(
-            url=data.get("url", ""),
-            full_name=data.get("full_name", ""),
-            arxiv_id=data.get("arxiv_id", ""),
-            added_at=data.get("added_at", ""),
-            source=data.get("source", "auto"),
-            status=data.get("status", "pending"),
-            notes=data.get("notes", ""),
-        )
-
-
-class RUQueueManager:
-    """Manager for RU (Reproducible Unit) candidate queue."""
-
-    def __init__(self, queue_path: str = "data/ru_queue.yaml"):
-        self.queue_path = Path(queue_path)
-        self.candidates: Dict[str, RUCandidate] = {}  # keyed by full_name
-        self._load()
+def _dump_repos_json(path: Path, data: dict, repos: List[RepoInfo], indent: Optional[int] = 2):
+    """Write data plus a "repos" list of RepoInfo as JSON.
 
-    def _load(self):
-        """Load queue from YAML file."""
-        if not self.queue_path.exists():
-            return
-
-        try:
-            with open(self.queue_path, "r") as f:
-                data = yaml.safe_load(f)
-
-            if data and data.get("candidates"):
-                for item in data["candidates"]:
-                    candidate = RUCandidate.from_dict(item)
-                    self.candidates[candidate.full_name] = candidate
-        except Exception as e:
-            print(f"Error loading RU queue: {e}")
-
-    def save(self):
-        """Save queue to YAML file."""
-        self.queue_path.parent.mkdir(parents=True, exist_ok=True)
-
-        data = {
-            "candidates": [c.to_dict() for c in self.candidates.values()]
-        }
-
-        with open(self.queue_path, "w") as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False)
-
-    def should_queue(self, repo_info: RepoInfo) -> bool:
-        """Check if a repo meets RU candidate criteria."""
-        # Must have HAS_WEIGHTS status
-        if repo_info.status != RepoState.HAS_WEIGHTS:
-            return False
-        # Must have an arXiv ID
-        if not repo_info.arxiv_id:
-            return False
-        # Not already in queue with completed/processing status
-        existing = self.candidates.get(repo_info.full_name)
-        if existing and existing.status in ("completed", "processing"):
-            return False
-        return True
-
-    def add_candidate(self, repo_info: RepoInfo, source: str = "auto") -> bool:
-        """
-        Add a repo to the RU queue if it meets criteria.
-
-        Returns True if added, False if already exists or doesn't meet criteria.
-        """
-        if source == "auto" and not self.should_queue(repo_info):
-            return False
-
-        # For manual additions, only require HAS_WEIGHTS (allow missing arXiv)
-        if source == "manual" and repo_info.status != RepoState.HAS_WEIGHTS:
-            return False
-
-        # Check if already in queue
-        existing = self.candidates.get(repo_info.full_name)
-        if existing:
-            # Don't re-add if completed or processing
-            if existing.status in ("completed", "processing"):
-                return False
-            # Already pending, no need to re-add
-            return False
-
-        candidate = RUCandidate(
-            url=repo_info.url,
-            full_name=repo_info.full_name,
-            arxiv_id=repo_info.arxiv_id or "",
-            added_at=datetime.now().isoformat(),
-            source=source,
-            status="pending",
-        )
-        self.candidates[repo_info.full_name] = candidate
-        repo_info.ru_candidate = True
-        return True
-
-    def update_status(self, full_name: str, status: str, notes: str = ""):
-        """Update the status of a candidate."""
-        if full_name in self.candidates:
-            self.candidates[full_name].status = status
-            if notes:
-                self.candidates[full_name].notes = notes
-
-    def remove_candidate(self, full_name: str) -> bool:
-        """Remove a candidate from the queue."""
-        if full_name in self.candidates:
-            del self.candidates[full_name]
-            return True
-        return False
-
-    def get_pending(self) -> List[RUCandidate]:
-        """Get all pending candidates."""
-        return [c for c in self.candidates.values() if c.status == "pending"]
-
-    def list_all(self) -> List[RUCandidate]:
-        """Get all candidates."""
-        return list(self.candidates.values())
+    orjson (2-space or no indent only) serializes the dataclasses natively,
+    in field order like to_dict(), without building intermediate dicts.
+    """
+    if orjson is not None and indent in (None, 2):
+        option = orjson.OPT_INDENT_2 if indent else 0
+        path.write_bytes(orjson.dumps({**data, "repos": repos}, option=option))
+        return
+    with open(path, "w") as f:
+        json.dump({**data, "repos": [r.to_dict() for r in repos]}, f, indent=indent)
 
 
 class PaperTracker:
@@ -164,7 +41,7 @@ class PaperTracker:
         config.load(config_path)
 
         # Initialize components
-        self.github = GitHubClient(token)
+        self.github = get_shared_client(token)
         self.weight_detector = WeightDetector()
         self.conference_detector = ConferenceDetector()
         self.coming_soon_detector = ComingSoonDetector()
@@ -197,8 +74,12 @@ class PaperTracker:
             return False
 
         try:
-            with open(path, "r") as f:
-                data = json.load(f)
+            if orjson is not None:
+                data = orjson.loads(path.read_bytes())
+            else:
+                # orjson writes non-ASCII characters as UTF-8
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
 
             # Load repos from history
             for repo_data in data.get("repos", []):
@@ -235,11 +116,8 @@ class PaperTracker:
         data = {
             "last_updated": datetime.now().isoformat(),
             "summary": self.get_summary(),
-            "repos": [r.to_dict() for r in self.repos.values()]
         }
-
-        with open(path, "w") as f:
-            json.dump(data, f, indent=2)
+        _dump_repos_json(path, data, list(self.repos.values()))
 
         print(f"Saved {len(self.repos)} repos to {json_path}")
 
@@ -361,7 +239,7 @@ class PaperTracker:
                 existing.conference_year = conf_result.year
                 existing.arxiv_id = conf_result.arxiv_id
                 existing.conference_details = conf_result.details
-                existing.last_checked = datetime.now().strftime("%Y-%m-%d")
+                existing.last_checked = _today_iso()
 
                 # Check if repo qualifies as RU candidate (now that we have updated arXiv)
                 if self.ru_queue.should_queue(existing):
@@ -563,14 +441,13 @@ class PaperTracker:
 
     def export_json(self, output_path: str):
         """Export results to JSON."""
-        data = {
-            "summary": self.get_summary(),
-            "repos": [r.to_dict() for r in self.repos.values()]
-        }
+        data = {"summary": self.get_summary()}
 
         Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w") as f:
-            json.dump(data, f, indent=config.get("output.json_indent", 2))
+        _dump_repos_json(
+            Path(output_path), data, list(self.repos.values()),
+            indent=config.get("output.json_indent", 2),
+        )
 
         print(f"Exported to {output_path}")
 
@@ -705,25 +582,11 @@ class PaperTracker:
 
     def list_ru_candidates(self, status: Optional[str] = None) -> List[RUCandidate]:
         """List RU candidates, optionally filtered by status."""
-        if status:
-            return [c for c in self.ru_queue.list_all() if c.status == status]
-        return self.ru_queue.list_all()
+        return self.ru_queue.list_by_status(status)
 
     def print_ru_queue(self, status_filter: Optional[str] = None):
         """Print RU queue status."""
-        candidates = self.list_ru_candidates(status_filter)
-
-        if not candidates:
-            print("RU queue is empty")
-            return
-
-        print(f"\nRU Queue ({len(candidates)} candidates)")
-        print("-" * 90)
-        print(f"{'Repo':<40} {'arXiv':<15} {'Status':<12} {'Source':<8} URL")
-        print("-" * 90)
-
-        for c in sorted(candidates, key=lambda x: x.added_at, reverse=True):
-            print(f"{c.full_name[:39]:<40} {c.arxiv_id[:14]:<15} {c.status:<12} {c.source:<8} {c.url}")
+        self.ru_queue.print_queue(status_filter)
 
     def load_issue_repos(self, yaml_path: str) -> List[str]:
         """
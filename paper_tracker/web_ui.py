@@ -11,6 +11,7 @@ Usage:
 
 import gradio as gr
 import pandas as pd
+from collections import Counter
 from datetime import datetime
 
 try:
@@ -167,7 +168,7 @@ CONFERENCE_OPTIONS = [
 
 def check_github_token():
     """Check GitHub token status and return formatted status."""
-    from .github_client import GitHubClient
+    from .github_client import get_shared_client
     import os
 
     token = os.environ.get("GITHUB_TOKEN")
@@ -175,7 +176,7 @@ def check_github_token():
         return "**Token Status:** Not configured. Set `GITHUB_TOKEN` env var for higher rate limits."
 
     try:
-        client = GitHubClient(token)
+        client = get_shared_client(token)
         info = client.verify_token()
 
         if info["authenticated"]:
@@ -304,7 +305,7 @@ def do_curated_search(query: str, sources: list, conference: str, year: str, has
             configured = manager.get_configured_sources()
             source_repos = [s["repo"] for s in configured if s["name"] in sources]
 
-        results = manager.search(
+        results = manager.search_raw(
             query=query,
             sources=source_repos,
             conference=conference if conference and conference != "All" else None,
@@ -380,7 +381,7 @@ def do_combined_search(
             configured = manager.get_configured_sources()
             source_repos = [s["repo"] for s in configured if s["name"] in curated_sources]
 
-        entries = manager.search(
+        entries = manager.search_raw(
             query=keywords_str,
             sources=source_repos,
             conference=conferences[0] if conferences else None,
@@ -454,9 +455,9 @@ def sync_awesome_lists():
         status_lines = []
         for repo, count in results.items():
             if count >= 0:
-                status_lines.append(f"{repo.split('/')[-1]}: {count} entries")
+                status_lines.append(f"{repo.rsplit('/', 1)[-1]}: {count} entries")
             else:
-                status_lines.append(f"{repo.split('/')[-1]}: Error")
+                status_lines.append(f"{repo.rsplit('/', 1)[-1]}: Error")
 
         return "\n".join(status_lines) if status_lines else "No lists configured"
     except Exception as e:
@@ -619,10 +620,13 @@ def get_stats(repos: list, ru_units: dict) -> tuple:
     # Filter out RU units
     candidates = [r for r in repos if not is_in_ru(r.get("name", ""), ru_units)]
 
+    # One pass over the candidates for all status counts
+    status_counts = Counter(r.get("weight_status") for r in candidates)
+
     total = len(candidates)
-    hf_count = sum(1 for r in candidates if r.get("weight_status") == "HF")
-    cloud_count = sum(1 for r in candidates if r.get("weight_status") in ("Cloud", "GDrive", "Baidu"))
-    release_count = sum(1 for r in candidates if r.get("weight_status") == "Release")
+    hf_count = status_counts["HF"]
+    cloud_count = status_counts["Cloud"] + status_counts["GDrive"] + status_counts["Baidu"]
+    release_count = status_counts["Release"]
 
     return total, hf_count, cloud_count, release_count
 
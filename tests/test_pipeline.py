@@ -249,7 +249,7 @@ def test_github_client():
     client = GitHubClient()
 
     assert client.BASE_URL == "https://api.github.com"
-    assert client._request_delay > 0, "Request delay should be positive"
+    assert client._token_states[0].core_bucket.refill_per_sec > 0, "Request refill rate should be positive"
     assert client._rate_limit_buffer > 0, "Rate limit buffer should be positive"
 
     headers = client._get_headers()
@@ -289,6 +289,554 @@ def test_fresh_release_detection():
     print("  Fresh release detection OK")
 
 
+def test_batched_queries():
+    """Test OR-batching of search keywords."""
+    print("Testing batched queries...")
+    from paper_tracker.github_search import (
+        build_batched_queries, SEARCH_QUERY_MAX_LENGTH, SEARCH_QUERY_MAX_OPERATORS,
+    )
+
+    # Multi-word keywords are quoted, filters are shared by the batch
+    queries = build_batched_queries(["image denoising", "deblurring"], ["ECCV"], "2024")
+    assert queries == [('"image denoising" OR deblurring ECCV 2024', ["image denoising", "deblurring"])]
+
+    # A lone keyword is sent unquoted, blank keywords are dropped
+    assert build_batched_queries(["image denoising", " "], [], None) == [("image denoising", ["image denoising"])]
+
+    # At most SEARCH_QUERY_MAX_OPERATORS ORs per query, keyword order kept
+    keywords = [f"kw{i}" for i in range(13)]
+    queries = build_batched_queries(keywords, [], None)
+    assert [len(batch) for _, batch in queries] == [6, 6, 1]
+    assert [k for _, batch in queries for k in batch] == keywords
+    assert all(query.count(" OR ") <= SEARCH_QUERY_MAX_OPERATORS for query, _ in queries)
+
+    # Long keywords are split to stay within the length limit
+    keywords = [f"restoration method number {i} " + "x" * 40 for i in range(10)]
+    queries = build_batched_queries(keywords, ["CVPR", "ECCV"], "2024")
+    assert len(queries) > 2, "Long keywords should need several queries"
+    assert [k for _, batch in queries for k in batch] == keywords
+    for query, _ in queries:
+        assert len(query) <= SEARCH_QUERY_MAX_LENGTH, f"Query too long: {len(query)}"
+
+    print(f"  {len(keywords)} long keywords -> {len(queries)} queries")
+    print("  Batched queries OK")
+
+
+def test_search_query_limits():
+    """Test the longest query search_fast can send stays within GitHub's limits."""
+    print("Testing search query limits...")
+    import re
+    import urllib.parse
+    from paper_tracker.github_client import GitHubClient
+    from paper_tracker.github_search import (
+        build_batched_queries, SEARCH_QUERY_MAX_LENGTH, SEARCH_QUERY_MAX_OPERATORS,
+        SEARCH_EXCLUDE_LIMIT,
+    )
+
+    # Keywords long enough that every batch is cut by the length budget
+    keywords = [f"keyword {i:02d} " + "y" * 30 for i in range(40)]
+    conferences = ["CVPR", "ECCV", "ICCV", "NeurIPS"]
+    queries = build_batched_queries(keywords, conferences, "2024")
+
+    # Longest possible exclusions: 39-char owners, 100-char repo names
+    exclude = [f"{'o' * 37}{i:02d}/{'r' * 100}" for i in range(SEARCH_EXCLUDE_LIMIT)]
+    sent = []
+    client = GitHubClient()
+    client._request = lambda url, max_retries=3: sent.append(url) or None
+
+    for query, _ in queries:
+        client.search_repos(query, min_stars=999999, per_page=100, exclude=exclude)
+    assert len(sent) == len(queries)
+
+    for query, url in zip(queries, sent):
+        q = urllib.parse.parse_qs(urllib.parse.urlsplit(url).query)["q"][0]
+        # Qualifiers don't count toward the limit, everything else does
+        qualifiers = re.findall(r" -?\w+:\S+", q)
+        text = re.sub(r" -?\w+:\S+", "", q)
+        assert text == query[0], (text, query[0])
+        assert len(text) <= SEARCH_QUERY_MAX_LENGTH, f"Query text too long: {len(text)}"
+        assert text.count(" OR ") <= SEARCH_QUERY_MAX_OPERATORS
+        assert sum(qualifier.startswith(" -repo:") for qualifier in qualifiers) == SEARCH_EXCLUDE_LIMIT
+
+    longest = max(len(query) for query, _ in queries)
+    print(f"  Longest query text: {longest}/{SEARCH_QUERY_MAX_LENGTH} characters")
+    print("  Search query limits OK")
+
+
+def test_search_results_store():
+    """Test the JSON-lines search results and their .names index."""
+    print("Testing search results store...")
+    from paper_tracker.github_search import (
+        save_search_results, load_search_results, append_to_search_results,
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "search_results.jsonl"
+        names_path = path.with_suffix(".names")
+
+        # A stale index without its results must not hide new repos
+        names_path.write_text("user/stale\n")
+        assert append_to_search_results([{"full_name": "user/stale"}], str(path)) == 1
+        assert names_path.read_text().split() == ["user/stale"]
+
+        save_search_results([{"full_name": "user/a"}, {"full_name": "user/b"}], {"q": "sr"}, str(path))
+        assert names_path.read_text().split() == ["user/a", "user/b"]
+        assert sorted(p.name for p in Path(tmp).iterdir()) == [
+            "search_results.jsonl", "search_results.meta.json", "search_results.names",
+        ], "No temp files should be left behind"
+
+        # Appends dedup against the index; a lost index is rebuilt from the results
+        assert append_to_search_results([{"full_name": "user/b"}, {"full_name": "user/c"}], str(path)) == 1
+        names_path.unlink()
+        assert append_to_search_results([{"full_name": "user/c"}], str(path)) == 0
+        repos, meta = load_search_results(str(path))
+        assert [r["full_name"] for r in repos] == ["user/a", "user/b", "user/c"]
+        assert meta["count"] == 3 and meta["query"] == {"q": "sr"}
+
+    print("  Search results store OK")
+
+
+def _fake_search_client(hits_by_keyword):
+    """GitHubClient whose search returns canned hits per keyword (no API calls).
+
+    An OR-batched query returns the union of its keywords' hits, paginated
+    like the search API (at most 100 per page).
+    """
+    from paper_tracker.github_client import GitHubClient
+
+    def search_repos(query, min_stars=10, per_page=30, page=1, sort="", exclude=None):
+        hits = {}
+        for term in query.split(" OR "):
+            for repo in hits_by_keyword.get(term.strip('"'), []):
+                hits.setdefault(repo["full_name"], repo)
+        hits = [repo for name, repo in hits.items() if name not in (exclude or [])]
+        per_page = min(per_page, 100)
+        return hits[(page - 1) * per_page:page * per_page], len(hits)
+
+    client = GitHubClient()
+    client.token = None  # READMEs over (stubbed) REST
+    client.search_repos = search_repos
+    client.get_readme = lambda owner, repo: ""
+    return client
+
+
+def _fake_repo(full_name, stars=10):
+    """Search API item with the fields the searcher reads."""
+    return {
+        "full_name": full_name,
+        "name": full_name.split("/")[1],
+        "html_url": f"https://github.com/{full_name}",
+        "stargazers_count": stars,
+        "description": "",
+        "created_at": "2024-01-01T00:00:00Z",
+        "updated_at": "2024-06-01T00:00:00Z",
+    }
+
+
+def test_batched_search_results():
+    """Test batched searches return what per-keyword searches returned."""
+    print("Testing batched search results...")
+    from paper_tracker.github_search import GitHubSearcher, build_batched_queries
+
+    per_keyword = 30
+    keywords = [f"kw{i}" for i in range(6)]
+    hits_by_keyword = {
+        keyword: [_fake_repo(f"{keyword}/repo{j}", stars=j) for j in range(per_keyword)]
+        for keyword in keywords
+    }
+    assert len(build_batched_queries(keywords, [], None)) == 1, "Should be a single batch"
+
+    searcher = GitHubSearcher()
+    searcher.github = _fake_search_client(hits_by_keyword)
+
+    # What the old one-search-per-keyword loop returned
+    expected = set()
+    for keyword in keywords:
+        repos, _ = searcher.github.search_repos(keyword, per_page=per_keyword)
+        expected.update(repo["full_name"] for repo in repos)
+    assert len(expected) == per_keyword * len(keywords)
+
+    results = searcher.search(keywords, weight_filter="all", max_results_per_keyword=per_keyword)
+    assert len(results) == len(expected), f"Got {len(results)} of {len(expected)} results"
+    assert {r["full_name"] for r in results} == expected
+
+    streamed = [repo for repo, *_ in searcher.search_iter(
+        keywords, weight_filter="all", max_results_per_keyword=per_keyword) if repo]
+    assert {r["full_name"] for r in streamed} == expected
+
+    fast = searcher.search_fast(keywords, max_results_per_keyword=per_keyword)
+    assert {r["full_name"] for r in fast} == expected
+
+    print(f"  {len(results)} results for {len(keywords)} keywords in one query")
+    print("  Batched search results OK")
+
+
+class _FakeResponse:
+    """Minimal 2xx http.client response for stubbing GitHubClient._open."""
+
+    def __init__(self, body, headers=None):
+        self.status = 200
+        self.headers = headers or {}
+        self._body = json.dumps(body).encode()
+
+    def read(self, size=-1):
+        chunk, self._body = (self._body, b"") if size < 0 else (self._body[:size], self._body[size:])
+        return chunk
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+def test_http_cache_etag():
+    """Test ETag revalidation through the HTTP cache (no actual API calls)."""
+    print("Testing HTTP cache ETags...")
+    import base64
+    import os
+    import urllib.error
+    from paper_tracker.github_client import GitHubClient, UNCHANGED
+    from paper_tracker.http_cache import HTTPCache
+
+    readme = {"content": base64.b64encode(b"# Model\nWeights on huggingface.co").decode()}
+    details = {"full_name": "user/model", "stargazers_count": 42}
+    sent_etags = []
+
+    def fake_open(url, data, headers):
+        sent_etags.append(headers.get("If-None-Match"))
+        if headers.get("If-None-Match") == '"v1"':
+            raise urllib.error.HTTPError(url, 304, "Not Modified", {}, None)
+        body = readme if url.endswith("/readme") else details
+        return _FakeResponse(body, {"ETag": '"v1"'})
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # The cache lives in the project's data/, not the working directory
+        cwd = os.getcwd()
+        os.chdir(tmp)
+        try:
+            GitHubClient()
+        finally:
+            os.chdir(cwd)
+        assert not (Path(tmp) / "data").exists(), "HTTP cache should not follow the working directory"
+
+        cache = HTTPCache(str(Path(tmp) / "http_cache.sqlite"))
+        clients = []
+        for _ in range(2):
+            client = GitHubClient()
+            client.http_cache = cache
+            client._open = fake_open
+            clients.append(client)
+
+        # README: 200 hands out the ETag, 304 comes back as UNCHANGED
+        content, etag = clients[0].get_readme_with_etag("user", "model")
+        assert content.startswith("# Model") and etag == '"v1"'
+        content, etag = clients[0].get_readme_with_etag("user", "model", etag=etag)
+        assert content is UNCHANGED and etag == '"v1"'
+
+        # Repo details: the body stored on 200 is reused on 304
+        assert clients[0].get_repo_details("user", "model") == details
+        sent_etags.clear()
+        assert clients[1].get_repo_details("user", "model") == details
+        assert sent_etags == ['"v1"'], "Second client should revalidate with the stored ETag"
+
+    print("  HTTP cache ETags OK")
+
+
+def test_http_cache_pruning():
+    """Test the HTTP cache drops old and excess responses."""
+    print("Testing HTTP cache pruning...")
+    import sqlite3
+    from paper_tracker.http_cache import HTTPCache
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "http_cache.sqlite")
+
+        # Only the most recently stored max_rows responses are kept
+        cache = HTTPCache(path, max_rows=3)
+        cache.PRUNE_INTERVAL = 1
+        for i in range(5):
+            cache.put(f"https://api.github.com/repos/user/r{i}", f'"e{i}"', {"i": i})
+        assert cache.get("https://api.github.com/repos/user/r0") is None
+        assert cache.get("https://api.github.com/repos/user/r4") == ('"e4"', {"i": 4})
+        assert cache._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0] == 3
+
+        # Expired responses are dropped when the cache is opened
+        with cache._conn:
+            cache._conn.execute(
+                "UPDATE responses SET stored_at = 0 WHERE url LIKE '%/r4'"
+            )
+        cache = HTTPCache(path, max_rows=3)
+        assert cache.get("https://api.github.com/repos/user/r4") is None
+        assert cache.get("https://api.github.com/repos/user/r3") == ('"e3"', {"i": 3})
+
+        # Caches from before pruning gain the timestamp column
+        legacy_path = str(Path(tmp) / "legacy.sqlite")
+        conn = sqlite3.connect(legacy_path)
+        with conn:
+            conn.execute("CREATE TABLE responses (url TEXT PRIMARY KEY, etag TEXT NOT NULL, body TEXT NOT NULL)")
+            conn.execute("INSERT INTO responses VALUES ('u', '\"e\"', '{}')")
+        conn.close()
+        assert HTTPCache(legacy_path).get("u") == ('"e"', {})
+
+    print("  HTTP cache pruning OK")
+
+
+def test_redirects():
+    """Test renamed repos (301 from the API) are followed (no actual API calls)."""
+    print("Testing redirects...")
+    from paper_tracker.github_client import GitHubClient
+
+    details = {"full_name": "new-owner/model", "stargazers_count": 42}
+    requests = []
+
+    class FakeConnection:
+        """Keep-alive connection answering a 301 for the old repo name."""
+
+        def request(self, method, path, body=None, headers=None):
+            requests.append((method, path, headers.get("Authorization")))
+            self.path = path
+
+        def getresponse(self):
+            if self.path == "/repos/old-owner/model":
+                response = _FakeResponse({"message": "Moved Permanently"},
+                                         {"Location": "https://api.github.com/repositories/123"})
+                response.status, response.reason = 301, "Moved Permanently"
+                return response
+            return _FakeResponse(details)
+
+    client = GitHubClient(tokens=["tok_a"])
+    client.http_cache = None
+    client._proxied = False
+    client._local.connections = {"api.github.com": FakeConnection()}
+
+    assert client.get_repo_details("old-owner", "model") == details
+    assert requests == [
+        ("GET", "/repos/old-owner/model", "token tok_a"),
+        ("GET", "/repositories/123", "token tok_a"),
+    ], requests
+
+    print("  Redirects OK")
+
+
+def test_token_rotation():
+    """Test multi-token rotation and parking on 403 (no actual API calls)."""
+    print("Testing token rotation...")
+    import time
+    import urllib.error
+    from paper_tracker.config_loader import config
+    from paper_tracker.github_client import GitHubClient
+
+    reset = str(int(time.time()) + 3600)
+    used = []
+    remaining = {"tok_a": "50", "tok_b": "4000"}
+    limited = set()
+
+    def fake_open(url, data, headers):
+        token = headers["Authorization"].split()[1]
+        used.append(token)
+        if token in limited:
+            raise urllib.error.HTTPError(url, 403, "Forbidden", {"X-RateLimit-Reset": reset}, None)
+        if url.endswith("/rate_limit"):
+            core = {"limit": 5000, "remaining": int(remaining[token]), "reset": int(reset)}
+            return _FakeResponse({"resources": {"core": core}})
+        return _FakeResponse({"ok": True}, {
+            "X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": remaining[token],
+            "X-RateLimit-Reset": reset, "X-RateLimit-Resource": "core",
+        })
+
+    client = GitHubClient(tokens=["tok_a", "tok_b"])
+    client._open = fake_open
+    url = f"{client.BASE_URL}/repos/user/model"
+
+    # Untouched tokens tie, the primary goes first; then the one with more left
+    assert client._request(url) == {"ok": True}
+    assert client._request(url) == {"ok": True}
+    assert used == ["tok_a", "tok_b"], used
+    assert client.rate_limit.remaining == 4000
+
+    # A rate-limited token is parked until reset, the request moves on
+    limited.add("tok_b")
+    used.clear()
+    assert client._request(url) == {"ok": True}
+    assert used == ["tok_b", "tok_a"], used
+    assert client._token_states[1].rate_limit.remaining == 0
+    used.clear()
+    client._request(url)
+    assert used == ["tok_a"], "Parked token should not be picked again"
+
+    # verify_token() reports the primary token, verify_tokens() all of them
+    limited.clear()
+    assert client.verify_token()["remaining"] == 50
+    assert [info["remaining"] for info in client.verify_tokens()] == [50, 4000]
+
+    # GITHUB_TOKEN (github.token) is the primary of the configured tokens
+    github = config._config.get("github")
+    try:
+        config._config["github"] = {"token": "tok_main", "tokens": ["tok_a", "tok_b"]}
+        config._get_cache = {}
+        assert GitHubClient().token == "tok_main"
+    finally:
+        if github is None:
+            config._config.pop("github", None)
+        else:
+            config._config["github"] = github
+        config._get_cache = {}
+
+    print("  Token rotation OK")
+
+
+_AWESOME_README = (
+    "## Image SR\n\n"
+    "| Title | Model | Published | Code | Keywords |\n"
+    "|---|---|---|---|---|\n"
+    "| [ESRGAN](https://arxiv.org/abs/1809.00219) | ESRGAN | ECCV 2018 "
+    "| [code](https://github.com/xinntao/ESRGAN) | GAN |\n"
+)
+
+
+def test_awesome_sync_readmes():
+    """Test awesome list sync with GraphQL-batched READMEs and REST fallback."""
+    print("Testing awesome list README sync...")
+    from paper_tracker.awesome_manager import AwesomeListManager
+    from paper_tracker.github_client import GitHubClient
+    from paper_tracker.source_registry import SourceRegistry
+
+    # graphql_readmes tries other README names and skips repos without one
+    client = GitHubClient(tokens=["tok_a"])
+    queries = []
+
+    def fake_graphql(query, variables=None):
+        queries.append(query)
+        return {"data": {
+            "r0": {"f0": None, "f1": {"text": "lowercase readme"}},
+            "r1": {"f0": None, "f1": None},
+            "r2": None,
+        }}
+
+    client.graphql = fake_graphql
+    readmes = client.graphql_readmes(["user/lower", "user/txt", "user/missing"])
+    assert readmes == {"user/lower": "lowercase readme"}, readmes
+    assert all(f'"HEAD:{name}"' in queries[0] for name in client.GRAPHQL_README_NAMES)
+
+    class FakeGitHub:
+        """Batch returns one list's README, REST serves the other."""
+        rate_limit = client.rate_limit
+
+        def __init__(self):
+            self.rest_calls = []
+
+        def graphql_readmes(self, repos):
+            return {"user/awesome-batched": _AWESOME_README}
+
+        def get_readme_with_etag(self, owner, repo, etag=None):
+            self.rest_calls.append((f"{owner}/{repo}", etag))
+            return _AWESOME_README, '"rest-v2"'
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        config_path = tmp / "config.yaml"
+        config_path.write_text(
+            "awesome_lists:\n"
+            "  - repo: user/awesome-batched\n"
+            "  - repo: user/awesome-fallback\n"
+        )
+        manager = AwesomeListManager(cache_path=tmp / "cache.json.gz")
+        manager.registry = SourceRegistry(config_path, tmp / "state.json")
+        for source in manager.registry.list_all():
+            source.etag = '"v1"'
+        manager.github = FakeGitHub()
+
+        results = manager.sync_all(force=True)
+        assert results == {"user/awesome-batched": 1, "user/awesome-fallback": 1}, results
+
+        # Only the repo missing from the batch goes over REST
+        assert manager.github.rest_calls == [("user/awesome-fallback", None)]
+
+        # Batched content keeps the stored ETag, REST content stores its own
+        assert manager.registry.get_source("user/awesome-batched").etag == '"v1"'
+        assert manager.registry.get_source("user/awesome-fallback").etag == '"rest-v2"'
+
+    print("  Awesome list README sync OK")
+
+
+def test_awesome_cache_migration():
+    """Test migrating the uncompressed awesome cache to .json.gz."""
+    print("Testing awesome cache migration...")
+    import gzip
+    from paper_tracker.cache_manager import IndexedCache
+
+    entry = {"id": "sr:esrgan", "title": "ESRGAN", "year": "2018", "source_list": "user/awesome-sr"}
+    with tempfile.TemporaryDirectory() as tmp:
+        gz_path = Path(tmp) / "awesome_cache.json.gz"
+        legacy_path = Path(tmp) / "awesome_cache.json"
+        legacy_path.write_text(json.dumps({"version": "2.0", "entries": {"sr:esrgan": entry}}))
+
+        # The legacy file is read, written compressed on save, then removed
+        cache = IndexedCache(gz_path)
+        assert cache.get_entry("sr:esrgan")["title"] == "ESRGAN"
+        cache.save()
+        assert gz_path.exists(), "Should write the compressed cache"
+        assert not legacy_path.exists(), "Should remove the migrated legacy cache"
+        assert IndexedCache(gz_path).get_entry("sr:esrgan")["title"] == "ESRGAN"
+
+        # A corrupt .gz only warns
+        payload = gz_path.read_bytes()
+        gz_path.write_bytes(payload[:10] + b"\xff" * 8 + payload[18:])
+        assert IndexedCache(gz_path).entries == {}
+        gz_path.write_bytes(payload[:len(payload) // 2])
+        assert IndexedCache(gz_path).entries == {}
+        gz_path.write_bytes(gzip.compress(b"{not json"))
+        assert IndexedCache(gz_path).entries == {}
+
+    print("  Awesome cache migration OK")
+
+
+def test_awesome_stats_command():
+    """Test the --awesome-stats CLI command against a temporary cache."""
+    print("Testing --awesome-stats command...")
+    import contextlib
+    import io
+    import yaml
+    from paper_tracker.__main__ import main, _default_config_path
+    from paper_tracker.cache_manager import IndexedCache
+    from paper_tracker.config_loader import config
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_path = Path(tmp) / "awesome_cache.json.gz"
+        cache = IndexedCache(cache_path)
+        cache.add_entries(
+            [{"id": "sr:esrgan", "title": "ESRGAN", "year": "2018", "conference": "ECCV",
+              "github_url": "https://github.com/xinntao/ESRGAN"}],
+            source="user/awesome-sr",
+        )
+        cache.save()
+
+        with open(_default_config_path()) as f:
+            settings = yaml.safe_load(f)
+        settings["awesome_settings"]["cache_path"] = str(cache_path)
+        config_path = Path(tmp) / "config.yaml"
+        config_path.write_text(yaml.safe_dump(settings))
+
+        argv = sys.argv
+        out = io.StringIO()
+        try:
+            sys.argv = ["paper_tracker", "--awesome-stats", "--config", str(config_path)]
+            with contextlib.redirect_stdout(out):
+                assert main() == 0
+        finally:
+            sys.argv = argv
+            config.load()
+
+    output = out.getvalue()
+    assert "Total entries: 1" in output, output
+    assert "Entries with code: 1" in output, output
+    assert "Sources: user/awesome-sr" in output, output
+    assert "By conference: {'ECCV': 1}" in output, output
+
+    print("  --awesome-stats command OK")
+
+
 def run_all_tests():
     """Run all tests."""
     print("=" * 50)
@@ -306,6 +854,17 @@ def run_all_tests():
         test_tracker_init,
         test_github_client,
         test_fresh_release_detection,
+        test_batched_queries,
+        test_batched_search_results,
+        test_search_query_limits,
+        test_search_results_store,
+        test_http_cache_etag,
+        test_http_cache_pruning,
+        test_redirects,
+        test_token_rotation,
+        test_awesome_sync_readmes,
+        test_awesome_cache_migration,
+        test_awesome_stats_command,
     ]
 
     passed = 0